@@ -1,12 +1,19 @@
 """Python Markdown Builder."""
 
 from .builder import MarkdownBuilder
-from .partial_tokens import create_partial_token
+from .html_tokens import HtmlTokens
+from .partial_tokens import compose_partial_tokens, create_partial_token
+from .references import LinkReferences
+from .table_builder import TableBuilder
 from .tokens import Tokens
 
 
 __all__ = (
     "MarkdownBuilder",
+    "HtmlTokens",
+    "compose_partial_tokens",
     "create_partial_token",
+    "LinkReferences",
+    "TableBuilder",
     "Tokens",
 )
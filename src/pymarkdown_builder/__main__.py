@@ -0,0 +1,9 @@
+"""Runs the command line interface with `python -m pymarkdown_builder`."""
+
+import sys
+
+from pymarkdown_builder.cli import main
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,250 @@
+"""Writing many Markdown documents straight into a single tar or zip archive.
+
+Each document is streamed to an [`ArchiveEntrySink`][pymarkdown_builder.archive.ArchiveEntrySink],
+which buffers it in memory up to a limit, and in a temporary file past it. When the
+sink is closed, the document is copied into the archive as a single entry, so
+documents can be rendered in parallel while the archive is written sequentially.
+"""  # noqa: E501
+
+import os
+import shutil
+import tarfile
+import tempfile
+import threading
+import time
+import zipfile
+from types import TracebackType
+from typing import IO, Optional, Tuple, Type, Union
+
+from typing_extensions import Self
+
+
+_TAR_COMPRESSIONS = {None: "", "gz": "gz", "bz2": "bz2", "xz": "xz"}
+_ZIP_COMPRESSIONS = {
+    None: zipfile.ZIP_STORED,
+    "gz": zipfile.ZIP_DEFLATED,
+    "bz2": zipfile.ZIP_BZIP2,
+    "xz": zipfile.ZIP_LZMA,
+}
+_EXTENSIONS = (
+    (".zip", "zip", "gz"),
+    (".tar", "tar", None),
+    (".tar.gz", "tar", "gz"),
+    (".tgz", "tar", "gz"),
+    (".tar.bz2", "tar", "bz2"),
+    (".tar.xz", "tar", "xz"),
+)
+
+
+def _detect_format(path: str) -> Tuple[str, Optional[str]]:
+    """Returns the format and compression of an archive from its file extension."""
+    for extension, archive_format, compression in _EXTENSIONS:
+        if path.endswith(extension):
+            return archive_format, compression
+
+    raise ValueError(f"Cannot detect the archive format of {path!r}.")
+
+
+class ArchiveEntrySink:
+    """A sink for a single document of an [`ArchiveWriter`][pymarkdown_builder.archive.ArchiveWriter].
+
+    The document is added to the archive when the sink is closed, or dropped if it is
+        discarded. Used as a context manager, it is discarded if an exception is raised.
+    """  # noqa: E501
+
+    name: str
+    """Name of the entry in the archive."""
+
+    def __init__(self, archive: "ArchiveWriter", name: str) -> None:
+        """Initializes the sink. Use [`ArchiveWriter.open`][pymarkdown_builder.archive.ArchiveWriter.open] instead."""  # noqa: E501
+        self.name = name
+
+        self._archive = archive
+        self._buffer: Optional[IO[bytes]] = tempfile.SpooledTemporaryFile(
+            max_size=archive.spool_size
+        )
+        self._size = 0
+
+    def write(self, text: str) -> int:
+        """Buffers the text, to be added to the archive when the sink is closed."""
+        if self._buffer is None:
+            raise ValueError("Cannot write to a closed entry.")
+
+        data = text.encode(self._archive.encoding)
+        self._buffer.write(data)
+        self._size += len(data)
+
+        return len(text)
+
+    def close(self) -> None:
+        """Adds the buffered document to the archive."""
+        if self._buffer is None:
+            return
+
+        buffer, self._buffer = self._buffer, None
+
+        try:
+            buffer.seek(0)
+            self._archive._add(self.name, buffer, self._size)
+        finally:
+            buffer.close()
+
+    def discard(self) -> None:
+        """Drops the buffered document, without adding it to the archive."""
+        if self._buffer is not None:
+            self._buffer.close()
+            self._buffer = None
+
+    def __enter__(self) -> Self:
+        """Returns the sink."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Closes the sink, or discards the document if an exception was raised."""
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+
+class ArchiveWriter:
+    """Writes Markdown documents as the entries of a tar or zip archive.
+
+    The archive is written sequentially, so it can also be streamed to a pipe or a
+        socket. Safe to be shared by multiple threads: documents are buffered by each
+        thread, and only copying them into the archive is serialized.
+
+    Examples:
+        >>> import os, tempfile, zipfile
+        >>> from pymarkdown_builder import MarkdownBuilder
+        >>> path = os.path.join(tempfile.mkdtemp(), "docs.zip")
+        >>> with ArchiveWriter(path) as archive:
+        ...     for name in ("a", "b"):
+        ...         with archive.open(f"{name}.md") as sink:
+        ...             _ = MarkdownBuilder(sink=sink).lines(f"# {name}").finalize()
+        >>> zipfile.ZipFile(path).read("b.md")
+        b'# b'
+    """
+
+    archive_format: str
+    """Format of the archive, either `#!python "tar"` or `#!python "zip"`."""
+    compression: Optional[str]
+    """Compression of the archive: `#!python "gz"`, `#!python "bz2"`, `#!python "xz"` or `#!python None`."""  # noqa: E501
+    encoding: str
+    """Encoding of the documents."""
+    spool_size: int
+    """Size in bytes up to which each document is buffered in memory, before spilling to a temporary file."""  # noqa: E501
+    entries: int
+    """Number of documents added to the archive."""
+
+    def __init__(
+        self,
+        file: Union[str, "os.PathLike[str]", IO[bytes]],
+        archive_format: Optional[str] = None,
+        compression: Optional[str] = None,
+        encoding: str = "utf-8",
+        spool_size: int = 1024 * 1024,
+    ) -> None:
+        """Initializes the writer, creating the archive.
+
+        Args:
+            file (Union[str, PathLike[str], IO[bytes]]): Path of the archive, or a binary file object to write it to.
+            archive_format (Optional[str]): `#!python "tar"` or `#!python "zip"`. If not provided, will be detected from the extension of the path, along with the compression.
+            compression (Optional[str]): `#!python "gz"` (deflate, for zip), `#!python "bz2"`, `#!python "xz"` or `#!python None` for no compression.
+            encoding (str): Encoding of the documents. Defaults to `#!python "utf-8"`.
+            spool_size (int): Size in bytes up to which each document is buffered in memory. Defaults to 1 MiB.
+        """  # noqa: E501
+        if archive_format is None:
+            if not isinstance(file, (str, os.PathLike)):
+                raise ValueError("The archive format is required for file objects.")
+
+            archive_format, compression = _detect_format(os.fspath(file))
+
+        if archive_format not in ("tar", "zip"):
+            raise ValueError(f"Unsupported archive format {archive_format!r}.")
+
+        if compression not in _TAR_COMPRESSIONS:
+            raise ValueError(f"Unsupported compression {compression!r}.")
+
+        self.archive_format = archive_format
+        self.compression = compression
+        self.encoding = encoding
+        self.spool_size = spool_size
+        self.entries = 0
+
+        self._lock = threading.Lock()
+        self._tar: Optional[tarfile.TarFile] = None
+        self._zip: Optional[zipfile.ZipFile] = None
+
+        if archive_format == "tar":
+            mode = f"w|{_TAR_COMPRESSIONS[compression]}"
+
+            if isinstance(file, (str, os.PathLike)):
+                self._tar = tarfile.open(os.fspath(file), mode)
+            else:
+                self._tar = tarfile.open(fileobj=file, mode=mode)
+        else:
+            self._zip = zipfile.ZipFile(
+                file, "w", compression=_ZIP_COMPRESSIONS[compression]
+            )
+
+    def open(self, name: str) -> ArchiveEntrySink:
+        """Opens a sink for a new document.
+
+        Args:
+            name (str): Name of the entry in the archive, such as `#!python "docs/index.md"`.
+        """  # noqa: E501
+        return ArchiveEntrySink(self, name)
+
+    def write(self, name: str, content: str) -> None:
+        """Adds a document to the archive.
+
+        Args:
+            name (str): Name of the entry in the archive, such as `#!python "docs/index.md"`.
+            content (str): The content of the document.
+        """  # noqa: E501
+        with self.open(name) as sink:
+            sink.write(content)
+
+    def close(self) -> None:
+        """Finishes the archive. Documents still open are not added to it."""
+        with self._lock:
+            if self._tar is not None:
+                self._tar.close()
+
+            if self._zip is not None:
+                self._zip.close()
+
+    def _add(self, name: str, buffer: IO[bytes], size: int) -> None:
+        """Copies a buffered document into the archive."""
+        with self._lock:
+            if self._tar is not None:
+                info = tarfile.TarInfo(name)
+                info.size = size
+                info.mtime = int(time.time())
+                info.mode = 0o644
+                self._tar.addfile(info, buffer)
+
+            if self._zip is not None:
+                with self._zip.open(name, "w", force_zip64=size > 0x7FFFFFFF) as entry:
+                    shutil.copyfileobj(buffer, entry, 1024 * 1024)
+
+            self.entries += 1
+
+    def __enter__(self) -> Self:
+        """Returns the writer."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Finishes the archive."""
+        self.close()
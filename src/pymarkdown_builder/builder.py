@@ -1,21 +1,172 @@
 """A Markdown document builder with line and span writing modes."""
 
+import os
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from typing import Iterable, Iterator, List, Optional, Tuple, Type, Union
 
 from typing_extensions import ParamSpec, Self, TypeVar
 
+from pymarkdown_builder.html_tokens import HtmlTokens
+from pymarkdown_builder.references import LinkReferences
+from pymarkdown_builder.sinks import Sink
+from pymarkdown_builder.toc import HeadingIndex
+from pymarkdown_builder.tokens import HeadingContent, Tokens
+from pymarkdown_builder.wrap import iter_wrap
+
 
 TMarkdownBuilder = TypeVar("TMarkdownBuilder", bound="MarkdownBuilder")
 Params = ParamSpec("Params")
 TReturn = TypeVar("TReturn")
 
 
+_TAIL_SIZE = 4096
+"""Number of bytes read from the end of a file, to append to it."""
+
+
+def _tail_style(path: Union[str, "os.PathLike[str]"]) -> Tuple[str, str]:
+    r"""Returns the separator needed before a new line, and the newline of a file.
+
+        Only the last few KiB of the file are read. The newline is `"
+    "` if the last
+            line break of the file is one, or `""` to write line breaks as they are.
+    """
+    try:
+        size = os.path.getsize(path)
+    except FileNotFoundError:
+        return "", ""
+
+    if size == 0:
+        return "", ""
+
+    with open(path, "rb") as file:
+        file.seek(max(0, size - _TAIL_SIZE))
+        tail = file.read()
+
+    last_line_break = tail.rfind(b"\n")
+    is_crlf = last_line_break > 0 and tail[last_line_break - 1] == ord("\r")
+    newline = "\r\n" if is_crlf else ""
+    tail = tail.replace(b"\r\n", b"\n")
+
+    if tail.endswith(b"\n\n"):
+        return "", newline
+
+    if tail.endswith(b"\n"):
+        return "\n", newline
+
+    return "\n\n", newline
+
+
 @dataclass
 class MarkdownBuilder:
     """A Markdown document builder with line and span writing modes."""
 
     document: str = field(default="")
-    """Content of the builder."""
+    """Content of the builder. When streaming to a `sink`, content is written to the
+    sink instead, and this stays empty. In a [`fork`][pymarkdown_builder.builder.MarkdownBuilder.fork],
+    only holds the content written after forking, until it is materialized."""  # noqa: E501
+    sink: Optional[Sink] = field(default=None, repr=False, compare=False)
+    """Where the content is streamed to. If not provided, content is accumulated in
+    `document`."""
+    references: LinkReferences = field(
+        default_factory=LinkReferences,
+        repr=False,
+        compare=False,
+    )
+    """Index of reference-style links. Use its `link` and `image` methods to write
+    `[text][n]` links, and [`write_references`][pymarkdown_builder.builder.MarkdownBuilder.write_references]
+    to emit the definitions."""  # noqa: E501
+    headings: HeadingIndex = field(
+        default_factory=HeadingIndex,
+        repr=False,
+        compare=False,
+    )
+    """Index of the headings written with [`Tokens.heading`][pymarkdown_builder.tokens.Tokens.heading]
+    and its shortcuts."""  # noqa: E501
+    tokens: Union[Type[Tokens], Type[HtmlTokens]] = field(
+        default=Tokens,
+        repr=False,
+        compare=False,
+    )
+    """Tokens of the output format: [`Tokens`][pymarkdown_builder.tokens.Tokens] for
+    Markdown, or [`HtmlTokens`][pymarkdown_builder.html_tokens.HtmlTokens] for HTML.
+    Used to render the table of contents, and HTML documents reject reference-style
+    links."""  # noqa: E501
+
+    _prefix: Tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+    _emitted: bool = field(default=False, init=False, repr=False, compare=False)
+    _initial_separator: str = field(default="", init=False, repr=False, compare=False)
+    _toc_offset: Optional[int] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _toc_max_level: int = field(default=6, init=False, repr=False, compare=False)
+    _toc_separator: str = field(default="", init=False, repr=False, compare=False)
+    _held: Optional[List[str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Streams the initial document, if a sink was provided."""
+        if self.sink is not None and self.document != "":
+            self.sink.write(self.document)
+            self.document = ""
+            self._emitted = True
+
+    @classmethod
+    @contextmanager
+    def append_to(
+        cls,
+        path: Union[str, "os.PathLike[str]"],
+        encoding: str = "utf-8",
+    ) -> Iterator[Self]:
+        r"""Opens a file in append mode, and yields a builder that streams to it.
+
+        Only the last bytes of the file are read, to choose the separator written
+            before the first line, so the file is never loaded into memory. If the
+            file uses `\r\n` line breaks, every line break written is translated to
+            `\r\n` too. The builder is finalized when the context exits.
+
+        Args:
+            path (Union[str, PathLike[str]]): Path of the file. Created if it does not exist.
+            encoding (str): Encoding of the file. Defaults to `#!python "utf-8"`.
+
+        Examples:
+            >>> import os, tempfile
+            >>> path = os.path.join(tempfile.mkdtemp(), "log.md")
+            >>> with MarkdownBuilder.append_to(path) as builder:
+            ...     _ = builder.lines("# Log", "first entry")
+            >>> with MarkdownBuilder.append_to(path) as builder:
+            ...     _ = builder.lines("second entry")
+            >>> open(path).read()
+            '# Log\n\nfirst entry\n\nsecond entry'
+        """  # noqa: E501
+        separator, newline = _tail_style(path)
+
+        with open(path, "a", encoding=encoding, newline=newline) as file:
+            builder = cls(sink=file)
+            builder._initial_separator = separator
+
+            yield builder
+
+            builder.finalize()
+
+    def _is_empty(self) -> bool:
+        """Whether nothing was written to the builder yet."""
+        return self.document == "" and not self._emitted and len(self._prefix) == 0
+
+    def _separator(self) -> str:
+        """Returns what has to be written before a new line."""
+        return self._initial_separator if self._is_empty() else "\n\n"
+
+    def _write(self, text: str) -> None:
+        """Appends the text to the document, or writes it to the sink."""
+        if self.sink is None:
+            self.document += text
+        elif self._held is not None:
+            self._held.append(text)
+        elif text != "":
+            self.sink.write(text)
+            self._emitted = True
 
     def write_lines(self, *lines: str) -> Self:
         """Joins the lines with double line breaks and appends to the document.
@@ -26,12 +177,9 @@ class MarkdownBuilder:
         Returns:
             The builder instance.
         """
-        joined_lines = "\n\n".join(lines)
+        joined_lines = "\n\n".join(self._indexed(lines))
 
-        if self.document != "":
-            self.document += "\n\n"
-
-        self.document += joined_lines
+        self._write(self._separator() + joined_lines)
 
         return self
 
@@ -46,7 +194,144 @@ class MarkdownBuilder:
         """
         joined_spans = "".join(spans)
 
-        self.document += joined_spans
+        self._write(joined_spans)
+
+        return self
+
+    def write_lines_from(self, lines: Iterable[str]) -> Self:
+        """Appends each line of an iterable, consuming it lazily.
+
+        Gives the same result as [`write_lines`][pymarkdown_builder.builder.MarkdownBuilder.write_lines],
+            but when streaming, each line is written to the sink as soon as it is
+            produced, so the iterable is never held in memory as a whole.
+
+        Args:
+            lines (Iterable[str]): Iterable of lines to be appended, such as a generator.
+
+        Returns:
+            The builder instance.
+        """  # noqa: E501
+        lines = self._indexed(lines)
+
+        if self.sink is None:
+            self._write(self._separator() + "\n\n".join(lines))
+            return self
+
+        separator = self._separator()
+        written = False
+
+        for line in lines:
+            self._write(separator + line)
+            separator = "\n\n"
+            written = True
+
+        if not written:
+            self._write(separator)
+
+        return self
+
+    def write_spans_from(self, spans: Iterable[str]) -> Self:
+        """Appends each span of an iterable, consuming it lazily.
+
+        Gives the same result as [`write_spans`][pymarkdown_builder.builder.MarkdownBuilder.write_spans],
+            but when streaming, each span is written to the sink as soon as it is
+            produced.
+
+        Args:
+            spans (Iterable[str]): Iterable of spans to be appended, such as a generator.
+
+        Returns:
+            The builder instance.
+        """  # noqa: E501
+        if self.sink is None:
+            self._write("".join(spans))
+            return self
+
+        written = False
+
+        for span in spans:
+            self._write(span)
+            written = True
+
+        if not written:
+            self._write("")
+
+        return self
+
+    def write_block_from(self, chunks: Iterable[str]) -> Self:
+        r"""Appends a single line made of chunks, such as the ones of [`Tokens.iter_table`][pymarkdown_builder.tokens.Tokens.iter_table].
+
+        Same as `#!python write_lines("".join(chunks))`, but when streaming, each chunk
+            is written to the sink as soon as it is produced, so the line is never
+            held in memory as a whole.
+
+        Args:
+            chunks (Iterable[str]): Iterable of chunks of the line, such as a generator.
+
+        Returns:
+            The builder instance.
+
+        Examples:
+            >>> from pymarkdown_builder import Tokens
+            >>> rows = ([str(i), str(i * i)] for i in range(1, 3))
+            >>> MarkdownBuilder().lines("Squares:").block_from(
+            ...     Tokens.iter_table((["n", "square"], *rows))
+            ... ).document
+            'Squares:\n\nn | square\n--- | ---\n1 | 1\n2 | 4'
+        """  # noqa: E501
+        if self.sink is None:
+            self._write(self._separator() + "".join(chunks))
+            return self
+
+        self._write(self._separator())
+
+        for chunk in chunks:
+            self._write(chunk)
+
+        return self
+
+    def _indexed(self, lines: Iterable[str]) -> Iterator[str]:
+        """Yields the lines, indexing the headings among them with their anchors."""
+        for line in lines:
+            if isinstance(line, HeadingContent):
+                line = line.with_anchor(self.headings.add(line.text, line.level))
+
+            yield line
+
+    def write_wrapped(
+        self,
+        text: str,
+        width: int,
+        initial_indent: str = "",
+        subsequent_indent: Optional[str] = None,
+    ) -> Self:
+        """Hard-wraps the text and appends it to the document as a line.
+
+        When streaming, each wrapped line is written to the sink as soon as it is
+            produced, so the wrapped text is never held in memory as a whole.
+
+        Args:
+            text (str): The text to be wrapped.
+            width (int): Maximum length of the lines, including indentation.
+            initial_indent (str): String prepended to the first line, such as `"> "` for quotes, or `"- "` for list items.
+            subsequent_indent (Optional[str]): String prepended to every other line. If not provided, will use `initial_indent`.
+
+        Returns:
+            The builder instance.
+        """  # noqa: E501
+        if subsequent_indent is None:
+            subsequent_indent = initial_indent
+
+        lines = iter_wrap(text, width, initial_indent, subsequent_indent)
+
+        if self.sink is None:
+            self._write(self._separator() + "\n".join(lines))
+            return self
+
+        self._write(self._separator())
+
+        for index, line in enumerate(lines):
+            self._write(line if index == 0 else "\n" + line)
 
         return self
 
@@ -56,14 +341,236 @@ class MarkdownBuilder:
         Returns:
             The builder instance.
         """
-        self.document += "\n\n"
+        self._write("\n\n")
+
+        return self
+
+    def write_references(self) -> Self:
+        """Appends the pending reference definitions to the document as a line.
+
+        Call it at the end of the document, or at the end of a section. Definitions
+            that were already written are not repeated, and nothing is written if
+            there are no pending definitions.
+
+        Raises:
+            ValueError: If there are pending definitions, and the builder [`tokens`][pymarkdown_builder.builder.MarkdownBuilder.tokens] are [`HtmlTokens`][pymarkdown_builder.html_tokens.HtmlTokens]. Reference-style links are not supported in HTML documents: use [`HtmlTokens.link`][pymarkdown_builder.html_tokens.HtmlTokens.link] instead.
+
+        Returns:
+            The builder instance.
+        """  # noqa: E501
+        if self.references.has_pending:
+            if issubclass(self.tokens, HtmlTokens):
+                raise ValueError("Reference-style links are not supported in HTML.")
+
+            self.write_lines(self.references.definitions())
+
+        return self
+
+    def write_toc(
+        self,
+        max_level: int = 6,
+    ) -> Self:
+        """Appends a placeholder line for the table of contents.
+
+        The table of contents is rendered from the
+            [`headings`][pymarkdown_builder.builder.MarkdownBuilder.headings] index, and
+            filled in by [`finalize`][pymarkdown_builder.builder.MarkdownBuilder.finalize],
+            so it also lists headings written after the placeholder. When streaming,
+            content written after the placeholder is held in memory until then. The
+            table of contents is rendered with the `table_of_contents` of the builder
+            [`tokens`][pymarkdown_builder.builder.MarkdownBuilder.tokens].
+
+        Args:
+            max_level (int): Headings deeper than this level are left out. Defaults to `#!python 6`.
+
+        Raises:
+            ValueError: If a table of contents placeholder was already written.
+
+        Returns:
+            The builder instance.
+        """  # noqa: E501
+        if self._toc_offset is not None:
+            raise ValueError("A table of contents was already written.")
+
+        self._toc_separator = self._separator()
+        self._toc_offset = len(self.document)
+        self._toc_max_level = max_level
+        self._emitted = True
+
+        if self.sink is not None:
+            self._held = []
+
+        return self
+
+    def finalize(self) -> Self:
+        """Fills in the table of contents and appends the pending reference definitions.
+
+        When streaming, the content held after the table of contents placeholder is
+            written to the sink.
+
+        Returns:
+            The builder instance.
+        """  # noqa: E501
+        self.write_references()
+
+        if self._toc_offset is None:
+            return self
+
+        toc = self.tokens.table_of_contents(self.headings, self._toc_max_level)
+
+        if self.sink is None:
+            offset = self._toc_offset
+            tail = self._fill_toc(toc, self.document[offset:])
+            self.document = self.document[:offset] + tail
+        else:
+            held = self._held or []
+            start = next((i for i, text in enumerate(held) if text != ""), len(held))
+
+            if start < len(held):
+                self.sink.write(self._fill_toc(toc, held[start]))
+            elif toc != "":
+                self.sink.write(self._toc_separator + toc)
+
+            for text in held[start + 1 :]:
+                self.sink.write(text)
+
+            self._held = None
+
+        self._toc_offset = None
+
+        return self
+
+    def _fill_toc(self, toc: str, tail: str) -> str:
+        """Returns the table of contents followed by the start of the content after it.
+
+        If the table of contents is empty, its placeholder separator takes the place of
+            the separator of the content after it, as if it was never written.
+        """
+        if toc != "":
+            return self._toc_separator + toc + tail
+
+        if tail.startswith("\n\n"):
+            return self._toc_separator + tail[2:]
+
+        return tail
+
+    def reset(
+        self,
+        document: str = "",
+        sink: Optional[Sink] = None,
+    ) -> Self:
+        """Clears the builder, so it can be reused for a new document.
+
+        The builder is left as if it was just created with the given arguments and
+            its [`tokens`][pymarkdown_builder.builder.MarkdownBuilder.tokens], but its
+            link references and heading index are cleared in place instead of being
+            recreated.
+
+        Args:
+            document (str): Initial content of the new document.
+            sink (Optional[Sink]): Where the new document is streamed to. If not provided, content is accumulated in `document`.
+
+        Returns:
+            The builder instance.
+
+        Examples:
+            >>> builder = MarkdownBuilder().lines("# First")
+            >>> builder.reset().lines("# Second").document
+            '# Second'
+        """  # noqa: E501
+        self.document = document
+        self.sink = sink
+        self.references.clear()
+        self.headings.clear()
+        self._prefix = ()
+        self._emitted = False
+        self._initial_separator = ""
+        self._toc_offset = None
+        self._toc_max_level = 6
+        self._toc_separator = ""
+        self._held = None
+
+        if sink is not None and document != "":
+            self.__post_init__()
+
+        return self
+
+    def fork(self) -> Self:
+        """Creates a builder that starts with the content of this one.
+
+        The content written so far is shared, not copied, between this builder and its
+            forks, and both can keep writing independently. The shared content is only
+            copied when a fork is [materialized][pymarkdown_builder.builder.MarkdownBuilder.materialize].
+            Use [`write_to`][pymarkdown_builder.builder.MarkdownBuilder.write_to] to stream
+            a fork without copying it. Link references and headings are shared too,
+            until either builder registers a new one.
+
+        Raises:
+            ValueError: If the builder streams to a sink, or has a pending table of contents.
+
+        Returns:
+            The new builder.
+        """  # noqa: E501
+        if self.sink is not None:
+            raise ValueError("Cannot fork a builder that streams to a sink.")
+
+        if self._toc_offset is not None:
+            raise ValueError("Cannot fork a builder with a pending table of contents.")
+
+        fork = type(self)(
+            references=self.references.copy(),
+            headings=self.headings.copy(),
+            tokens=self.tokens,
+        )
+        fork._prefix = (
+            self._prefix if self.document == "" else (*self._prefix, self.document)
+        )
+        fork._initial_separator = self._initial_separator
+
+        return fork
+
+    def materialize(self) -> Self:
+        """Copies the content shared with the builder this one was forked from into `document`.
+
+        Returns:
+            The builder instance.
+        """  # noqa: E501
+        if len(self._prefix) > 0:
+            self.document = "".join((*self._prefix, self.document))
+            self._prefix = ()
+
+        return self
+
+    def write_to(self, sink: Sink) -> Self:
+        """Writes the whole content of the builder to a sink, without materializing it.
+
+        Args:
+            sink (Sink): Where the content is written to.
+
+        Returns:
+            The builder instance.
+        """
+        for text in self._prefix:
+            sink.write(text)
+
+        sink.write(self.document)
 
         return self
 
     def __str__(self) -> str:
         """Returns the content of the builder."""
+        if len(self._prefix) > 0:
+            return "".join((*self._prefix, self.document))
+
         return self.document
 
     lines = write_lines
     spans = write_spans
+    lines_from = write_lines_from
+    spans_from = write_spans_from
+    block_from = write_block_from
+    clear = reset
+    wrapped = write_wrapped
     br = line_break
+    refs = write_references
+    toc = write_toc
@@ -0,0 +1,334 @@
+"""Persistent on-disk cache of rendered fragments.
+
+Expensive fragments, such as large tables, are rendered once and reused across runs,
+as long as their inputs and the version of this package do not change.
+"""
+
+import hashlib
+import importlib
+import json
+import os
+import secrets
+import threading
+import types
+from importlib import metadata
+from typing import Any, Callable, List, Optional, Tuple, Union
+
+
+_LOW_WATER = 0.9
+"""Fraction of `max_bytes` the cache is evicted down to, so eviction runs in batches."""
+
+
+def _package_version() -> str:
+    """Returns the installed version of this package."""
+    try:
+        return metadata.version("pymarkdown-builder")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _unserializable(value: Any) -> Any:
+    """Rejects inputs that cannot be keyed by value."""
+    raise TypeError(
+        f"Cannot key an input of type {type(value).__name__!r}: inputs must be JSON "
+        "serializable. Pass a list instead of an iterator, or an explicit key."
+    )
+
+
+def _render_name(render: Callable[..., str]) -> str:
+    """Returns a name that identifies the render function across runs."""
+    qualname = getattr(render, "__qualname__", None)
+
+    if qualname is None:
+        name = repr(render)
+
+        if " at 0x" not in name:
+            return name
+    elif "<lambda>" not in qualname and "<locals>" not in qualname:
+        owner = getattr(render, "__self__", None)
+
+        if owner is None or isinstance(owner, (type, types.ModuleType)):
+            return f"{render.__module__}.{qualname}"
+
+    raise TypeError(
+        f"Cannot key the render function {render!r} by name: lambdas, closures and "
+        "bound methods of instances require an explicit key."
+    )
+
+
+def _encode(fragment: str) -> Any:
+    """Returns a JSON value that recreates the fragment, keeping its type."""
+    if type(fragment) is str or not isinstance(fragment, str):
+        return fragment
+
+    cls = type(fragment)
+
+    if "<locals>" in cls.__qualname__:
+        raise TypeError(f"Cannot cache a fragment of the local type {cls!r}.")
+
+    return {
+        "type": f"{cls.__module__}:{cls.__qualname__}",
+        "args": [_encode(arg) for arg in fragment.__getnewargs__()],
+    }
+
+
+def _decode(value: Any) -> Any:
+    """Recreates a fragment from the JSON value returned by `_encode`."""
+    if not isinstance(value, dict):
+        return value
+
+    module, _, qualname = value["type"].partition(":")
+    cls: Any = importlib.import_module(module)
+
+    for name in qualname.split("."):
+        cls = getattr(cls, name)
+
+    if not isinstance(cls, type) or not issubclass(cls, str):
+        raise TypeError(f"Cannot restore a fragment of type {value['type']!r}.")
+
+    return cls(*(_decode(arg) for arg in value["args"]))
+
+
+class FragmentCache:
+    """A size-bounded cache of rendered fragments, stored as files in a directory.
+
+    Fragments are keyed by a hash of the render function, its arguments and the
+        version of this package. When the cache grows beyond `max_bytes`, the least
+        recently used fragments are evicted until it is back under 90% of it, so the
+        directory is scanned once per batch of evictions. Recency is tracked with the
+        modification time of the files, so it is kept across runs. Fragments are
+        written to a temporary file first and atomically moved into place, so a
+        crashed run never leaves a partial fragment behind. Fragments of `#!python str`
+        subclasses, such as [`HeadingContent`][pymarkdown_builder.tokens.HeadingContent]
+        or [`HtmlContent`][pymarkdown_builder.html_tokens.HtmlContent], are stored
+        with their type and the arguments of `__getnewargs__`, so a hit returns the
+        same type as a miss.
+
+    Examples:
+        >>> import tempfile
+        >>> from pymarkdown_builder import MarkdownBuilder, Tokens
+        >>> cache = FragmentCache(tempfile.mkdtemp())
+        >>> rows = (["name", "age"], ["John", "20"])
+        >>> builder = MarkdownBuilder().lines(cache.fetch(Tokens.table, *rows))
+        >>> builder = MarkdownBuilder().lines(cache.fetch(Tokens.table, *rows))
+        >>> cache.hits, cache.misses
+        (1, 1)
+    """
+
+    directory: str
+    """Directory where the fragments are stored."""
+    max_bytes: int
+    """Maximum total size of the fragments, in bytes."""
+    version: str
+    """Version included in every key. Defaults to the version of this package."""
+    hits: int
+    """Number of fragments found in the cache."""
+    misses: int
+    """Number of fragments that had to be rendered."""
+    evictions: int
+    """Number of fragments evicted to keep the cache under `max_bytes`."""
+
+    def __init__(
+        self,
+        directory: Union[str, "os.PathLike[str]"],
+        max_bytes: int = 256 * 1024 * 1024,
+        version: Optional[str] = None,
+    ) -> None:
+        """Initializes the cache, creating the directory if needed.
+
+        Args:
+            directory (Union[str, PathLike[str]]): Directory where the fragments are stored.
+            max_bytes (int): Maximum total size of the fragments, in bytes. Defaults to 256 MiB.
+            version (Optional[str]): Version included in every key. If not provided, will use the version of this package.
+        """  # noqa: E501
+        self.directory = os.fspath(directory)
+        self.max_bytes = max_bytes
+        self.version = version if version is not None else _package_version()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        os.makedirs(self.directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._size = sum(size for _, _, size in self._entries())
+
+    def key(self, *inputs: Any) -> str:
+        """Returns the key of the given inputs.
+
+        Inputs must be JSON serializable, with tuples treated as lists, so the key only
+            depends on their values.
+
+        Args:
+            *inputs (Any): Unpacked iterable of inputs.
+
+        Raises:
+            TypeError: If an input is not JSON serializable, such as a generator.
+        """
+        digest = hashlib.sha256(self.version.encode("utf-8"))
+        encoder = json.JSONEncoder(sort_keys=True, default=_unserializable)
+
+        for chunk in encoder.iterencode(inputs):
+            digest.update(chunk.encode("utf-8"))
+
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Returns the fragment with the given key, or `#!python None` if it is not cached.
+
+        Args:
+            key (str): The key of the fragment.
+        """  # noqa: E501
+        path = self._path(key)
+
+        try:
+            with open(path, encoding="utf-8", newline="") as file:
+                header = file.readline()
+                fragment = (
+                    file.read() if header == "\n" else _decode(json.loads(header))
+                )
+        except FileNotFoundError:
+            return None
+
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+
+        return fragment
+
+    def put(self, key: str, fragment: str) -> None:
+        """Stores a fragment, evicting the least recently used ones if needed.
+
+        Args:
+            key (str): The key of the fragment.
+            fragment (str): The rendered fragment.
+
+        Raises:
+            TypeError: If the fragment is of a `#!python str` subclass that cannot be recreated from its type and the arguments of `__getnewargs__`.
+        """  # noqa: E501
+        path = self._path(key)
+        temp_path = os.path.join(self.directory, f".{key}.{secrets.token_hex(8)}.tmp")
+
+        if type(fragment) is str:
+            data = ("\n" + fragment).encode("utf-8")
+        else:
+            encoded = _encode(fragment)
+            restored = _decode(encoded)
+
+            state = getattr(fragment, "__dict__", None)
+
+            if restored != fragment or getattr(restored, "__dict__", None) != state:
+                raise TypeError(
+                    f"Cannot cache a fragment of type {type(fragment).__name__!r}: it "
+                    "is not recreated by the arguments of its __getnewargs__."
+                )
+
+            data = (json.dumps(encoded) + "\n").encode("utf-8")
+
+        with open(temp_path, "wb") as file:
+            file.write(data)
+
+        try:
+            previous_size = os.path.getsize(path)
+        except FileNotFoundError:
+            previous_size = 0
+
+        os.replace(temp_path, path)
+
+        with self._lock:
+            self._size += len(data) - previous_size
+
+            if self._size > self.max_bytes:
+                self._evict(keep=path)
+
+    def fetch(
+        self,
+        render: Callable[..., str],
+        *args: Any,
+        key: Optional[str] = None,
+        **kwargs: Any,
+    ) -> str:
+        """Returns the cached result of `render(*args, **kwargs)`, rendering and storing it on a miss.
+
+        Unless a `key` is provided, the key includes the qualified name of `render` (or
+            its `#!python repr`, for callable objects such as partial tokens), so
+            different functions with the same arguments do not collide. Lambdas,
+            closures and bound methods of instances cannot be told apart by name, and
+            iterators cannot be keyed by value, so they require an explicit `key`.
+
+        Args:
+            render (Callable[..., str]): The function that renders the fragment.
+            *args (Any): Positional arguments of `render`.
+            key (Optional[str]): Key of the fragment, identifying `render` and its arguments. If not provided, will be computed from them.
+            **kwargs (Any): Keyword arguments of `render`.
+
+        Raises:
+            TypeError: If no `key` is provided, and `render` or its arguments cannot be keyed.
+        """  # noqa: E501
+        if key is None:
+            key = self.key(_render_name(render), args, kwargs)
+        else:
+            key = self.key(key)
+
+        fragment = self.get(key)
+
+        if fragment is not None:
+            with self._lock:
+                self.hits += 1
+
+            return fragment
+
+        with self._lock:
+            self.misses += 1
+
+        fragment = render(*args, **kwargs)
+        self.put(key, fragment)
+
+        return fragment
+
+    def clear(self) -> None:
+        """Removes every fragment from the cache."""
+        with self._lock:
+            for path, _, _ in self._entries():
+                os.remove(path)
+
+            self._size = 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.md")
+
+    def _entries(self) -> List[Tuple[str, float, int]]:
+        """Returns the path, modification time and size of every fragment."""
+        entries: List[Tuple[str, float, int]] = []
+
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                if entry.name.startswith(".") or not entry.name.endswith(".md"):
+                    continue
+
+                stat = entry.stat()
+                entries.append((entry.path, stat.st_mtime, stat.st_size))
+
+        return entries
+
+    def _evict(self, keep: str) -> None:
+        """Removes the least recently used fragments until the cache is back under its low-water mark."""  # noqa: E501
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        self._size = sum(size for _, _, size in entries)
+        target = int(self.max_bytes * _LOW_WATER)
+
+        for path, _, size in entries:
+            if self._size <= target:
+                break
+
+            if path == keep:
+                continue
+
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+            self._size -= size
+            self.evictions += 1
@@ -0,0 +1,435 @@
+r"""Command line interface, to turn NDJSON, CSV or JSON records into Markdown.
+
+Records are read, rendered and written one chunk at a time, so memory stays bounded
+regardless of the size of the input.
+
+Examples:
+    ```sh
+    jq -c '.[]' deps.json | python -m pymarkdown_builder --title Dependencies
+    python -m pymarkdown_builder results.csv --columns name,status --output list \
+        --template '{name}: {status}'
+    ```
+"""
+
+import argparse
+import csv
+import io
+import json
+import re
+import sys
+from itertools import chain, islice
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from pymarkdown_builder.builder import MarkdownBuilder
+from pymarkdown_builder.tokens import Tokens
+
+
+_TEXT_ESCAPES = str.maketrans({char: f"\\{char}" for char in "\\`*_[]<>|"})
+_CELL_ESCAPES = str.maketrans({"|": "\\|", "\n": "<br>", "\r": ""})
+_needs_cell_escape = re.compile(r"[|\r\n]").search
+_DELIMITER = re.compile(r"[\s,:\]}]")
+
+
+def _to_text(value: Any) -> str:
+    """Converts a JSON value to text."""
+    if type(value) is str:
+        return value
+
+    if value is None:
+        return ""
+
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+
+    return json.dumps(value) if isinstance(value, bool) else str(value)
+
+
+def _iter_ndjson(file: IO[str]) -> Iterator[Dict[str, Any]]:
+    decode = json.JSONDecoder().decode
+
+    for line in file:
+        if not line.isspace():
+            yield decode(line)
+
+
+def _iter_csv(file: IO[str]) -> Iterator[Dict[str, Any]]:
+    yield from csv.DictReader(file)
+
+
+def _is_truncated(error: json.JSONDecodeError) -> bool:
+    """Returns whether the error may be fixed by reading more of the file."""
+    if error.msg.startswith("Unterminated string"):
+        return True
+
+    return _DELIMITER.search(error.doc, error.pos) is None
+
+
+def _locate(
+    error: json.JSONDecodeError, offset: int, line: int, line_start: int
+) -> None:
+    """Moves the error position from the buffer, starting at `offset`, to the file."""
+    newline = error.doc.rfind("\n", 0, error.pos)
+    error.lineno = line + error.doc.count("\n", 0, error.pos)
+    error.colno = (
+        error.pos - newline if newline != -1 else offset + error.pos - line_start + 1
+    )
+    error.pos += offset
+    error.args = (
+        f"{error.msg}: line {error.lineno} column {error.colno} (char {error.pos})",
+    )
+
+
+def _iter_json(file: IO[str], chunk_size: int = 64 * 1024) -> Iterator[Any]:
+    """Reads the items of a JSON array, without loading the whole array."""
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    # where the buffer starts in the file, to report errors
+    offset = 0
+    line = 1
+    line_start = 0
+    started = False
+    eof = False
+    read = True
+
+    while True:
+        if read:
+            newline = buffer.rfind("\n", 0, position)
+
+            if newline != -1:
+                line += buffer.count("\n", 0, position)
+                line_start = offset + newline + 1
+
+            offset += position
+            # reading at least the buffer size keeps long items linear
+            chunk = file.read(max(chunk_size, len(buffer) - position))
+            eof = chunk == ""
+            buffer = buffer[position:] + chunk
+            position = 0
+            read = False
+
+        while position < len(buffer) and buffer[position] in " \t\r\n,":
+            position += 1
+
+        if position == len(buffer):
+            if eof:
+                return
+
+            read = True
+            continue
+
+        if not started:
+            if buffer[position] != "[":
+                # not an array: a single value
+                try:
+                    item = json.loads(buffer + file.read())
+                except json.JSONDecodeError as error:
+                    _locate(error, offset, line, line_start)
+                    raise
+
+                yield item
+                return
+
+            started = True
+            position += 1
+            continue
+
+        if buffer[position] == "]":
+            return
+
+        try:
+            item, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError as error:
+            if eof or not _is_truncated(error):
+                _locate(error, offset, line, line_start)
+                raise
+
+            read = True
+            continue
+
+        if (
+            type(item) in (int, float)
+            and not eof
+            and _DELIMITER.search(buffer, end) is None
+        ):
+            # a number may continue in the next chunk
+            read = True
+            continue
+
+        yield item
+        position = end
+
+
+_READERS = {
+    "ndjson": _iter_ndjson,
+    "csv": _iter_csv,
+    "json": _iter_json,
+}
+
+
+def _detect_format(path: str) -> str:
+    for extension, name in ((".csv", "csv"), (".json", "json")):
+        if path.endswith(extension):
+            return name
+
+    return "ndjson"
+
+
+def _iter_records(paths: Sequence[str], input_format: str, stdin: IO[str]):
+    if len(paths) == 0:
+        reader = _READERS["ndjson" if input_format == "auto" else input_format]
+        yield from reader(stdin)
+        return
+
+    for path in paths:
+        name = _detect_format(path) if input_format == "auto" else input_format
+
+        if path == "-":
+            yield from _READERS[name](stdin)
+            continue
+
+        with open(path, encoding="utf-8", newline="") as file:
+            yield from _READERS[name](file)
+
+
+def _chunks(iterable: Iterable[str], size: int) -> Iterator[List[str]]:
+    iterator = iter(iterable)
+
+    while True:
+        chunk = list(islice(iterator, size))
+
+        if len(chunk) == 0:
+            return
+
+        yield chunk
+
+
+def _not_a_row(record: Any) -> ValueError:
+    return ValueError(
+        f"table records must be objects or arrays, not {type(record).__name__}"
+    )
+
+
+def _write_table(
+    builder: MarkdownBuilder,
+    records: Iterator[Any],
+    columns: Optional[List[str]],
+    escape: bool,
+    chunk_size: int,
+) -> bool:
+    """Writes the records as a table, and returns whether anything was written."""
+    first = next(records, None)
+
+    if first is None:
+        return False
+
+    def cell(value: Any) -> str:
+        text = _to_text(value)
+
+        if escape and _needs_cell_escape(text):
+            return text.translate(_CELL_ESCAPES)
+
+        return text
+
+    def row(record: Any) -> str:
+        if isinstance(record, dict):
+            return " | ".join(map(cell, map(record.get, columns)))
+
+        if isinstance(record, list):
+            return " | ".join(map(cell, record))
+
+        raise _not_a_row(record)
+
+    if columns is None and isinstance(first, list):
+        # records are arrays: the first one is the header
+        columns = [_to_text(value) for value in first]
+        first = next(records, None)
+
+        if first is None:
+            return False
+    elif columns is None:
+        if not isinstance(first, dict):
+            raise _not_a_row(first)
+
+        columns = list(first.keys())
+
+    header = " | ".join(cell(column) for column in columns)
+    divider = " | ".join("---" for _ in columns)
+    builder.write_lines(f"{header}\n{divider}")
+
+    for chunk in _chunks(map(row, chain((first,), records)), chunk_size):
+        builder.write_spans("\n", "\n".join(chunk))
+
+    return True
+
+
+def _write_items(
+    builder: MarkdownBuilder,
+    records: Iterator[Any],
+    output: str,
+    columns: Optional[List[str]],
+    template: Optional[str],
+    escape: bool,
+    chunk_size: int,
+) -> bool:
+    """Writes the records as list items or templated lines, and returns whether anything was written."""  # noqa: E501
+
+    def text(value: Any) -> str:
+        value = _to_text(value)
+        return value.translate(_TEXT_ESCAPES) if escape else value
+
+    def render(record: Any) -> str:
+        if not isinstance(record, dict):
+            return text(record)
+
+        if template is not None:
+            return template.format_map(
+                {key: text(value) for key, value in record.items()}
+            )
+
+        keys = columns if columns is not None else record.keys()
+        return " ".join(text(record.get(key)) for key in keys)
+
+    if output == "template":
+        written = False
+
+        for chunk in _chunks(map(render, records), chunk_size):
+            builder.write_lines(*chunk)
+            written = True
+
+        return written
+
+    token = Tokens.unordered_list if output == "list" else Tokens.ordered_list
+    written = False
+
+    for chunk in _chunks(map(render, records), chunk_size):
+        if written:
+            builder.write_spans("\n", token(*chunk))
+        else:
+            builder.write_lines(token(*chunk))
+            written = True
+
+    return written
+
+
+def make_parser() -> argparse.ArgumentParser:
+    """Creates the argument parser of the command line interface."""
+    parser = argparse.ArgumentParser(
+        prog="python -m pymarkdown_builder",
+        description="Turns NDJSON, CSV or JSON records into Markdown.",
+    )
+    parser.add_argument(
+        "files",
+        nargs="*",
+        help="input files. Reads from stdin if not provided, or if a file is '-'.",
+    )
+    parser.add_argument(
+        "-i",
+        "--input",
+        choices=("auto", "ndjson", "csv", "json"),
+        default="auto",
+        help="input format. 'auto' uses the file extension, and NDJSON for stdin.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        choices=("table", "list", "ordered-list", "template"),
+        default="table",
+        help="what to render the records as.",
+    )
+    parser.add_argument(
+        "-c",
+        "--columns",
+        help="comma separated columns, in order. Defaults to the first record keys.",
+    )
+    parser.add_argument(
+        "-t",
+        "--template",
+        help="format string for each record, such as '{name}: {age}'.",
+    )
+    parser.add_argument("--title", help="level 1 heading written before the records.")
+    parser.add_argument(
+        "--no-escape",
+        dest="escape",
+        action="store_false",
+        help="write values as they are, without escaping Markdown characters.",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=10_000,
+        help="number of records rendered and written at a time. Defaults to 10000.",
+    )
+
+    return parser
+
+
+def main(
+    argv: Optional[Sequence[str]] = None,
+    stdin: Optional[IO[str]] = None,
+    stdout: Optional[IO[str]] = None,
+) -> int:
+    """Runs the command line interface.
+
+    Args:
+        argv (Optional[Sequence[str]]): The arguments. If not provided, will use `#!python sys.argv`.
+        stdin (Optional[IO[str]]): Where records are read from. If not provided, will use `#!python sys.stdin`.
+        stdout (Optional[IO[str]]): Where Markdown is written to. If not provided, will use `#!python sys.stdout`.
+
+    Returns:
+        The exit code.
+    """  # noqa: E501
+    parser = make_parser()
+    args = parser.parse_args(argv)
+
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+
+    if args.output == "template" and args.template is None:
+        parser.error("--output template requires --template")
+
+    stdin = stdin or io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", newline="")
+    stdout = stdout or sys.stdout
+    columns = args.columns.split(",") if args.columns else None
+
+    builder = MarkdownBuilder(sink=stdout)
+    written = bool(args.title)
+
+    if args.title:
+        builder.write_lines(Tokens.h1(args.title))
+
+    records = _iter_records(args.files, args.input, stdin)
+
+    try:
+        if args.output == "table":
+            written |= _write_table(
+                builder, records, columns, args.escape, args.chunk_size
+            )
+        else:
+            written |= _write_items(
+                builder,
+                records,
+                args.output,
+                columns,
+                args.template,
+                args.escape,
+                args.chunk_size,
+            )
+    except (
+        OSError,
+        ValueError,
+        KeyError,
+        AttributeError,
+        IndexError,
+        csv.Error,
+    ) as error:
+        parser.exit(1, f"{parser.prog}: error: {error}\n")
+
+    builder.finalize()
+
+    if written:
+        stdout.write("\n")
+
+    stdout.flush()
+
+    return 0
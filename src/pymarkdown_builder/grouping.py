@@ -0,0 +1,198 @@
+"""Grouping of unsorted records into sections, with bounded memory.
+
+Records are sorted by key with an external merge sort: they are read in runs, each
+run is sorted in memory and spilled to a temporary file, and the runs are merged
+back lazily. Spilled runs are closed once written, and reopened only to be merged, so
+the number of open files stays bounded. Inputs that fit in a single run never touch
+the disk.
+"""
+
+import heapq
+import os
+import pickle
+import tempfile
+from contextlib import ExitStack
+from itertools import chain, count, groupby, islice
+from operator import itemgetter
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from pymarkdown_builder.builder import MarkdownBuilder
+from pymarkdown_builder.tokens import Tokens
+
+
+T = TypeVar("T")
+
+_BATCH_SIZE = 1024
+"""Number of records pickled at a time."""
+_MAX_OPEN_RUNS = 64
+"""Maximum number of runs open, and merged, at once. More runs are merged in several
+passes."""
+
+_Entry = Tuple[Any, int, Any]
+"""A record with its key and its position in the input, to keep the sort stable."""
+
+
+def _write_run(entries: Iterable[_Entry], directory: str) -> str:
+    """Writes the entries to a new file of the directory, in batches, and returns its path."""  # noqa: E501
+    descriptor, path = tempfile.mkstemp(suffix=".run", dir=directory)
+    entries_iter = iter(entries)
+
+    with os.fdopen(descriptor, "wb") as run:
+        while True:
+            batch = list(islice(entries_iter, _BATCH_SIZE))
+
+            if len(batch) == 0:
+                break
+
+            pickle.dump(batch, run, pickle.HIGHEST_PROTOCOL)
+
+    return path
+
+
+def _read_run(path: str) -> Iterator[_Entry]:
+    """Yields the entries of a run, reading one batch at a time."""
+    with open(path, "rb") as run:
+        while True:
+            try:
+                batch = pickle.load(run)
+            except EOFError:
+                return
+
+            yield from batch
+
+
+def _merge(paths: List[str]) -> Iterator[_Entry]:
+    return heapq.merge(*map(_read_run, paths), key=itemgetter(0, 1))
+
+
+def iter_sorted_groups(
+    records: Iterable[T],
+    key: Callable[[T], Any],
+    run_size: int = 100_000,
+    directory: Optional[str] = None,
+) -> Iterator[Tuple[Any, Iterator[T]]]:
+    """Sorts the records by key and yields each group, holding at most `run_size` records in memory.
+
+    Records of a group keep their input order. Like `#!python itertools.groupby`, the
+        records of a group must be consumed before moving to the next group. Records
+        must be picklable if there is more than one run.
+
+    Args:
+        records (Iterable[T]): Iterable of records, in any order.
+        key (Callable[[T], Any]): Returns the key of a record. Keys must be comparable.
+        run_size (int): Number of records sorted in memory at a time. Defaults to `#!python 100_000`.
+        directory (Optional[str]): Directory of the temporary files. If not provided, will use the default one.
+
+    Raises:
+        ValueError: If `run_size` is lower than `#!python 1`.
+
+    Examples:
+        >>> words = ["banana", "apple", "blueberry", "avocado", "cherry"]
+        >>> [(k, list(g)) for k, g in iter_sorted_groups(words, key=lambda w: w[0], run_size=2)]
+        [('a', ['apple', 'avocado']), ('b', ['banana', 'blueberry']), ('c', ['cherry'])]
+    """  # noqa: E501
+    if run_size < 1:
+        raise ValueError(f"The run size must be at least 1, got {run_size}.")
+
+    positions = count()
+    entries = ((key(record), next(positions), record) for record in records)
+
+    with ExitStack() as stack:
+        runs: List[str] = []
+        run_directory = ""
+
+        while True:
+            run = sorted(islice(entries, run_size), key=itemgetter(0, 1))
+
+            if len(run) < run_size and len(runs) == 0:
+                # everything fits in memory
+                merged: Iterator[_Entry] = iter(run)
+                break
+
+            if run_directory == "":
+                run_directory = stack.enter_context(
+                    tempfile.TemporaryDirectory(dir=directory)
+                )
+
+            if len(run) > 0:
+                runs.append(_write_run(run, run_directory))
+
+            if len(run) < run_size:
+                while len(runs) > _MAX_OPEN_RUNS:
+                    batch, runs = runs[:_MAX_OPEN_RUNS], runs[_MAX_OPEN_RUNS:]
+                    runs.append(_write_run(_merge(batch), run_directory))
+
+                    for path in batch:
+                        os.remove(path)
+
+                merged = _merge(runs)
+                break
+
+        for group_key, group in groupby(merged, key=itemgetter(0)):
+            yield group_key, map(itemgetter(2), group)
+
+
+def write_grouped_tables(
+    builder: MarkdownBuilder,
+    records: Iterable[T],
+    key: Callable[[T], Any],
+    header: Sequence[str],
+    row: Optional[Callable[[T], Iterable[str]]] = None,
+    level: int = 2,
+    title: Callable[[Any], str] = str,
+    run_size: int = 100_000,
+    directory: Optional[str] = None,
+) -> MarkdownBuilder:
+    r"""Writes a heading and a table for each group of records, in key order.
+
+    Groups are sorted with [`iter_sorted_groups`][pymarkdown_builder.grouping.iter_sorted_groups],
+        and each table is written with [`write_block_from`][pymarkdown_builder.builder.MarkdownBuilder.write_block_from],
+        so with a streaming builder, memory is bounded by `run_size` regardless of
+        the number of records.
+
+    Args:
+        builder (MarkdownBuilder): The builder to write to.
+        records (Iterable[T]): Iterable of records, in any order.
+        key (Callable[[T], Any]): Returns the group key of a record. Keys must be comparable.
+        header (Sequence[str]): Header of the tables.
+        row (Optional[Callable[[T], Iterable[str]]]): Returns the cells of a record. If not provided, records must be dicts, and the cells are their values for each header column.
+        level (int): Level of the group headings. Defaults to `#!python 2`.
+        title (Callable[[Any], str]): Returns the heading text of a group key. Defaults to `#!python str`.
+        run_size (int): Number of records sorted in memory at a time. Defaults to `#!python 100_000`.
+        directory (Optional[str]): Directory of the temporary files. If not provided, will use the default one.
+
+    Returns:
+        The builder instance.
+
+    Examples:
+        >>> records = [
+        ...     {"team": "web", "name": "Ann"},
+        ...     {"team": "api", "name": "Bob"},
+        ...     {"team": "web", "name": "Cid"},
+        ... ]
+        >>> builder = write_grouped_tables(
+        ...     MarkdownBuilder(), records, key=lambda r: r["team"], header=["name"]
+        ... )
+        >>> builder.document
+        '## api\n\nname\n---\nBob\n\n## web\n\nname\n---\nAnn\nCid'
+    """  # noqa: E501
+    if row is None:
+
+        def row(record: Any) -> Iterable[str]:
+            return [record[column] for column in header]
+
+    for group_key, group in iter_sorted_groups(records, key, run_size, directory):
+        builder.write_lines(Tokens.heading(title(group_key), level))
+        builder.write_block_from(Tokens.iter_table(chain((header,), map(row, group))))
+
+    return builder
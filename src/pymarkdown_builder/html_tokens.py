@@ -0,0 +1,490 @@
+"""HTML tokens. The same building blocks as [`Tokens`][pymarkdown_builder.tokens.Tokens], rendered straight to HTML.
+
+Text is escaped, unless it is already [`HtmlContent`][pymarkdown_builder.html_tokens.HtmlContent],
+which is what every HTML token returns. This way, tokens can be nested without
+escaping their markup twice.
+"""  # noqa: E501
+
+import html
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pymarkdown_builder.partial_tokens import PartialToken, PartialTokenContent
+from pymarkdown_builder.toc import HeadingIndex, slugify
+from pymarkdown_builder.tokens import HeadingContent
+from pymarkdown_builder.urls import encode_url
+
+
+class HtmlContent(str):
+    """A string of HTML that is already escaped, and will not be escaped again."""
+
+
+def escape(text: str) -> HtmlContent:
+    """Escapes the text for HTML, unless it is already [`HtmlContent`][pymarkdown_builder.html_tokens.HtmlContent].
+
+    Args:
+        text (str): The text to be escaped.
+
+    Examples:
+        >>> escape("a < b & c")
+        'a &lt; b &amp; c'
+        >>> escape(escape("a < b"))
+        'a &lt; b'
+    """  # noqa: E501
+    if isinstance(text, HtmlContent):
+        return text
+
+    return HtmlContent(html.escape(text))
+
+
+def _join(spans: Iterable[str]) -> HtmlContent:
+    """Escapes each span and joins them."""
+    return HtmlContent("".join(escape(span) for span in spans))
+
+
+def _table(header_row: Iterable[str], rows: Iterator[Iterable[str]]) -> HtmlContent:
+    """Renders the header and the body rows of a table."""
+    first_row = next(rows, None)
+
+    if first_row is None:
+        return HtmlContent("")
+
+    header_str = "".join(f"<th>{escape(cell)}</th>" for cell in header_row)
+    body_str = "\n".join(
+        "<tr>" + "".join(f"<td>{escape(cell)}</td>" for cell in row) + "</tr>"
+        for row in chain((first_row,), rows)
+    )
+
+    return HtmlContent(
+        f"<table>\n<thead>\n<tr>{header_str}</tr>\n</thead>\n"
+        f"<tbody>\n{body_str}\n</tbody>\n</table>"
+    )
+
+
+class HtmlPartialTokenContent(PartialTokenContent, HtmlContent):
+    """A [`PartialTokenContent`][pymarkdown_builder.partial_tokens.PartialTokenContent] that escapes the strings piped into it."""  # noqa: E501
+
+    @classmethod
+    def _text(cls, value: str) -> str:
+        return escape(value)
+
+
+class HtmlPartialToken(PartialToken):
+    """A [`PartialToken`][pymarkdown_builder.partial_tokens.PartialToken] that escapes the text it wraps.
+
+    Examples:
+        >>> strong = HtmlPartialToken("<strong>", "</strong>")
+        >>> strong("a < b")
+        '<strong>a &lt; b</strong>'
+        >>> strong | "a < b" | strong
+        '<strong>a &lt; b</strong>'
+    """  # noqa: E501
+
+    content_type = HtmlPartialTokenContent
+
+    def __call__(self, text: str) -> HtmlContent:
+        """Wraps the escaped text with the tags."""
+        return HtmlContent(f"{self.open_tag}{escape(text)}{self.close_tag}")
+
+
+class HtmlHeadingContent(HeadingContent, HtmlContent):
+    """A [`HeadingContent`][pymarkdown_builder.tokens.HeadingContent] rendered as an HTML heading with an `id`.
+
+    When written to a [`MarkdownBuilder`][pymarkdown_builder.builder.MarkdownBuilder],
+        the `id` is replaced by the collision-resolved anchor of its heading index.
+    """  # noqa: E501
+
+    anchor: str
+    """The `id` of the heading."""
+
+    def __new__(cls, text: str, level: int, anchor: Optional[str] = None):
+        """Creates a new HTML heading content."""
+        anchor = anchor if anchor is not None else slugify(text)
+        content = str.__new__(
+            cls, f'<h{level} id="{escape(anchor)}">{escape(text)}</h{level}>'
+        )
+        content.text = text
+        content.level = level
+        content.anchor = anchor
+
+        return content
+
+    def __getnewargs__(self) -> Tuple[str, int, str]:
+        """Returns the arguments of `__new__`, so headings can be pickled and copied."""
+        return (self.text, self.level, self.anchor)
+
+    def with_anchor(self, anchor: str) -> str:
+        """Returns the heading with the given anchor as its `id`."""
+        if anchor == self.anchor:
+            return self
+
+        return type(self)(self.text, self.level, anchor)
+
+
+class HtmlTokens:
+    r"""HTML tokens, with the same building blocks as [`Tokens`][pymarkdown_builder.tokens.Tokens].
+
+    The signatures differ where HTML differs from Markdown. HTML is not hard-wrapped,
+        so no token takes a `width`, and [`paragraph`][pymarkdown_builder.html_tokens.HtmlTokens.paragraph]
+        and [`quote`][pymarkdown_builder.html_tokens.HtmlTokens.quote] take several
+        spans instead of a single text, so escaped text and HTML tokens can be mixed.
+        The iterable variants of `Tokens`, such as `table_from`, are not provided.
+
+    Examples:
+        >>> from pymarkdown_builder import MarkdownBuilder
+        >>> t = HtmlTokens
+        >>> MarkdownBuilder().lines(
+        ...     t.h1("Fish & Chips"),
+        ...     t.p("Served ", t.bold("hot"), "."),
+        ... ).document
+        '<h1 id="fish--chips">Fish &amp; Chips</h1>\n\n<p>Served <strong>hot</strong>.</p>'
+
+    Headings are indexed by the builder, which gives repeated headings unique `id`s.
+        A builder created with `#!python MarkdownBuilder(tokens=HtmlTokens)` renders its
+        [table of contents][pymarkdown_builder.builder.MarkdownBuilder.write_toc] as
+        HTML, and raises a `#!python ValueError` if it has pending reference
+        definitions, as reference-style links are not supported in HTML.
+    """  # noqa: E501
+
+    @staticmethod
+    def heading(
+        text: str,
+        level: Optional[int] = None,
+    ) -> HtmlHeadingContent:
+        """Creates a heading with the given level, with an `id` to be linked to.
+
+        Args:
+            text (str): The text of the heading.
+            level (int): The level of the heading. Must be between `#!python 1` and `#!python 6`. If not provided, will use `#!python 1`.
+
+        Examples:
+            >>> HtmlTokens.heading("Hello, world!", 2)
+            '<h2 id="hello-world">Hello, world!</h2>'
+        """  # noqa: E501
+        level = level if level is not None else 1
+
+        if level < 1 or level > 6:
+            raise ValueError("Level must be between 1 and 6.")
+
+        return HtmlHeadingContent(text, level)
+
+    @staticmethod
+    def h1(
+        text: str,
+    ) -> HtmlHeadingContent:
+        """Creates a level 1 heading."""
+        return HtmlTokens.heading(text, 1)
+
+    @staticmethod
+    def h2(
+        text: str,
+    ) -> HtmlHeadingContent:
+        """Creates a level 2 heading."""
+        return HtmlTokens.heading(text, 2)
+
+    @staticmethod
+    def h3(
+        text: str,
+    ) -> HtmlHeadingContent:
+        """Creates a level 3 heading."""
+        return HtmlTokens.heading(text, 3)
+
+    @staticmethod
+    def h4(
+        text: str,
+    ) -> HtmlHeadingContent:
+        """Creates a level 4 heading."""
+        return HtmlTokens.heading(text, 4)
+
+    @staticmethod
+    def h5(
+        text: str,
+    ) -> HtmlHeadingContent:
+        """Creates a level 5 heading."""
+        return HtmlTokens.heading(text, 5)
+
+    @staticmethod
+    def h6(
+        text: str,
+    ) -> HtmlHeadingContent:
+        """Creates a level 6 heading."""
+        return HtmlTokens.heading(text, 6)
+
+    @staticmethod
+    def text(
+        text: str,
+    ) -> HtmlContent:
+        """Escapes the text, to be used as a span.
+
+        Args:
+            text (str): The text to be escaped.
+
+        Examples:
+            >>> HtmlTokens.text("<b>")
+            '&lt;b&gt;'
+        """
+        return escape(text)
+
+    @staticmethod
+    def paragraph(
+        *spans: str,
+    ) -> HtmlContent:
+        """Creates a paragraph with the `<p>` tag.
+
+        Unlike [`Tokens.paragraph`][pymarkdown_builder.tokens.Tokens.paragraph], takes
+            several spans and no `width`.
+
+        Args:
+            *spans (str): Unpacked iterable of spans. Strings are escaped, HTML tokens are kept as they are.
+
+        Examples:
+            >>> HtmlTokens.paragraph("Hello, ", HtmlTokens.italic("world"), "!")
+            '<p>Hello, <em>world</em>!</p>'
+        """  # noqa: E501
+        return HtmlContent(f"<p>{_join(spans)}</p>")
+
+    @staticmethod
+    def quote(
+        *spans: str,
+    ) -> HtmlContent:
+        """Creates a quote with the `<blockquote>` tag.
+
+        Unlike [`Tokens.quote`][pymarkdown_builder.tokens.Tokens.quote], takes several
+            spans and no `width`.
+
+        Args:
+            *spans (str): Unpacked iterable of spans. Strings are escaped, HTML tokens are kept as they are.
+
+        Examples:
+            >>> HtmlTokens.quote("Hello, world!")
+            '<blockquote><p>Hello, world!</p></blockquote>'
+        """  # noqa: E501
+        return HtmlContent(f"<blockquote><p>{_join(spans)}</p></blockquote>")
+
+    @staticmethod
+    def horizontal_rule() -> HtmlContent:
+        """Creates a horizontal rule using `<hr>`.
+
+        Examples:
+            >>> HtmlTokens.horizontal_rule()
+            '<hr>'
+        """
+        return HtmlContent("<hr>")
+
+    @staticmethod
+    def link(
+        href: str,
+        text: Optional[str] = None,
+        encode: bool = False,
+    ) -> HtmlContent:
+        """Creates a link with the `<a>` tag.
+
+        Args:
+            href (str): The href of the link.
+            text (Optional[str]): The text to be shown as the link. If not provided, will use the `href` value.
+            encode (bool): Whether to percent-encode the href with [`encode_url`][pymarkdown_builder.urls.encode_url].
+
+        Examples:
+            >>> HtmlTokens.link("https://example.com/?a=1&b=2", "Example")
+            '<a href="https://example.com/?a=1&amp;b=2">Example</a>'
+        """  # noqa: E501
+        text = text or href
+
+        if encode:
+            href = encode_url(href)
+
+        return HtmlContent(f'<a href="{escape(href)}">{escape(text)}</a>')
+
+    @staticmethod
+    def image(
+        src: str,
+        alt: Optional[str] = None,
+        mouseover: Optional[str] = None,
+        encode: bool = False,
+    ) -> HtmlContent:
+        """Creates an image with the `<img>` tag.
+
+        Args:
+            src (str): The source of the image. Can be a path or a URL.
+            alt (Optional[str]): The alt text. If not provided, will use an empty string.
+            mouseover (Optional[str]): The mouseover text, set as the `title`. If not provided, will not be set.
+            encode (bool): Whether to percent-encode the source with [`encode_url`][pymarkdown_builder.urls.encode_url].
+
+        Examples:
+            >>> HtmlTokens.image("image.png", "alt text", 'a "title"')
+            '<img src="image.png" alt="alt text" title="a &quot;title&quot;">'
+        """  # noqa: E501
+        alt = alt or ""
+        src = encode_url(src) if encode else src
+        title = f' title="{escape(mouseover)}"' if mouseover else ""
+
+        return HtmlContent(f'<img src="{escape(src)}" alt="{escape(alt)}"{title}>')
+
+    @staticmethod
+    def code_block(
+        text: str,
+        lang: Optional[str] = None,
+    ) -> HtmlContent:
+        """Creates a code block with the `<pre>` and `<code>` tags.
+
+        Args:
+            text (str): The text of the code block.
+            lang (Optional[str]): The language of the code block, set as a `language-*` class. If not provided, will not be set.
+
+        Examples:
+            >>> HtmlTokens.code_block("a < b", "python")
+            '<pre><code class="language-python">a &lt; b</code></pre>'
+        """  # noqa: E501
+        lang = f' class="language-{escape(lang)}"' if lang else ""
+
+        return HtmlContent(f"<pre><code{lang}>{escape(text)}</code></pre>")
+
+    @staticmethod
+    def unordered_list(
+        *items: str,
+    ) -> HtmlContent:
+        r"""Creates an unordered list with the `<ul>` and `<li>` tags.
+
+        Args:
+            *items (Iterable[str]): Unpacked iterable of items to be listed.
+
+        Examples:
+            >>> HtmlTokens.unordered_list("Hello", "World")
+            '<ul>\n<li>Hello</li>\n<li>World</li>\n</ul>'
+        """
+        if len(items) == 0:
+            return HtmlContent("")
+
+        body = "\n".join(f"<li>{escape(item)}</li>" for item in items)
+
+        return HtmlContent(f"<ul>\n{body}\n</ul>")
+
+    @staticmethod
+    def ordered_list(
+        *items: str,
+    ) -> HtmlContent:
+        r"""Creates an ordered list with the `<ol>` and `<li>` tags.
+
+        Args:
+            *items (Iterable[str]): Unpacked iterable of items to be listed.
+
+        Examples:
+            >>> HtmlTokens.ordered_list("Hello", "World")
+            '<ol>\n<li>Hello</li>\n<li>World</li>\n</ol>'
+        """
+        if len(items) == 0:
+            return HtmlContent("")
+
+        body = "\n".join(f"<li>{escape(item)}</li>" for item in items)
+
+        return HtmlContent(f"<ol>\n{body}\n</ol>")
+
+    @staticmethod
+    def table(
+        *rows: Iterable[str],
+    ) -> HtmlContent:
+        r"""Creates a table from an iterable of rows, with the `<table>` tag.
+
+        Args:
+            *rows (Iterable[str]): Unpacked iterable of rows. The first row is the header, and the rest are the body.
+
+        Examples:
+            >>> HtmlTokens.table(["name", "age"], ["John", "20"])
+            '<table>\n<thead>\n<tr><th>name</th><th>age</th></tr>\n</thead>\n<tbody>\n<tr><td>John</td><td>20</td></tr>\n</tbody>\n</table>'
+        """  # noqa: E501
+        rows_iter = iter(rows)
+        header_row = next(rows_iter, None)
+
+        if header_row is None:
+            return HtmlContent("")
+
+        return _table(header_row, rows_iter)
+
+    @staticmethod
+    def table_from_dicts(
+        *dicts: Dict[str, str],
+        header: Iterable[str] | None = None,
+    ) -> HtmlContent:
+        """Creates a table from an iterable of dicts, with the `<table>` tag.
+
+        Args:
+            *dicts (Dict[str, str]): Unpacked iterable of dicts. Each dict will be a row.
+            header (Iterable[str] | None): Custom table header. If not provided, will use the keys of the first dict.
+        """  # noqa: E501
+        dicts_iter = iter(dicts)
+        first_row = next(dicts_iter, None)
+
+        if first_row is None:
+            return HtmlContent("")
+
+        header = header or list(first_row.keys())
+        body = (row.values() for row in chain((first_row,), dicts_iter))
+
+        return _table(header, body)
+
+    @staticmethod
+    def table_of_contents(
+        index: HeadingIndex,
+        max_level: int = 6,
+    ) -> HtmlContent:
+        r"""Creates a table of contents from a heading index, as nested `<ul>` lists of links.
+
+        Args:
+            index (HeadingIndex): The index of the headings, such as the [`headings`][pymarkdown_builder.builder.MarkdownBuilder.headings] of a builder.
+            max_level (int): Headings deeper than this level are left out. Defaults to `#!python 6`.
+
+        Examples:
+            >>> index = HeadingIndex()
+            >>> _ = index.add("Fish & Chips", 1)
+            >>> HtmlTokens.table_of_contents(index)
+            '<ul>\n<li><a href="#fish--chips">Fish &amp; Chips</a></li>\n</ul>'
+        """  # noqa: E501
+        lines: List[str] = []
+        levels: List[int] = []
+
+        for entry in index.entries:
+            if entry.level > max_level:
+                continue
+
+            if len(levels) > 0 and entry.level <= levels[-1]:
+                lines[-1] += "</li>"
+
+                while len(levels) > 1 and entry.level <= levels[-2]:
+                    levels.pop()
+                    lines.extend(("</ul>", "</li>"))
+            else:
+                lines.append("<ul>")
+                levels.append(entry.level)
+
+            anchor = escape(entry.anchor)
+            lines.append(f'<li><a href="#{anchor}">{escape(entry.text)}</a>')
+
+        if len(levels) == 0:
+            return HtmlContent("")
+
+        lines[-1] += "</li>"
+        lines.extend(("</ul>", "</li>") * (len(levels) - 1))
+        lines.append("</ul>")
+
+        return HtmlContent("\n".join(lines))
+
+    # short tokens
+    h = heading
+    p = paragraph
+    ul = unordered_list
+    ol = ordered_list
+    hr = horizontal_rule
+    img = image
+    toc = table_of_contents
+
+    bold = HtmlPartialToken("<strong>", "</strong>")
+    """Creates bold text by wrapping the escaped text with `<strong>`."""
+
+    italic = HtmlPartialToken("<em>", "</em>")
+    """Creates italic text by wrapping the escaped text with `<em>`."""
+
+    code = HtmlPartialToken("<code>", "</code>")
+    """Creates code text by wrapping the escaped text with `<code>`."""
+
+    strike = HtmlPartialToken("<del>", "</del>")
+    """Creates strike through text by wrapping the escaped text with `<del>`."""
@@ -0,0 +1,147 @@
+"""Parallel rendering of very large tables.
+
+Rows are split into chunks that are rendered on a thread pool on free-threaded Python
+builds, or on the executor provided, and the rendered chunks are yielded in order. The
+output is the same as [`Tokens.table`][pymarkdown_builder.tokens.Tokens.table].
+
+With the GIL, chunks are rendered serially by default: sending the rows to a process
+pool costs far more than joining them, so process pools are slower than serial
+rendering for any number of rows.
+"""  # noqa: E501
+
+import os
+import sys
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from itertools import chain, islice
+from typing import Deque, Iterable, Iterator, List, Optional
+
+
+def _render_rows(rows: List[List[str]]) -> str:
+    """Renders the body rows of a table. Runs on the workers."""
+    return "\n".join(" | ".join(row) for row in rows)
+
+
+def _is_free_threaded() -> bool:
+    """Whether the interpreter is running without the GIL."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def default_executor(workers: Optional[int] = None) -> Optional[Executor]:
+    """Creates a thread pool on free-threaded builds, or returns `#!python None` to render serially otherwise.
+
+    Args:
+        workers (Optional[int]): Number of workers. If not provided, uses the executor's default.
+    """  # noqa: E501
+    if _is_free_threaded():
+        return ThreadPoolExecutor(workers)
+
+    return None
+
+
+def iter_parallel_table(
+    rows: Iterable[Iterable[str]],
+    chunk_size: int = 50_000,
+    executor: Optional[Executor] = None,
+    workers: Optional[int] = None,
+) -> Iterator[str]:
+    r"""Renders a table in parallel, yielding the rendered chunks in order.
+
+    The first chunk is the header and the divider, and each following chunk starts
+        with a line break, so joining the chunks gives the same result as
+        [`Tokens.table`][pymarkdown_builder.tokens.Tokens.table]. Rows are read lazily,
+        and only a couple of chunks per worker are in flight at a time.
+
+    Args:
+        rows (Iterable[Iterable[str]]): Iterable of rows. The first row is the header, and the rest are the body.
+        chunk_size (int): Number of rows rendered by each task. Defaults to `#!python 50_000`.
+        executor (Optional[Executor]): The executor to render the chunks with. If not provided, one is created with [`default_executor`][pymarkdown_builder.parallel.default_executor], and shut down at the end. Chunks are rendered serially if there is none.
+        workers (Optional[int]): Number of workers of the created executor. Ignored if `executor` is provided.
+
+    Examples:
+        >>> from concurrent.futures import ThreadPoolExecutor
+        >>> rows = [["name", "age"], ["John", "20"], ["Jane", "19"]]
+        >>> with ThreadPoolExecutor(2) as executor:
+        ...     list(iter_parallel_table(rows, chunk_size=1, executor=executor))
+        ['name | age\n--- | ---', '\nJohn | 20', '\nJane | 19']
+    """  # noqa: E501
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least 1.")
+
+    rows_iter = iter(rows)
+    header_row = next(rows_iter, None)
+
+    if header_row is None:
+        return
+
+    header_row = list(header_row)
+
+    first_row = next(rows_iter, None)
+
+    if first_row is None:
+        return
+
+    yield "\n".join((" | ".join(header_row), " | ".join("---" for _ in header_row)))
+
+    body_iter = chain((first_row,), rows_iter)
+    owns_executor = executor is None
+    executor = executor or default_executor(workers)
+
+    if executor is None:
+        while True:
+            lines = list(map(" | ".join, islice(body_iter, chunk_size)))
+
+            if len(lines) == 0:
+                return
+
+            yield "\n" + "\n".join(lines)
+
+    max_pending = 2 * (workers or os.cpu_count() or 1)
+    pending: Deque["Future[str]"] = deque()
+
+    try:
+        while True:
+            chunk = [list(row) for row in islice(body_iter, chunk_size)]
+
+            if len(chunk) == 0:
+                break
+
+            pending.append(executor.submit(_render_rows, chunk))
+
+            if len(pending) >= max_pending:
+                yield "\n" + pending.popleft().result()
+
+        while len(pending) > 0:
+            yield "\n" + pending.popleft().result()
+
+    finally:
+        for future in pending:
+            future.cancel()
+
+        if owns_executor:
+            executor.shutdown()
+
+
+def parallel_table(
+    rows: Iterable[Iterable[str]],
+    chunk_size: int = 50_000,
+    executor: Optional[Executor] = None,
+    workers: Optional[int] = None,
+) -> str:
+    r"""Renders a table in parallel. Same as joining [`iter_parallel_table`][pymarkdown_builder.parallel.iter_parallel_table].
+
+    Args:
+        rows (Iterable[Iterable[str]]): Iterable of rows. The first row is the header, and the rest are the body.
+        chunk_size (int): Number of rows rendered by each task. Defaults to `#!python 50_000`.
+        executor (Optional[Executor]): The executor to render the chunks with. If not provided, one is created on free-threaded builds and shut down at the end, and chunks are rendered serially otherwise.
+        workers (Optional[int]): Number of workers of the created executor. Ignored if `executor` is provided.
+
+    Examples:
+        >>> from concurrent.futures import ThreadPoolExecutor
+        >>> with ThreadPoolExecutor(2) as executor:
+        ...     parallel_table([["name", "age"], ["John", "20"]], executor=executor)
+        'name | age\n--- | ---\nJohn | 20'
+    """  # noqa: E501
+    return "".join(iter_parallel_table(rows, chunk_size, executor, workers))
@@ -7,7 +7,7 @@ To create your own partial tokens, use the [`create_partial_token`][pymarkdown_b
 """  # noqa: E501
 
 
-from typing import Optional
+from typing import Dict, Optional, Tuple, Type
 
 
 class InvalidPartialTokenCompositionError(Exception):
@@ -17,22 +17,39 @@ class InvalidPartialTokenCompositionError(Exception):
 class PartialTokenContent(str):
     """An "overloaded" string to support pipe operations with [`PartialToken`][pymarkdown_builder.partial_tokens.PartialToken]."""  # noqa: E501
 
-    def __new__(cls, string: str):
+    open_tokens: Tuple["PartialToken", ...]
+    """Tokens opened and not yet closed, from the outermost to the innermost."""
+
+    def __new__(cls, string: str, open_tokens: Tuple["PartialToken", ...] = ()):
         """Creates a new partial token content."""
-        return super().__new__(cls, string)
+        content = super().__new__(cls, string)
+        content.open_tokens = open_tokens
+
+        return content
+
+    @classmethod
+    def _text(cls, value: str) -> str:
+        """Converts a string added to the content. Subclasses may escape it."""
+        return value
 
     def __or__(self, value: "str | PartialToken") -> "PartialTokenContent":
         """Executed when on the **left** side of the pipe operator.
 
         The right side of the pipe operator can be either a `#!python str` or a
-            [`PartialToken`][pymarkdown_builder.partial_tokens.PartialToken].
+            [`PartialToken`][pymarkdown_builder.partial_tokens.PartialToken]. A token
+            is closed if it is the innermost open token, and opened otherwise.
             Always returns a [`PartialToken`][pymarkdown_builder.partial_tokens.PartialToken].
         """  # noqa: E501
+        cls = type(self)
+
         if isinstance(value, str):
-            return PartialTokenContent(self + value)
+            return cls(self + cls._text(value), self.open_tokens)
 
         if isinstance(value, PartialToken):
-            return PartialTokenContent(self + value.close_tag)
+            if len(self.open_tokens) > 0 and self.open_tokens[-1] is value:
+                return cls(self + value.close_tag, self.open_tokens[:-1])
+
+            return cls(self + value.open_tag, (*self.open_tokens, value))
 
     def __ror__(self, value: "str | PartialToken") -> "PartialTokenContent":
         """Executed when on the **right** side of the pipe operator.
@@ -41,11 +58,13 @@ class PartialTokenContent(str):
             [`PartialToken`][pymarkdown_builder.partial_tokens.PartialToken].
             Always returns a [`PartialToken`][pymarkdown_builder.partial_tokens.PartialToken].
         """  # noqa: E501
+        cls = type(self)
+
         if isinstance(value, str):
-            return PartialTokenContent(value + self)
+            return cls(cls._text(value) + self, self.open_tokens)
 
         if isinstance(value, PartialToken):
-            return PartialTokenContent(value.close_tag + self)
+            return cls(value.close_tag + self, self.open_tokens)
 
 
 class PartialToken:
@@ -65,6 +84,8 @@ class PartialToken:
     """String that will be prepended to the text."""
     close_tag: str
     """String that will be appended to the text."""
+    content_type = PartialTokenContent
+    """The type of content created by pipe operations."""
 
     def __init__(
         self,
@@ -82,6 +103,10 @@ class PartialToken:
         self.open_tag = open_tag
         self.close_tag = close_tag
 
+    def __repr__(self) -> str:
+        """Returns the representation of the token, with its tags."""
+        return f"{type(self).__name__}({self.open_tag!r}, {self.close_tag!r})"
+
     def __call__(self, text: str) -> str:
         """Wraps the text with the tags."""
         return f"{self.open_tag}{text}{self.close_tag}"
@@ -93,11 +118,16 @@ class PartialToken:
             [`PartialToken`][pymarkdown_builder.partial_tokens.PartialToken].
             Always returns a [`PartialTokenContent`][pymarkdown_builder.partial_tokens.PartialTokenContent].
         """  # noqa: E501
+        content_type = self.content_type
+
         if isinstance(value, PartialToken):
-            return PartialTokenContent(self.open_tag + value.open_tag)
+            return content_type(self.open_tag + value.open_tag, (self, value))
 
         if isinstance(value, str):
-            return PartialTokenContent(self.open_tag + value)
+            open_tokens = getattr(value, "open_tokens", ())
+            text = content_type._text(value)
+
+            return content_type(self.open_tag + text, (self, *open_tokens))
 
     def __ror__(self, value: PartialTokenContent) -> PartialTokenContent:
         """Executed when on the **right** side of the pipe operator, **closing** the tag.
@@ -107,10 +137,28 @@ class PartialToken:
             Always returns a [`PartialTokenContent`][pymarkdown_builder.partial_tokens.PartialTokenContent].
         """  # noqa: E501
         if isinstance(value, PartialTokenContent):
-            return PartialTokenContent(value + self.close_tag)
+            open_tokens = value.open_tokens
+
+            if len(open_tokens) > 0 and open_tokens[-1] is self:
+                open_tokens = open_tokens[:-1]
+
+            return type(value)(value + self.close_tag, open_tokens)
 
         raise InvalidPartialTokenCompositionError()
 
+    def __and__(self, value: "PartialToken") -> "PartialToken":
+        """Composes this token with another one, with the other token nested inside.
+
+        See [`compose_partial_tokens`][pymarkdown_builder.partial_tokens.compose_partial_tokens].
+        """  # noqa: E501
+        if isinstance(value, PartialToken):
+            return compose_partial_tokens(self, value)
+
+        return NotImplemented
+
+
+_composed_tokens: Dict[Tuple[Type[PartialToken], str, str], PartialToken] = {}
+
 
 def create_partial_token(
     open_tag: str,
@@ -123,3 +171,36 @@ def create_partial_token(
         close_tag (Optional[str]): The string that will be appended to the text. If not provided, will use the `open_tag` value.
     """  # noqa: E501
     return PartialToken(open_tag, close_tag)
+
+
+def compose_partial_tokens(*tokens: PartialToken) -> PartialToken:
+    """Composes partial tokens into a single one, each nested inside the previous.
+
+    The tags of the composed token are computed once, so calling it is as cheap as
+        calling a single token. Composed tokens are interned: composing tokens with the
+        same tags returns the same instance. The composed token has the same type as
+        the outermost token.
+
+    Args:
+        *tokens (PartialToken): Unpacked iterable of tokens, from the outermost to the innermost.
+
+    Examples:
+        >>> bold = create_partial_token("**")
+        >>> code = create_partial_token("<code>", "</code>")
+        >>> bold_code = compose_partial_tokens(bold, code)
+        >>> bold_code("hello")
+        '**<code>hello</code>**'
+        >>> bold_code is bold & code
+        True
+    """  # noqa: E501
+    token_type = type(tokens[0]) if len(tokens) > 0 else PartialToken
+    open_tag = "".join(token.open_tag for token in tokens)
+    close_tag = "".join(token.close_tag for token in reversed(tokens))
+    key = (token_type, open_tag, close_tag)
+
+    token = _composed_tokens.get(key)
+
+    if token is None:
+        token = _composed_tokens.setdefault(key, token_type(open_tag, close_tag))
+
+    return token
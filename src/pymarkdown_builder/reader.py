@@ -0,0 +1,308 @@
+"""Reading and incrementally editing existing Markdown files.
+
+A file is read as a sequence of blocks, the same model the
+[`MarkdownBuilder`][pymarkdown_builder.builder.MarkdownBuilder] writes: lines separated by
+blank lines, where fenced code blocks are kept whole and headings are their own blocks.
+
+Sections are located by their heading, and edits only rewrite the file from the
+start of the affected section onwards, leaving everything before it untouched.
+"""  # noqa: E501
+
+import re
+import shutil
+import tempfile
+from os import PathLike
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Union
+
+from typing_extensions import Self
+
+from pymarkdown_builder.builder import MarkdownBuilder
+
+
+_HEADING = re.compile(rb"^ {0,3}(#{1,6})(?:[ \t]+(.*?))?(?:[ \t]+#+)?[ \t]*$")
+_FENCE = re.compile(rb"^ {0,3}(`{3,}|~{3,})")
+
+
+class SectionNotFoundError(Exception):
+    """Raised when a section with the given heading does not exist in the file."""
+
+
+class Block(NamedTuple):
+    """A block of a Markdown file."""
+
+    text: str
+    """The text of the block, without the trailing line break."""
+    start: int
+    """Byte offset where the block starts."""
+    end: int
+    """Byte offset where the block ends, excluding the trailing line break."""
+    level: int
+    """The level of the heading, or `#!python 0` if the block is not a heading."""
+    title: str
+    """The text of the heading, or an empty string if the block is not a heading."""
+
+
+class Section(NamedTuple):
+    """A heading and the blocks up to the next heading of the same or higher level."""
+
+    title: str
+    """The text of the heading."""
+    level: int
+    """The level of the heading."""
+    start: int
+    """Byte offset where the heading starts."""
+    end: int
+    """Byte offset where the last block of the section ends."""
+
+
+def iter_blocks(lines: Iterable[bytes]) -> Iterator[Block]:
+    r"""Splits binary lines of a Markdown document into blocks.
+
+    Only the current block is kept in memory, so this can be used with large files.
+
+    Args:
+        lines (Iterable[bytes]): The lines of the document, including line breaks. A file opened in binary mode can be used.
+
+    Examples:
+        >>> [block.text for block in iter_blocks([b"# Title\n", b"text\n", b"\n", b"more"])]
+        ['# Title', 'text', 'more']
+    """  # noqa: E501
+    offset = 0
+    start = 0
+    end = 0
+    chunks: List[bytes] = []
+    fence: Optional[bytes] = None
+
+    def make_block() -> Block:
+        text = b"".join(chunks).rstrip(b"\r\n").decode("utf-8")
+        return Block(text, start, end, 0, "")
+
+    for line in lines:
+        line_start = offset
+        offset += len(line)
+        content = line.rstrip(b"\r\n")
+        line_end = line_start + len(content)
+
+        if fence is not None:
+            chunks.append(line)
+            end = line_end
+
+            if content.strip().startswith(fence):
+                fence = None
+
+            continue
+
+        if content.strip() == b"":
+            if len(chunks) > 0:
+                yield make_block()
+                chunks.clear()
+
+            continue
+
+        heading = _HEADING.match(content)
+
+        if heading is not None:
+            if len(chunks) > 0:
+                yield make_block()
+                chunks.clear()
+
+            yield Block(
+                content.decode("utf-8"),
+                line_start,
+                line_end,
+                len(heading.group(1)),
+                (heading.group(2) or b"").decode("utf-8"),
+            )
+
+            continue
+
+        opening_fence = _FENCE.match(content)
+
+        if opening_fence is not None:
+            fence = opening_fence.group(1)
+
+        if len(chunks) == 0:
+            start = line_start
+
+        chunks.append(line)
+        end = line_end
+
+    if len(chunks) > 0:
+        yield make_block()
+
+
+class MarkdownFile:
+    r"""A Markdown file on disk that can be read and edited section by section.
+
+    Examples:
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), "CHANGELOG.md")
+        >>> _ = open(path, "w").write("# Changelog\n\n## 1.1\n\nNew\n\n## 1.0\n\nOld\n")
+        >>> _ = MarkdownFile(path).replace_section("1.1", "## 1.1\n\nNewer")
+        >>> open(path).read()
+        '# Changelog\n\n## 1.1\n\nNewer\n\n## 1.0\n\nOld\n'
+    """  # noqa: E501
+
+    path: Union[str, "PathLike[str]"]
+    """Path of the file."""
+
+    def __init__(self, path: Union[str, "PathLike[str]"]) -> None:
+        """Initializes the file.
+
+        Args:
+            path (Union[str, PathLike[str]]): Path of the file.
+        """
+        self.path = path
+
+    def blocks(self) -> Iterator[Block]:
+        """Reads the blocks of the file, one at a time."""
+        with open(self.path, "rb") as file:
+            yield from iter_blocks(file)
+
+    def find_section(
+        self,
+        title: str,
+        level: Optional[int] = None,
+    ) -> Section:
+        """Locates the first section with the given heading.
+
+        Args:
+            title (str): The text of the heading.
+            level (Optional[int]): The level of the heading. If not provided, any level matches.
+
+        Raises:
+            SectionNotFoundError: If there is no such heading.
+        """  # noqa: E501
+        section: Optional[Section] = None
+
+        for block in self.blocks():
+            if section is None:
+                if block.level == 0 or block.title != title:
+                    continue
+
+                if level is not None and block.level != level:
+                    continue
+
+                section = Section(title, block.level, block.start, block.end)
+                continue
+
+            if block.level != 0 and block.level <= section.level:
+                break
+
+            section = section._replace(end=block.end)
+
+        if section is None:
+            raise SectionNotFoundError(f"Section {title!r} was not found.")
+
+        return section
+
+    def replace_section(
+        self,
+        title: str,
+        content: str,
+        level: Optional[int] = None,
+    ) -> Self:
+        """Replaces a whole section, heading included, with the given content.
+
+        Args:
+            title (str): The text of the heading.
+            content (str): The new content of the section, usually starting with its heading.
+            level (Optional[int]): The level of the heading. If not provided, any level matches.
+
+        Raises:
+            SectionNotFoundError: If there is no such heading.
+
+        Returns:
+            The file instance.
+        """  # noqa: E501
+        section = self.find_section(title, level)
+        self._splice(section.start, section.end, content.encode("utf-8"))
+
+        return self
+
+    def insert_before(
+        self,
+        title: str,
+        content: str,
+        level: Optional[int] = None,
+    ) -> Self:
+        """Inserts content as new lines right before a section.
+
+        Args:
+            title (str): The text of the heading.
+            content (str): The content to be inserted.
+            level (Optional[int]): The level of the heading. If not provided, any level matches.
+
+        Raises:
+            SectionNotFoundError: If there is no such heading.
+
+        Returns:
+            The file instance.
+        """  # noqa: E501
+        section = self.find_section(title, level)
+        data = f"{content}\n\n".encode("utf-8")
+        self._splice(section.start, section.start, data)
+
+        return self
+
+    def insert_after(
+        self,
+        title: str,
+        content: str,
+        level: Optional[int] = None,
+    ) -> Self:
+        """Inserts content as new lines at the end of a section.
+
+        Args:
+            title (str): The text of the heading.
+            content (str): The content to be inserted.
+            level (Optional[int]): The level of the heading. If not provided, any level matches.
+
+        Raises:
+            SectionNotFoundError: If there is no such heading.
+
+        Returns:
+            The file instance.
+        """  # noqa: E501
+        section = self.find_section(title, level)
+        data = f"\n\n{content}".encode("utf-8")
+        self._splice(section.end, section.end, data)
+
+        return self
+
+    def to_builder(self) -> MarkdownBuilder:
+        """Loads the whole file into a builder, indexing its headings."""
+        builder = MarkdownBuilder()
+        texts: List[str] = []
+
+        for block in self.blocks():
+            if block.level != 0:
+                builder.headings.add(block.title, block.level)
+
+            texts.append(block.text)
+
+        return builder.write_lines(*texts)
+
+    def _splice(self, start: int, end: int, data: bytes) -> None:
+        """Replaces the bytes between `start` and `end` with `data`.
+
+        The bytes before `start` are never rewritten. If the length changes, the
+            bytes after `end` are moved through a temporary file.
+        """
+        with open(self.path, "r+b") as file:
+            if end - start == len(data):
+                file.seek(start)
+                file.write(data)
+                return
+
+            with tempfile.TemporaryFile() as tail:
+                file.seek(end)
+                shutil.copyfileobj(file, tail)
+
+                file.seek(start)
+                file.write(data)
+
+                tail.seek(0)
+                shutil.copyfileobj(tail, file)
+
+                file.truncate()
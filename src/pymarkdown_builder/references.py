@@ -0,0 +1,157 @@
+"""Reference-style links and images.
+
+Instead of repeating the same URL inline every time it is linked, a
+[`LinkReferences`][pymarkdown_builder.references.LinkReferences] index writes
+`[text][n]` inline, and each `[n]: url` definition is emitted only once.
+"""  # noqa: E501
+
+from typing import Dict, List, Optional, Tuple
+
+from pymarkdown_builder.urls import encode_title, encode_url
+
+
+class LinkReferences:
+    r"""An index of link and image URLs, used to write reference-style links.
+
+    Each distinct URL (and title) is assigned a numeric label the first time it is
+        used. Definitions are kept as pending until they are consumed with
+        [`definitions`][pymarkdown_builder.references.LinkReferences.definitions],
+        so each definition is emitted exactly once, no matter how many times the URL
+        is referenced.
+
+    Examples:
+        >>> refs = LinkReferences()
+        >>> refs.link("https://example.com", "Example")
+        '[Example][1]'
+        >>> refs.link("https://example.com")
+        '[https://example.com][1]'
+        >>> refs.image("https://example.com/image.png", "alt")
+        '![alt][2]'
+        >>> refs.definitions()
+        '[1]: https://example.com\n[2]: https://example.com/image.png'
+        >>> refs.definitions()
+        ''
+    """  # noqa: E501
+
+    def __init__(self) -> None:
+        """Initializes an empty index."""
+        self._labels: Dict[Tuple[str, str], str] = {}
+        self._pending: List[str] = []
+        self._shared = False
+
+    def __len__(self) -> int:
+        """Returns the number of distinct references in the index."""
+        return len(self._labels)
+
+    def copy(self) -> "LinkReferences":
+        """Returns a copy of the index, that can be used independently.
+
+        The references are shared until either index registers a new one, so copying
+            is constant time.
+        """
+        references = LinkReferences()
+        references._labels = self._labels
+        references._pending = self._pending
+        references._shared = self._shared = True
+
+        return references
+
+    def clear(self) -> None:
+        """Removes every reference, including the pending definitions."""
+        if self._shared:
+            self._labels = {}
+            self._pending = []
+            self._shared = False
+        elif len(self._labels) > 0:
+            self._labels.clear()
+            self._pending.clear()
+
+    @property
+    def has_pending(self) -> bool:
+        """Whether there are definitions that have not been emitted yet."""
+        return len(self._pending) > 0
+
+    def label(
+        self,
+        url: str,
+        title: Optional[str] = None,
+    ) -> str:
+        """Returns the label of the given URL, registering it if it is new.
+
+        Args:
+            url (str): The URL to be referenced.
+            title (Optional[str]): The title of the definition. If not provided, will not be set.
+        """  # noqa: E501
+        title = title or ""
+        key = (url, title)
+
+        label = self._labels.get(key)
+
+        if label is None:
+            if self._shared:
+                self._labels = self._labels.copy()
+                self._pending = self._pending.copy()
+                self._shared = False
+
+            label = str(len(self._labels) + 1)
+            self._labels[key] = label
+
+            title = f' "{title}"' if title != "" else ""
+            self._pending.append(f"[{label}]: {url}{title}")
+
+        return label
+
+    def link(
+        self,
+        href: str,
+        text: Optional[str] = None,
+        encode: bool = False,
+    ) -> str:
+        """Creates a reference-style link with `[text][n]` syntax.
+
+        Args:
+            href (str): The href of the link.
+            text (Optional[str]): The text to be shown as the link. If not provided, will use the `href` value.
+            encode (bool): Whether to percent-encode the href in the definition, with [`encode_url`][pymarkdown_builder.urls.encode_url].
+        """  # noqa: E501
+        text = text or href
+
+        if encode:
+            href = encode_url(href)
+
+        return f"[{text}][{self.label(href)}]"
+
+    def image(
+        self,
+        src: str,
+        alt: Optional[str] = None,
+        mouseover: Optional[str] = None,
+        encode: bool = False,
+    ) -> str:
+        """Creates a reference-style image with `![alt][n]` syntax.
+
+        Args:
+            src (str): The source of the image. Can be a path or a URL.
+            alt (Optional[str]): The alt text. If not provided, will use an empty string.
+            mouseover (Optional[str]): The mouseover text. If not provided, will not be set.
+            encode (bool): Whether to percent-encode the source and escape the mouseover text in the definition, with [`encode_url`][pymarkdown_builder.urls.encode_url] and [`encode_title`][pymarkdown_builder.urls.encode_title].
+        """  # noqa: E501
+        alt = alt or ""
+
+        if encode:
+            src = encode_url(src)
+            mouseover = encode_title(mouseover)
+
+        return f"![{alt}][{self.label(src, mouseover)}]"
+
+    def definitions(self) -> str:
+        """Returns the pending definitions, one per line, and marks them as emitted.
+
+        Returns an empty string if every definition was already emitted.
+        """
+        definitions = "\n".join(self._pending)
+        self._pending = []
+
+        return definitions
+
+    img = image
@@ -0,0 +1,262 @@
+"""Sinks, where a streaming [`MarkdownBuilder`][pymarkdown_builder.builder.MarkdownBuilder] writes its content to."""  # noqa: E501
+
+import os
+import secrets
+import shutil
+import threading
+from types import TracebackType
+from typing import BinaryIO, Optional, Type, Union
+
+from typing_extensions import Protocol, Self
+
+
+class Sink(Protocol):
+    """Anything with a `write` method that accepts a `#!python str`.
+
+    Text files, `#!python io.StringIO` and `#!python sys.stdout` are all sinks.
+    """
+
+    def write(self, text: str, /) -> object:
+        """Writes the text to the sink."""
+        ...
+
+
+class ChangeAwareFileSink:
+    """A file sink that only replaces the file if the new content is different.
+
+    While the content matches the existing file, it is only compared, byte by byte,
+        as it is streamed, so nothing is written to disk for unchanged files and
+        their modification time is kept. On the first difference, the matched prefix
+        is copied to a temporary file next to the target, and the rest of the content
+        is written there. On close, the temporary file atomically replaces the target.
+
+    Examples:
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), "page.md")
+        >>> with ChangeAwareFileSink(path) as sink:
+        ...     _ = sink.write("# Page")
+        >>> sink.changed
+        True
+        >>> with ChangeAwareFileSink(path) as sink:
+        ...     _ = sink.write("# Page")
+        >>> sink.changed
+        False
+    """
+
+    path: str
+    """Path of the target file."""
+    encoding: str
+    """Encoding of the target file."""
+    changed: Optional[bool]
+    """Whether the file was replaced. `#!python None` until the sink is closed."""
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        encoding: str = "utf-8",
+    ) -> None:
+        """Initializes the sink.
+
+        Args:
+            path (Union[str, PathLike[str]]): Path of the target file.
+            encoding (str): Encoding of the target file. Defaults to `#!python "utf-8"`.
+        """  # noqa: E501
+        self.path = os.fspath(path)
+        self.encoding = encoding
+        self.changed = None
+
+        self._matched = 0
+        self._temp: Optional[BinaryIO] = None
+        self._temp_path = ""
+
+        try:
+            self._existing: Optional[BinaryIO] = open(self.path, "rb")
+        except FileNotFoundError:
+            self._existing = None
+            self._diverge()
+
+    def write(self, text: str) -> int:
+        """Compares the text with the existing file, or writes it to the temporary file."""  # noqa: E501
+        data = text.encode(self.encoding)
+
+        if self._temp is None:
+            assert self._existing is not None
+
+            if self._existing.read(len(data)) == data:
+                self._matched += len(data)
+                return len(text)
+
+            self._diverge()
+            assert self._temp is not None
+
+        self._temp.write(data)
+
+        return len(text)
+
+    def close(self) -> bool:
+        """Replaces the target file if the content changed.
+
+        Returns:
+            Whether the file was replaced.
+        """
+        if self.changed is not None:
+            return self.changed
+
+        if self._temp is None:
+            assert self._existing is not None
+
+            if self._existing.read(1) == b"":
+                self._existing.close()
+                self.changed = False
+
+                return False
+
+            self._diverge()
+            assert self._temp is not None
+
+        self._temp.close()
+        os.replace(self._temp_path, self.path)
+        self.changed = True
+
+        return True
+
+    def discard(self) -> None:
+        """Leaves the target file untouched, and removes the temporary file."""
+        if self._existing is not None:
+            self._existing.close()
+
+        if self._temp is not None:
+            self._temp.close()
+            os.remove(self._temp_path)
+
+        self.changed = False
+
+    def _diverge(self) -> None:
+        """Starts writing to a temporary file, with the content matched so far."""
+        directory, name = os.path.split(self.path)
+        self._temp_path = os.path.join(directory, f".{name}.{secrets.token_hex(8)}.tmp")
+        self._temp = open(self._temp_path, "xb")
+
+        if self._existing is None:
+            return
+
+        shutil.copymode(self.path, self._temp_path)
+
+        self._existing.seek(0)
+        remaining = self._matched
+
+        while remaining > 0:
+            chunk = self._existing.read(min(remaining, 1024 * 1024))
+            self._temp.write(chunk)
+            remaining -= len(chunk)
+
+        self._existing.close()
+        self._existing = None
+
+    def __enter__(self) -> Self:
+        """Returns the sink."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Closes the sink, or discards the content if an exception was raised."""
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+
+class ChangeAwareWriter:
+    """Opens [`ChangeAwareFileSink`][pymarkdown_builder.sinks.ChangeAwareFileSink]s, and counts how many files were written or skipped.
+
+    Safe to be shared by multiple threads.
+
+    Examples:
+        >>> import os, tempfile
+        >>> from pymarkdown_builder import MarkdownBuilder
+        >>> directory = tempfile.mkdtemp()
+        >>> writer = ChangeAwareWriter()
+        >>> for name in ("a.md", "b.md", "a.md"):
+        ...     with writer.open(os.path.join(directory, name)) as sink:
+        ...         _ = MarkdownBuilder(sink=sink).lines("# Page").finalize()
+        >>> writer.written, writer.skipped
+        (2, 1)
+    """  # noqa: E501
+
+    written: int
+    """Number of files that were replaced or created."""
+    skipped: int
+    """Number of files that were left untouched, because their content did not change."""  # noqa: E501
+
+    def __init__(self) -> None:
+        """Initializes the writer."""
+        self.written = 0
+        self.skipped = 0
+        self._lock = threading.Lock()
+
+    def open(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        encoding: str = "utf-8",
+    ) -> "_CountingFileSink":
+        """Opens a sink for the given file.
+
+        Args:
+            path (Union[str, PathLike[str]]): Path of the target file.
+            encoding (str): Encoding of the target file. Defaults to `#!python "utf-8"`.
+        """  # noqa: E501
+        return _CountingFileSink(self, path, encoding)
+
+    def write(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        content: str,
+        encoding: str = "utf-8",
+    ) -> bool:
+        """Writes the content to the file, if it changed.
+
+        Args:
+            path (Union[str, PathLike[str]]): Path of the target file.
+            content (str): The content of the file.
+            encoding (str): Encoding of the target file. Defaults to `#!python "utf-8"`.
+
+        Returns:
+            Whether the file was replaced.
+        """  # noqa: E501
+        with self.open(path, encoding) as sink:
+            sink.write(content)
+
+        return bool(sink.changed)
+
+    def _count(self, changed: bool) -> None:
+        with self._lock:
+            if changed:
+                self.written += 1
+            else:
+                self.skipped += 1
+
+
+class _CountingFileSink(ChangeAwareFileSink):
+    """A change aware file sink that reports to a writer when closed."""
+
+    def __init__(
+        self,
+        writer: ChangeAwareWriter,
+        path: Union[str, "os.PathLike[str]"],
+        encoding: str,
+    ) -> None:
+        self._writer = writer
+        super().__init__(path, encoding)
+
+    def close(self) -> bool:
+        already_closed = self.changed is not None
+        changed = super().close()
+
+        if not already_closed:
+            self._writer._count(changed)
+
+        return changed
@@ -0,0 +1,236 @@
+"""Incremental table building, with compact column storage.
+
+Cells are stored column by column. Columns with few distinct values, such as a test
+status, are dictionary encoded: each distinct value is stored once, and each cell is
+a one, two or four byte code into it. Columns with too many distinct values fall back
+to a plain list of strings.
+"""
+
+from array import array
+from itertools import repeat
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class _Column:
+    """A column of cells, dictionary encoded while it has few distinct values."""
+
+    __slots__ = ("values", "index", "codes", "cells", "width", "max_values")
+
+    def __init__(self, max_values: int) -> None:
+        self.values: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.codes = array("B")
+        self.cells: Optional[List[str]] = None
+        self.width = 0
+        self.max_values = max_values
+
+    def append(self, cell: str) -> None:
+        if len(cell) > self.width:
+            self.width = len(cell)
+
+        if self.cells is not None:
+            self.cells.append(cell)
+            return
+
+        code = self.index.get(cell)
+
+        if code is None:
+            code = len(self.values)
+
+            if code == self.max_values:
+                self._decode()
+                self.cells.append(cell)
+                return
+
+            if code == 256 or code == 65536:
+                # widen the codes from one to two bytes, and from two to four
+                self.codes = array("H" if code == 256 else "I", self.codes)
+
+            self.index[cell] = code
+            self.values.append(cell)
+
+        self.codes.append(code)
+
+    def _decode(self) -> None:
+        """Stops dictionary encoding, storing every cell as a string."""
+        self.cells = list(map(self.values.__getitem__, self.codes))
+        self.values = []
+        self.index = {}
+        self.codes = array("B")
+
+    def slice(self, start: int, stop: int, width: int = 0) -> Iterable[str]:
+        """Returns the cells from `start` to `stop`, left-justified to `width`."""
+        if self.cells is not None:
+            cells = self.cells[start:stop]
+
+            return map(str.ljust, cells, repeat(width)) if width > 0 else cells
+
+        values = self.values
+
+        if width > 0:
+            values = [value.ljust(width) for value in values]
+
+        return map(values.__getitem__, self.codes[start:stop])
+
+
+class TableBuilder:
+    r"""Builds a table one row at a time, rendering it once at the end.
+
+    Uses much less memory than a list of rows, especially for columns with few
+        distinct values, and keeps track of the width of each column as rows are added.
+
+    Examples:
+        >>> table = TableBuilder("test", "status")
+        >>> table.add_row("test_a", "passed").add_row("test_b", "failed")
+        TableBuilder('test', 'status')
+        >>> table.render()
+        'test | status\n--- | ---\ntest_a | passed\ntest_b | failed'
+        >>> table.widths
+        [6, 6]
+    """  # noqa: E501
+
+    header: Tuple[str, ...]
+    """The header of the table."""
+
+    def __init__(
+        self,
+        *header: str,
+        max_dictionary_size: int = 1024,
+    ) -> None:
+        """Initializes the table builder.
+
+        Args:
+            *header (str): Unpacked iterable of header cells.
+            max_dictionary_size (int): Maximum number of distinct values of a dictionary encoded column. Columns with more distinct values are stored as plain strings. Defaults to `#!python 1024`.
+        """  # noqa: E501
+        self.header = header
+        self._columns = [_Column(max_dictionary_size) for _ in header]
+        self._length = 0
+
+    def __repr__(self) -> str:
+        """Returns the representation of the table builder, with its header."""
+        return f"{type(self).__name__}({', '.join(map(repr, self.header))})"
+
+    def __len__(self) -> int:
+        """Returns the number of body rows."""
+        return self._length
+
+    def __str__(self) -> str:
+        """Renders the table. Same as [`render`][pymarkdown_builder.table_builder.TableBuilder.render]."""  # noqa: E501
+        return self.render()
+
+    @property
+    def widths(self) -> List[int]:
+        """The width of each column, including the header."""
+        return [
+            max(len(header), column.width)
+            for header, column in zip(self.header, self._columns)
+        ]
+
+    def add_row(
+        self,
+        *cells: str,
+    ) -> "TableBuilder":
+        """Adds a row to the table.
+
+        Args:
+            *cells (str): Unpacked iterable of cells. Must have one cell per column.
+
+        Returns:
+            The table builder itself, so calls can be chained.
+        """
+        if len(cells) != len(self._columns):
+            raise ValueError(f"Expected {len(self._columns)} cells, got {len(cells)}.")
+
+        for column, cell in zip(self._columns, cells):
+            column.append(cell)
+
+        self._length += 1
+
+        return self
+
+    def add_rows(
+        self,
+        rows: Iterable[Iterable[str]],
+    ) -> "TableBuilder":
+        """Adds each row to the table.
+
+        Args:
+            rows (Iterable[Iterable[str]]): Iterable of rows. Each row must have one cell per column.
+
+        Returns:
+            The table builder itself, so calls can be chained.
+        """  # noqa: E501
+        for row in rows:
+            self.add_row(*row)
+
+        return self
+
+    def iter_render(
+        self,
+        aligned: bool = False,
+        chunk_size: int = 1024,
+    ) -> Iterator[str]:
+        r"""Renders the table, yielding one chunk of rows at a time.
+
+        The first chunk is the header and the divider, and each following chunk starts
+            with a line break, so the chunks can be written to a stream as they come.
+            Nothing is yielded if the table has no body rows, the same as
+            [`Tokens.table`][pymarkdown_builder.tokens.Tokens.table].
+
+        Args:
+            aligned (bool): Whether to pad the cells so the columns are aligned.
+            chunk_size (int): Number of rows in each chunk. Defaults to `#!python 1024`.
+
+        Examples:
+            >>> table = TableBuilder("a", "b").add_rows([["1", "2"], ["3", "4"]])
+            >>> list(table.iter_render(chunk_size=1))
+            ['a | b\n--- | ---', '\n1 | 2', '\n3 | 4']
+        """  # noqa: E501
+        if self._length == 0 or len(self._columns) == 0:
+            return
+
+        if aligned:
+            widths = [max(width, 3) for width in self.widths]
+            # the last column is not padded, to avoid trailing spaces
+            paddings = [*widths[:-1], 0]
+            header = " | ".join(map(str.ljust, self.header, paddings))
+            divider = " | ".join("-" * width for width in widths)
+        else:
+            paddings = [0] * len(self._columns)
+            header = " | ".join(self.header)
+            divider = " | ".join("---" for _ in self.header)
+
+        yield f"{header}\n{divider}"
+
+        for start in range(0, self._length, chunk_size):
+            stop = start + chunk_size
+            columns = (
+                column.slice(start, stop, padding)
+                for column, padding in zip(self._columns, paddings)
+            )
+
+            yield "\n" + "\n".join(map(" | ".join, zip(*columns)))
+
+    def render(
+        self,
+        aligned: bool = False,
+    ) -> str:
+        r"""Renders the table. Without alignment, gives the same result as [`Tokens.table`][pymarkdown_builder.tokens.Tokens.table].
+
+        Args:
+            aligned (bool): Whether to pad the cells so the columns are aligned.
+
+        Examples:
+            >>> table = TableBuilder("name", "status").add_row("a", "passed")
+            >>> table.render(aligned=True)
+            'name | status\n---- | ------\na    | passed'
+        """  # noqa: E501
+        return "".join(self.iter_render(aligned))
+
+    def rows(self) -> Iterator[Tuple[str, ...]]:
+        """Yields each body row, decoded."""
+        for start in range(0, self._length, 1024):
+            stop = start + 1024
+
+            yield from zip(*(column.slice(start, stop) for column in self._columns))
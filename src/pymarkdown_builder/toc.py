@@ -0,0 +1,150 @@
+"""Heading index and table of contents generation.
+
+Headings are indexed as they are written, so a table of contents can be rendered
+without scanning the document for `#` lines.
+"""
+
+import re
+from typing import Dict, List, NamedTuple, Set
+
+
+_SLUG_IGNORED_CHARS = re.compile(r"[^\w\- ]")
+
+
+def slugify(text: str) -> str:
+    """Creates an anchor slug from a heading text, the same way GitHub does.
+
+    The text is lowercased, punctuation is removed and spaces are replaced by `-`.
+
+    Args:
+        text (str): The text of the heading.
+
+    Examples:
+        >>> slugify("Hello, World!")
+        'hello-world'
+        >>> slugify("What's new in v1.2?")
+        'whats-new-in-v12'
+    """
+    return _SLUG_IGNORED_CHARS.sub("", text.strip().lower()).replace(" ", "-")
+
+
+class HeadingEntry(NamedTuple):
+    """A heading recorded in a [`HeadingIndex`][pymarkdown_builder.toc.HeadingIndex]."""  # noqa: E501
+
+    text: str
+    """The text of the heading."""
+    level: int
+    """The level of the heading, between `#!python 1` and `#!python 6`."""
+    anchor: str
+    """The anchor slug of the heading, unique within the index."""
+
+
+class HeadingIndex:
+    r"""An index of the headings of a document, in the order they were written.
+
+    Anchors are resolved the same way GitHub does: repeated slugs get a `-1`,
+        `-2`, ... suffix.
+
+    Examples:
+        >>> index = HeadingIndex()
+        >>> index.add("Usage", 1)
+        'usage'
+        >>> index.add("Example", 2)
+        'example'
+        >>> index.add("Example", 2)
+        'example-1'
+        >>> index.render()
+        '- [Usage](#usage)\n  - [Example](#example)\n  - [Example](#example-1)'
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty index."""
+        self.entries: List[HeadingEntry] = []
+        """The recorded headings."""
+        self._slug_counts: Dict[str, int] = {}
+        self._anchors: Set[str] = set()
+        self._shared = False
+
+    def __len__(self) -> int:
+        """Returns the number of recorded headings."""
+        return len(self.entries)
+
+    def copy(self) -> "HeadingIndex":
+        """Returns a copy of the index, that can be used independently.
+
+        The headings are shared until either index records a new one, so copying is
+            constant time.
+        """
+        index = HeadingIndex()
+        index.entries = self.entries
+        index._slug_counts = self._slug_counts
+        index._anchors = self._anchors
+        index._shared = self._shared = True
+
+        return index
+
+    def clear(self) -> None:
+        """Removes every recorded heading."""
+        if self._shared:
+            self.entries = []
+            self._slug_counts = {}
+            self._anchors = set()
+            self._shared = False
+        elif len(self.entries) > 0:
+            self.entries.clear()
+            self._slug_counts.clear()
+            self._anchors.clear()
+
+    def add(
+        self,
+        text: str,
+        level: int,
+    ) -> str:
+        """Records a heading and returns its collision-resolved anchor.
+
+        Args:
+            text (str): The text of the heading.
+            level (int): The level of the heading.
+        """
+        if self._shared:
+            self.entries = self.entries.copy()
+            self._slug_counts = self._slug_counts.copy()
+            self._anchors = self._anchors.copy()
+            self._shared = False
+
+        slug = slugify(text)
+        count = self._slug_counts.get(slug, 0)
+        anchor = slug if count == 0 else f"{slug}-{count}"
+
+        while anchor in self._anchors:
+            count += 1
+            anchor = f"{slug}-{count}"
+
+        self._slug_counts[slug] = count + 1
+        self._anchors.add(anchor)
+        self.entries.append(HeadingEntry(text, level, anchor))
+
+        return anchor
+
+    def render(
+        self,
+        max_level: int = 6,
+    ) -> str:
+        """Renders the index as a nested unordered list of links to the headings.
+
+        Nesting is relative to the highest level (smallest number) in the index.
+
+        Args:
+            max_level (int): Headings deeper than this level are left out. Defaults to `#!python 6`.
+        """  # noqa: E501
+        entries = [entry for entry in self.entries if entry.level <= max_level]
+
+        if len(entries) == 0:
+            return ""
+
+        base_level = min(entry.level for entry in entries)
+
+        return "\n".join(
+            f"{'  ' * (entry.level - base_level)}- [{entry.text}](#{entry.anchor})"
+            for entry in entries
+        )
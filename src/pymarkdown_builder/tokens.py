@@ -1,8 +1,105 @@
 """Markdown tokens. These are the building blocks of a markdown document."""
 
-from typing import Dict, Iterable, Optional
+from itertools import chain, islice
+from typing import Dict, Iterable, Iterator, Optional, Tuple
 
 from pymarkdown_builder.partial_tokens import create_partial_token
+from pymarkdown_builder.toc import HeadingIndex
+from pymarkdown_builder.urls import encode_title, encode_url
+from pymarkdown_builder.wrap import wrap
+
+
+class HeadingContent(str):
+    """An "overloaded" string that remembers the text and level of a heading.
+
+    Returned by [`Tokens.heading`][pymarkdown_builder.tokens.Tokens.heading], so the
+        [`MarkdownBuilder`][pymarkdown_builder.builder.MarkdownBuilder] can index
+        headings as they are written.
+    """  # noqa: E501
+
+    text: str
+    """The text of the heading."""
+    level: int
+    """The level of the heading."""
+
+    def __new__(cls, text: str, level: int):
+        """Creates a new heading content."""
+        content = super().__new__(cls, f"{'#' * level} {text}")
+        content.text = text
+        content.level = level
+
+        return content
+
+    def __getnewargs__(self) -> Tuple[str, int]:
+        """Returns the arguments of `__new__`, so headings can be pickled and copied."""
+        return (self.text, self.level)
+
+    def with_anchor(self, anchor: str) -> str:
+        """Returns the heading as written with its collision-resolved anchor.
+
+        Markdown anchors are implicit, so the heading is returned as it is.
+        """
+        return self
+
+
+_TABLE_BLOCK_SIZE = 1024
+"""Number of table rows joined at a time."""
+
+
+def _with_line_breaks(lines: Iterable[str]) -> Iterator[str]:
+    """Yields the lines, prepending a line break to all but the first one."""
+    lines_iter = iter(lines)
+    first_line = next(lines_iter, None)
+
+    if first_line is None:
+        return
+
+    yield first_line
+
+    for line in lines_iter:
+        yield "\n" + line
+
+
+def _list_items(
+    items: Iterable[str],
+    marker: str,
+    width: Optional[int],
+) -> Iterator[str]:
+    """Yields each item prepended with the marker, hard-wrapped if `width` is set."""
+    if width is None:
+        return (f"{marker}{item}" for item in items)
+
+    indent = " " * len(marker)
+
+    return (wrap(item, width, marker, indent) for item in items)
+
+
+def _iter_table(
+    header_row: Iterable[str], rows: Iterator[Iterable[str]]
+) -> Iterator[str]:
+    """Yields the header and the divider, then the rows in blocks.
+
+    Rows are rendered and joined in blocks of `_TABLE_BLOCK_SIZE` lines, so only one
+        block of line strings is alive at a time, instead of one string per row of
+        the whole table. Each block starts with a line break.
+    """
+    header_row = list(header_row)
+    first_row = next(rows, None)
+
+    if first_row is None:
+        return
+
+    rows = chain((first_row,), rows)
+
+    yield " | ".join(header_row) + "\n" + " | ".join("---" for _ in header_row)
+
+    while True:
+        lines = list(map(" | ".join, islice(rows, _TABLE_BLOCK_SIZE)))
+
+        if len(lines) == 0:
+            break
+
+        yield "\n" + "\n".join(lines)
 
 
 class Tokens:
@@ -12,7 +109,7 @@ class Tokens:
     def heading(
         text: str,
         level: Optional[int] = None,
-    ) -> str:
+    ) -> HeadingContent:
         """Creates a heading with the given level by by prepending the text with `#`.
 
         Args:
@@ -30,7 +127,7 @@ class Tokens:
         if level < 1 or level > 6:
             raise ValueError("Level must be between 1 and 6.")
 
-        return f"{'#' * level} {text}"
+        return HeadingContent(text, level)
 
     @staticmethod
     def h1(
@@ -77,32 +174,46 @@ class Tokens:
     @staticmethod
     def paragraph(
         text: str,
+        width: Optional[int] = None,
     ) -> str:
-        """Creates a paragraph. In fact, will just return the text.
+        r"""Creates a paragraph. In fact, will just return the text, unless a `width` is given.
 
         Args:
             text (str): The text of the paragraph.
+            width (Optional[int]): Width to hard-wrap the text at. See [`wrap`][pymarkdown_builder.wrap.wrap]. If not provided, will not wrap.
 
         Examples:
             >>> Tokens.paragraph("Hello, world!")
             'Hello, world!'
+            >>> Tokens.paragraph("Hello, world!", width=6)
+            'Hello,\nworld!'
         """  # noqa: E501
-        return text
+        if width is None:
+            return text
+
+        return wrap(text, width)
 
     @staticmethod
     def quote(
         text: str,
+        width: Optional[int] = None,
     ) -> str:
-        """Creates a quote by prepending the text with `>`.
+        r"""Creates a quote by prepending the text with `>`.
 
         Args:
             text (str): The text of the quote.
+            width (Optional[int]): Width to hard-wrap the text at, including the `>` prefix of each line. If not provided, will not wrap.
 
         Examples:
             >>> Tokens.quote("Hello, world!")
             '> Hello, world!'
-        """
-        return f"> {text}"
+            >>> Tokens.quote("Hello, world!", width=8)
+            '> Hello,\n> world!'
+        """  # noqa: E501
+        if width is None:
+            return f"> {text}"
+
+        return wrap(text, width, "> ", "> ")
 
     @staticmethod
     def horizontal_rule() -> str:
@@ -118,21 +229,28 @@ class Tokens:
     def link(
         href: str,
         text: Optional[str] = None,
+        encode: bool = False,
     ) -> str:
         """Creates a link with `[text](href)` syntax.
 
         Args:
             href (str): The href of the link.
             text (Optional[str]): The text to be shown as the link. If not provided, will use the `href` value.
+            encode (bool): Whether to percent-encode the href with [`encode_url`][pymarkdown_builder.urls.encode_url], so spaces, parentheses and quotes do not break the link.
 
         Examples:
             >>> Tokens.link("https://example.com")
             '[https://example.com](https://example.com)'
             >>> Tokens.link("https://example.com", "Example")
             '[Example](https://example.com)'
+            >>> Tokens.link("docs/a file.md", "A file", encode=True)
+            '[A file](docs/a%20file.md)'
         """  # noqa: E501
         text = text or href
 
+        if encode:
+            href = encode_url(href)
+
         return f"[{text}]({href})"
 
     @staticmethod
@@ -140,6 +258,7 @@ class Tokens:
         src: str,
         alt: Optional[str] = None,
         mouseover: Optional[str] = None,
+        encode: bool = False,
     ):
         """Creates an image with `![alt](src "mouseover")` syntax.
 
@@ -147,6 +266,7 @@ class Tokens:
             src (str): The source of the image. Can be a path or a URL.
             alt (Optional[str]): The alt text. If not provided, will use an empty string.
             mouseover (Optional[str]): The mouseover text. If not provided, will not be set.
+            encode (bool): Whether to percent-encode the source with [`encode_url`][pymarkdown_builder.urls.encode_url], and escape the mouseover text with [`encode_title`][pymarkdown_builder.urls.encode_title].
 
         Examples:
             >>> Tokens.image("https://example.com/image.png")
@@ -156,6 +276,10 @@ class Tokens:
         """  # noqa: E501
         alt = alt or ""
 
+        if encode:
+            src = encode_url(src)
+            mouseover = encode_title(mouseover)
+
         if mouseover is None:
             mouseover = ""
 
@@ -186,32 +310,112 @@ class Tokens:
     @staticmethod
     def unordered_list(
         *items: str,
+        width: Optional[int] = None,
     ) -> str:
         r"""Creates an unordered list by prepending each item with `- `.
 
         Args:
             *items (Iterable[str]): Unpacked iterable of items to be listed.
+            width (Optional[int]): Width to hard-wrap each item at, including the marker. Continuation lines are indented. If not provided, will not wrap.
 
         Examples:
             >>> Tokens.unordered_list("Hello", "World")
             '- Hello\n- World'
-        """
-        return "\n".join(f"- {item}" for item in items)
+            >>> Tokens.unordered_list("Hello, world!", width=9)
+            '- Hello,\n  world!'
+        """  # noqa: E501
+        return Tokens.unordered_list_from(items, width)
+
+    @staticmethod
+    def unordered_list_from(
+        items: Iterable[str],
+        width: Optional[int] = None,
+    ) -> str:
+        r"""Creates an unordered list from an iterable of items, consuming it lazily.
+
+        Args:
+            items (Iterable[str]): Iterable of items to be listed, such as a generator.
+            width (Optional[int]): Width to hard-wrap each item at, including the marker. Continuation lines are indented. If not provided, will not wrap.
+
+        Examples:
+            >>> Tokens.unordered_list_from(item for item in ("Hello", "World"))
+            '- Hello\n- World'
+        """  # noqa: E501
+        return "\n".join(_list_items(items, "- ", width))
+
+    @staticmethod
+    def iter_unordered_list(
+        items: Iterable[str],
+        width: Optional[int] = None,
+    ) -> Iterator[str]:
+        r"""Yields the unordered list one item at a time, each after the first starting with a line break.
+
+        Joining the chunks gives the same result as [`unordered_list_from`][pymarkdown_builder.tokens.Tokens.unordered_list_from].
+
+        Args:
+            items (Iterable[str]): Iterable of items to be listed, such as a generator.
+            width (Optional[int]): Width to hard-wrap each item at, including the marker. Continuation lines are indented. If not provided, will not wrap.
+
+        Examples:
+            >>> list(Tokens.iter_unordered_list(["Hello", "World"]))
+            ['- Hello', '\n- World']
+        """  # noqa: E501
+        return _with_line_breaks(_list_items(items, "- ", width))
 
     @staticmethod
     def ordered_list(
         *items: str,
+        width: Optional[int] = None,
     ) -> str:
         r"""Creates an ordered list by prepending each item with `1. `.
 
         Args:
             *items (Iterable[str]): Unpacked iterable of items to be listed.
+            width (Optional[int]): Width to hard-wrap each item at, including the marker. Continuation lines are indented. If not provided, will not wrap.
 
         Examples:
             >>> Tokens.ordered_list("Hello", "World")
             '1. Hello\n1. World'
-        """
-        return "\n".join(f"1. {item}" for item in items)
+            >>> Tokens.ordered_list("Hello, world!", width=10)
+            '1. Hello,\n   world!'
+        """  # noqa: E501
+        return Tokens.ordered_list_from(items, width)
+
+    @staticmethod
+    def ordered_list_from(
+        items: Iterable[str],
+        width: Optional[int] = None,
+    ) -> str:
+        r"""Creates an ordered list from an iterable of items, consuming it lazily.
+
+        Args:
+            items (Iterable[str]): Iterable of items to be listed, such as a generator.
+            width (Optional[int]): Width to hard-wrap each item at, including the marker. Continuation lines are indented. If not provided, will not wrap.
+
+        Examples:
+            >>> Tokens.ordered_list_from(item for item in ("Hello", "World"))
+            '1. Hello\n1. World'
+        """  # noqa: E501
+        return "\n".join(_list_items(items, "1. ", width))
+
+    @staticmethod
+    def iter_ordered_list(
+        items: Iterable[str],
+        width: Optional[int] = None,
+    ) -> Iterator[str]:
+        r"""Yields the ordered list one item at a time, each after the first starting with a line break.
+
+        Joining the chunks gives the same result as [`ordered_list_from`][pymarkdown_builder.tokens.Tokens.ordered_list_from].
+
+        Args:
+            items (Iterable[str]): Iterable of items to be listed, such as a generator.
+            width (Optional[int]): Width to hard-wrap each item at, including the marker. Continuation lines are indented. If not provided, will not wrap.
+
+        Examples:
+            >>> list(Tokens.iter_ordered_list(["Hello", "World"]))
+            ['1. Hello', '\n1. World']
+        """  # noqa: E501
+        return _with_line_breaks(_list_items(items, "1. ", width))
 
     @staticmethod
     def table(
@@ -226,24 +430,46 @@ class Tokens:
             >>> Tokens.table(["name", "age"], ["John", "20"], ["Jane", "19"])
             'name | age\n--- | ---\nJohn | 20\nJane | 19'
         """  # noqa: E501
-        rows_iter = iter(rows)
-        header_row = next(rows_iter, None)
+        return Tokens.table_from(rows)
 
-        if header_row is None:
-            return ""
+    @staticmethod
+    def table_from(
+        rows: Iterable[Iterable[str]],
+    ) -> str:
+        r"""Creates a table from an iterable of rows, consuming it lazily.
 
-        header_row = list(header_row)
+        Args:
+            rows (Iterable[Iterable[str]]): Iterable of rows, such as a generator. The first row is the header, and the rest are the body.
 
-        first_row = next(rows_iter, None)
+        Examples:
+            >>> Tokens.table_from(iter([["name", "age"], ["John", "20"]]))
+            'name | age\n--- | ---\nJohn | 20'
+        """  # noqa: E501
+        return "".join(Tokens.iter_table(rows))
 
-        if first_row is None:
-            return ""
+    @staticmethod
+    def iter_table(
+        rows: Iterable[Iterable[str]],
+    ) -> Iterator[str]:
+        r"""Yields the table in chunks: the header and the divider, then blocks of rows, each starting with a line break.
+
+        Joining the chunks gives the same result as [`table_from`][pymarkdown_builder.tokens.Tokens.table_from].
+            Nothing is yielded if there are no body rows.
+
+        Args:
+            rows (Iterable[Iterable[str]]): Iterable of rows, such as a generator. The first row is the header, and the rest are the body.
+
+        Examples:
+            >>> list(Tokens.iter_table([["name", "age"], ["John", "20"]]))
+            ['name | age\n--- | ---', '\nJohn | 20']
+        """  # noqa: E501
+        rows_iter = iter(rows)
+        header_row = next(rows_iter, None)
 
-        header_str = " | ".join(header_row)
-        divider_str = " | ".join("---" for _ in header_row)
-        body_str = "\n".join((" | ".join(row) for row in (first_row, *rows_iter)))
+        if header_row is None:
+            return iter(())
 
-        return "\n".join((header_str, divider_str, body_str))
+        return _iter_table(header_row, rows_iter)
 
     @staticmethod
     def table_from_dicts(
@@ -260,24 +486,76 @@ class Tokens:
             >>> Tokens.table_from_dicts({"name": "John", "age": "20"}, {"name": "Jane", "age": "19"})
             'name | age\n--- | ---\nJohn | 20\nJane | 19'
         """  # noqa: E501
+        return Tokens.table_from_dict_rows(dicts, header)
+
+    @staticmethod
+    def table_from_dict_rows(
+        dicts: Iterable[Dict[str, str]],
+        header: Iterable[str] | None = None,
+    ) -> str:
+        r"""Creates a table from an iterable of dicts, consuming it lazily.
+
+        Args:
+            dicts (Iterable[Dict[str, str]]): Iterable of dicts, such as a generator. Each dict will be a row.
+            header (Iterable[str] | None): Custom table header. If not provided, will use the keys of the first dict.
+
+        Examples:
+            >>> Tokens.table_from_dict_rows({"name": name} for name in ("John", "Jane"))
+            'name\n---\nJohn\nJane'
+        """  # noqa: E501
+        return "".join(Tokens.iter_table_from_dicts(dicts, header))
+
+    @staticmethod
+    def iter_table_from_dicts(
+        dicts: Iterable[Dict[str, str]],
+        header: Iterable[str] | None = None,
+    ) -> Iterator[str]:
+        """Yields the table in chunks, the same as [`iter_table`][pymarkdown_builder.tokens.Tokens.iter_table], from an iterable of dicts.
+
+        Args:
+            dicts (Iterable[Dict[str, str]]): Iterable of dicts, such as a generator. Each dict will be a row.
+            header (Iterable[str] | None): Custom table header. If not provided, will use the keys of the first dict.
+        """  # noqa: E501
         dicts_iter = iter(dicts)
         first_row = next(dicts_iter, None)
 
         if first_row is None:
-            return ""
+            return iter(())
 
         header = header or list(first_row.keys())
-        body = ((value for value in row.values()) for row in (first_row, *dicts_iter))
+        body = (row.values() for row in chain((first_row,), dicts_iter))
+
+        return _iter_table(header, body)
 
-        return Tokens.table(*(header, *body))
+    @staticmethod
+    def table_of_contents(
+        index: HeadingIndex,
+        max_level: int = 6,
+    ) -> str:
+        r"""Creates a table of contents from a heading index, as a nested list of links.
+
+        Args:
+            index (HeadingIndex): The index of the headings, such as the [`headings`][pymarkdown_builder.builder.MarkdownBuilder.headings] of a builder.
+            max_level (int): Headings deeper than this level are left out. Defaults to `#!python 6`.
+
+        Examples:
+            >>> index = HeadingIndex()
+            >>> _ = index.add("Usage", 1), index.add("Example", 2)
+            >>> Tokens.table_of_contents(index)
+            '- [Usage](#usage)\n  - [Example](#example)'
+        """  # noqa: E501
+        return index.render(max_level)
 
     # short tokens
     h = heading
     p = paragraph
     ul = unordered_list
     ol = ordered_list
+    ul_from = unordered_list_from
+    ol_from = ordered_list_from
     hr = horizontal_rule
     img = image
+    toc = table_of_contents
 
     bold = create_partial_token("**")
     """Creates bold text by wrapping the text with `**`.
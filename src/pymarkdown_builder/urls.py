@@ -0,0 +1,116 @@
+"""Encoding of URLs and titles, so they can be safely used in links and images.
+
+URLs are percent-encoded with translation tables, precomputed for ASCII characters
+and filled in for other characters as they are first seen. Encoded URLs are
+cached, since reports tend to link to the same URLs over and over.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
+
+
+_SAFE = (
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+    # unreserved and reserved characters that do not break Markdown destinations
+    "-._~:/?#@!$&'*+,;="
+)
+
+_needs_encoding = re.compile(
+    # percent signs are safe only when they start a percent-encoding
+    f"[^{re.escape(_SAFE)}%]|%(?![0-9A-Fa-f]{{2}})"
+).search
+_restore_encodings = re.compile("%25(?=[0-9A-Fa-f]{2})").sub
+
+
+def _encode_char(char: str) -> str:
+    """Returns the character if it is safe, or its percent-encoding."""
+    if char in _SAFE:
+        return char
+
+    data = char.encode("utf-8", "surrogatepass")
+
+    return "".join(f"%{byte:02X}" for byte in data)
+
+
+_ASCII_TABLE = {code: _encode_char(chr(code)) for code in range(128)}
+"""Translation table of ASCII URLs. A plain dict, which `str.translate` looks up
+faster than a dict subclass."""
+
+
+class _EncodingTable(Dict[int, str]):
+    """Translation table of other URLs, filled in as characters are first seen."""
+
+    def __missing__(self, code: int) -> str:
+        encoded = _encode_char(chr(code))
+        self[code] = encoded
+
+        return encoded
+
+
+_TABLE = _EncodingTable(_ASCII_TABLE)
+
+_TITLE_TABLE = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": " ", "\r": ""})
+
+
+@lru_cache(maxsize=8192)
+def encode_url(url: str) -> str:
+    r"""Percent-encodes the characters of the URL that are not safe in Markdown links.
+
+    Spaces, parentheses, angle brackets, quotes and non-ASCII characters are encoded.
+        Existing percent-encodings are kept, so encoding a URL twice gives the same
+        result, while stray percent signs are encoded as `%25`. The last 8192
+        distinct URLs are cached.
+
+    Args:
+        url (str): The URL to be encoded.
+
+    Examples:
+        >>> encode_url("https://example.com/a file (1).md")
+        'https://example.com/a%20file%20%281%29.md'
+        >>> encode_url("https://example.com/caf%C3%A9?q=é")
+        'https://example.com/caf%C3%A9?q=%C3%A9'
+        >>> encode_url("reports/100% done.md")
+        'reports/100%25%20done.md'
+    """  # noqa: E501
+    if _needs_encoding(url) is None:
+        return url
+
+    encoded = url.translate(_ASCII_TABLE if url.isascii() else _TABLE)
+
+    if "%" in url:
+        # the percent signs of existing percent-encodings were encoded too
+        encoded = _restore_encodings("%", encoded)
+
+    return encoded
+
+
+def encode_urls(urls: Iterable[str]) -> List[str]:
+    """Encodes a column of URLs, such as the links of a table.
+
+    Args:
+        urls (Iterable[str]): Iterable of URLs to be encoded.
+
+    Examples:
+        >>> encode_urls(["a b.md", "c.md", "a b.md"])
+        ['a%20b.md', 'c.md', 'a%20b.md']
+    """
+    return list(map(encode_url, urls))
+
+
+def encode_title(title: Optional[str]) -> Optional[str]:
+    r"""Escapes the title of a link or image, to be placed between double quotes.
+
+    Backslashes and double quotes are escaped, and line breaks are replaced by spaces.
+
+    Args:
+        title (Optional[str]): The title to be escaped. `#!python None` is returned as it is.
+
+    Examples:
+        >>> encode_title('a "quoted" title')
+        'a \\"quoted\\" title'
+    """  # noqa: E501
+    if title is None:
+        return None
+
+    return title.translate(_TITLE_TABLE)
@@ -0,0 +1,206 @@
+"""Fast hard-wrapping of Markdown text.
+
+Text is wrapped with a greedy algorithm, in a single pass. Links, images and inline
+code spans are never broken, even if they contain spaces. Closing delimiters are
+searched once and reused, so unclosed brackets and backticks keep wrapping linear.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterator, List, Pattern, Tuple
+
+
+_NON_SPACE = re.compile(r"\S+")
+_TOKEN = re.compile(r"\S+|\n[^\S\n]*\n")
+"""A word, or a blank line separating paragraphs."""
+_ATOM_START = re.compile(r"`+|!?\[")
+_CLOSE_BRACKET = re.compile(r"\]")
+_CLOSE_PARENTHESIS = re.compile(r"\)")
+_BLANK_LINE = re.compile(r"\n[^\S\n]*\n")
+_BLOCK_MARKER = re.compile(
+    # list items, headings and setext underlines
+    r"[-+*]|#{1,6}|\d{1,9}[.)]|-+|=+"
+    # thematic breaks, quotes and code fences
+    r"|[*_]{3,}|>.*|`{3,}.*|~{3,}.*",
+    re.DOTALL,
+)
+"""Words that would start a block if they were placed at the start of a line."""
+
+
+@lru_cache(maxsize=64)
+def _backtick_closer(length: int) -> Pattern[str]:
+    """Returns the pattern of a run of exactly `length` backticks."""
+    return re.compile(f"(?<!`)`{{{length}}}(?!`)")
+
+
+class _Finder:
+    """Finds closing delimiters in a text, caching each search.
+
+    A search is reused while it is still the first match after the position, so
+        scanning many openers for the same closer, or for a missing one, reads the
+        text only once.
+    """
+
+    __slots__ = ("text", "_searches")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self._searches: Dict[Pattern[str], Tuple[int, int]] = {}
+
+    def find(self, pattern: Pattern[str], pos: int) -> int:
+        """Returns the start of the first match at or after `pos`, or the length."""
+        search = self._searches.get(pattern)
+
+        if search is not None:
+            start, found = search
+
+            if start <= pos <= found:
+                return found
+
+        match = pattern.search(self.text, pos)
+        found = len(self.text) if match is None else match.start()
+        self._searches[pattern] = (pos, found)
+
+        return found
+
+    def atom_end(self, start: int, opener: str) -> int:
+        """Returns the end of the code span, link or image starting with `opener` at `start`, or `#!python -1` if it is not closed within its paragraph."""  # noqa: E501
+        text = self.text
+        size = len(text)
+        end = start + len(opener)
+
+        if opener[0] == "`":
+            end = self.find(_backtick_closer(len(opener)), end)
+            end = end + len(opener) if end < size else -1
+        else:
+            end = self.find(_CLOSE_BRACKET, end) + 1
+            closer = _CLOSE_PARENTHESIS if text[end : end + 1] == "(" else None
+            closer = _CLOSE_BRACKET if text[end : end + 1] == "[" else closer
+            end = -1 if closer is None else self.find(closer, end + 1) + 1
+            end = -1 if end > size else end
+
+        if end == -1 or end > self.find(_BLANK_LINE, start):
+            return -1
+
+        return end
+
+
+def iter_wrap(
+    text: str,
+    width: int,
+    initial_indent: str = "",
+    subsequent_indent: str = "",
+) -> Iterator[str]:
+    """Hard-wraps the text at the given width, yielding one line at a time.
+
+    Single line breaks are treated as spaces, while blank lines are kept, to separate
+        paragraphs. Words longer than the width are placed in a line of their own.
+        Words that would start a block at the start of a line, such as `-` or `2.`,
+        are kept on the line of the previous word, even if it gets longer than the
+        width, so wrapping never changes the structure of the document.
+
+    Args:
+        text (str): The text to be wrapped.
+        width (int): Maximum length of the lines, including indentation.
+        initial_indent (str): String prepended to the first line.
+        subsequent_indent (str): String prepended to every other line. Blank lines get it without trailing spaces, such as `>` for quotes.
+
+    Examples:
+        >>> list(iter_wrap("see the [docs page](https://example.com) for `a b`", 12))
+        ['see the', '[docs page](https://example.com)', 'for `a b`']
+        >>> list(iter_wrap("total 5 - 3 = 2", 7))
+        ['total 5 -', '3 = 2']
+    """  # noqa: E501
+    indent = initial_indent
+    words: List[str] = []
+    length = len(indent)
+
+    finder = _Finder(text)
+    atom = _ATOM_START.search(text)
+    atom_start = len(text) if atom is None else atom.start()
+    skip_until = 0
+    new_paragraph = False
+
+    for match in _TOKEN.finditer(text):
+        word = match.group()
+
+        if skip_until > 0:
+            if match.start() < skip_until:
+                # inside a code span, link or image that was already added
+                continue
+
+            skip_until = 0
+
+        if word[0] == "\n":
+            new_paragraph = True
+            continue
+
+        if atom_start < match.end():
+            start, end = match.span()
+
+            while atom is not None and atom.start() < end:
+                atom_end = finder.atom_end(atom.start(), atom.group())
+
+                if atom_end == -1:
+                    # a run of backticks is skipped as a whole, so it is not reopened
+                    skip = atom.end() if atom.group()[0] == "`" else atom.start() + 1
+                    atom = _ATOM_START.search(text, skip)
+                    continue
+
+                if atom_end > end:
+                    rest = _NON_SPACE.match(text, atom_end)
+                    end = skip_until = atom_end if rest is None else rest.end()
+
+                atom = _ATOM_START.search(text, atom_end)
+
+            atom_start = len(text) if atom is None else atom.start()
+            word = text[start:end]
+
+            if "\n" in word:
+                word = word.replace("\n", " ")
+
+        if len(words) == 0:
+            length += len(word)
+            words.append(word)
+        elif new_paragraph:
+            yield indent + " ".join(words)
+            yield subsequent_indent.rstrip()
+
+            indent = subsequent_indent
+            words = [word]
+            length = len(indent) + len(word)
+        elif length + 1 + len(word) <= width or _BLOCK_MARKER.fullmatch(word):
+            length += 1 + len(word)
+            words.append(word)
+        else:
+            yield indent + " ".join(words)
+
+            indent = subsequent_indent
+            words = [word]
+            length = len(indent) + len(word)
+
+        new_paragraph = False
+
+    if len(words) > 0:
+        yield indent + " ".join(words)
+
+
+def wrap(
+    text: str,
+    width: int,
+    initial_indent: str = "",
+    subsequent_indent: str = "",
+) -> str:
+    r"""Hard-wraps the text at the given width. Same as joining [`iter_wrap`][pymarkdown_builder.wrap.iter_wrap] with line breaks.
+
+    Args:
+        text (str): The text to be wrapped.
+        width (int): Maximum length of the lines, including indentation.
+        initial_indent (str): String prepended to the first line.
+        subsequent_indent (str): String prepended to every other line.
+
+    Examples:
+        >>> wrap("Hello, wonderful world!", 10, "> ", "> ")
+        '> Hello,\n> wonderful\n> world!'
+    """  # noqa: E501
+    return "\n".join(iter_wrap(text, width, initial_indent, subsequent_indent))
@@ -0,0 +1,134 @@
+import io
+import tarfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pymarkdown_builder.archive import ArchiveWriter
+from pymarkdown_builder.builder import MarkdownBuilder
+from pymarkdown_builder.tokens import Tokens as t
+
+
+def read_entries(path_or_file, archive_format):
+    if archive_format == "zip":
+        with zipfile.ZipFile(path_or_file) as archive:
+            return {name: archive.read(name).decode() for name in archive.namelist()}
+
+    if not isinstance(path_or_file, str):
+        path_or_file.seek(0)
+
+    with tarfile.open(
+        path_or_file if isinstance(path_or_file, str) else None,
+        fileobj=None if isinstance(path_or_file, str) else path_or_file,
+    ) as archive:
+        return {
+            member.name: archive.extractfile(member).read().decode()
+            for member in archive.getmembers()
+        }
+
+
+@pytest.mark.parametrize(
+    "name, archive_format",
+    [
+        ("docs.zip", "zip"),
+        ("docs.tar", "tar"),
+        ("docs.tar.gz", "tar"),
+        ("docs.tgz", "tar"),
+        ("docs.tar.bz2", "tar"),
+        ("docs.tar.xz", "tar"),
+    ],
+)
+def test_archive_writer_should_detect_format_from_path(tmp_path, name, archive_format):
+    path = str(tmp_path / name)
+
+    with ArchiveWriter(path) as archive:
+        with archive.open("a.md") as sink:
+            MarkdownBuilder(sink=sink).lines(t.h1("A"), "text").finalize()
+
+        archive.write("docs/b.md", "# B")
+
+    assert archive.archive_format == archive_format
+    assert archive.entries == 2
+    assert read_entries(path, archive_format) == {
+        "a.md": "# A\n\ntext",
+        "docs/b.md": "# B",
+    }
+
+
+@pytest.mark.parametrize("archive_format", ["zip", "tar"])
+@pytest.mark.parametrize("compression", [None, "gz", "bz2", "xz"])
+def test_archive_writer_should_write_to_file_objects(archive_format, compression):
+    file = io.BytesIO()
+
+    with ArchiveWriter(file, archive_format, compression) as archive:
+        archive.write("page.md", "# Página")
+
+    assert read_entries(file, archive_format) == {"page.md": "# Página"}
+
+
+@pytest.mark.parametrize("archive_format", ["zip", "tar"])
+def test_archive_writer_should_spill_large_documents(archive_format):
+    file = io.BytesIO()
+    rows = [["n"], *([str(i)] for i in range(5000))]
+
+    with ArchiveWriter(file, archive_format, spool_size=1024) as archive:
+        with archive.open("table.md") as sink:
+            MarkdownBuilder(sink=sink).block_from(t.iter_table(rows))
+
+    assert read_entries(file, archive_format) == {"table.md": t.table(*rows)}
+
+
+@pytest.mark.parametrize("archive_format", ["zip", "tar"])
+def test_archive_writer_should_accept_documents_from_threads(archive_format):
+    file = io.BytesIO()
+
+    def render(index):
+        with archive.open(f"{index}.md") as sink:
+            builder = MarkdownBuilder(sink=sink)
+
+            for line in range(100):
+                builder.lines(f"{index} {line}")
+
+    with ArchiveWriter(file, archive_format) as archive:
+        with ThreadPoolExecutor(4) as executor:
+            list(executor.map(render, range(50)))
+
+    entries = read_entries(file, archive_format)
+
+    assert len(entries) == 50
+    assert entries["7.md"] == "\n\n".join(f"7 {line}" for line in range(100))
+
+
+def test_archive_entry_should_be_discarded_on_exception():
+    file = io.BytesIO()
+
+    with ArchiveWriter(file, "zip") as archive:
+        with pytest.raises(RuntimeError):
+            with archive.open("broken.md") as sink:
+                sink.write("partial")
+                raise RuntimeError()
+
+        archive.write("ok.md", "ok")
+
+    assert archive.entries == 1
+    assert read_entries(file, "zip") == {"ok.md": "ok"}
+
+
+def test_archive_entry_should_reject_writes_after_close():
+    with ArchiveWriter(io.BytesIO(), "tar") as archive:
+        sink = archive.open("a.md")
+        sink.close()
+
+        with pytest.raises(ValueError):
+            sink.write("text")
+
+
+def test_archive_writer_with_unknown_format_should_raise_value_error(tmp_path):
+    with pytest.raises(ValueError):
+        ArchiveWriter(str(tmp_path / "docs.rar"))
+
+    with pytest.raises(ValueError):
+        ArchiveWriter(io.BytesIO())
+
+    with pytest.raises(ValueError):
+        ArchiveWriter(io.BytesIO(), "zip", "zstd")
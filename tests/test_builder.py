@@ -1,4 +1,8 @@
+import io
+
+import pytest
 from pymarkdown_builder.builder import MarkdownBuilder
+from pymarkdown_builder.tokens import Tokens as t
 
 
 def test_write_lines_should_not_prepend_lines_with_double_line_breaks_if_document_is_empty():
@@ -54,3 +58,352 @@ def test_str_should_return_document():
     builder = MarkdownBuilder("Hello World!")
 
     assert str(builder) == builder.document == "Hello World!"
+
+
+def test_write_references_should_append_definitions_once():
+    builder = MarkdownBuilder()
+    builder.spans(
+        builder.references.link("https://example.com", "a"),
+        builder.references.link("https://example.com", "b"),
+    )
+    builder.write_references()
+    builder.write_references()
+
+    assert builder.document == "[a][1][b][1]\n\n[1]: https://example.com"
+
+
+def test_write_references_should_only_append_new_definitions():
+    builder = MarkdownBuilder()
+    builder.lines(builder.references.link("https://a.com")).refs()
+    builder.lines(
+        builder.references.link("https://a.com"),
+        builder.references.image("https://b.com/x.png", "x", "title"),
+    ).refs()
+
+    assert builder.document == (
+        "[https://a.com][1]\n\n[1]: https://a.com\n\n"
+        "[https://a.com][1]\n\n![x][2]\n\n"
+        '[2]: https://b.com/x.png "title"'
+    )
+
+
+def test_write_lines_should_index_headings():
+    builder = MarkdownBuilder()
+    builder.lines(t.h1("Title"), "content", t.h2("Title"))
+
+    assert [(e.text, e.level, e.anchor) for e in builder.headings.entries] == [
+        ("Title", 1, "title"),
+        ("Title", 2, "title-1"),
+    ]
+
+
+def test_finalize_should_fill_in_toc():
+    builder = MarkdownBuilder()
+    builder.lines(t.h1("Title")).toc().lines(t.h2("Usage"), "content")
+    builder.finalize()
+
+    assert builder.document == (
+        "# Title\n\n- [Title](#title)\n  - [Usage](#usage)\n\n## Usage\n\ncontent"
+    )
+
+
+def test_finalize_should_fill_in_toc_written_first():
+    builder = MarkdownBuilder().toc().lines(t.h1("Title")).finalize()
+
+    assert builder.document == "- [Title](#title)\n\n# Title"
+
+
+@pytest.mark.parametrize(
+    ("build", "expected"),
+    [
+        (lambda b: b.lines("a").toc().lines("b"), "a\n\nb"),
+        (lambda b: b.toc().lines("b"), "b"),
+        (lambda b: b.lines("a").toc(), "a"),
+        (lambda b: b.lines("a").toc().spans("b"), "ab"),
+        (lambda b: b.toc(), ""),
+    ],
+)
+def test_finalize_with_empty_toc_should_drop_placeholder(build, expected):
+    assert build(MarkdownBuilder()).finalize().document == expected
+
+    sink = io.StringIO()
+    build(MarkdownBuilder(sink=sink)).finalize()
+
+    assert sink.getvalue() == expected
+
+
+@pytest.mark.parametrize(
+    "build",
+    [
+        lambda b: b.spans("").lines("a"),
+        lambda b: b.lines("").lines("a"),
+        lambda b: b.lines_from([]).lines("a"),
+        lambda b: b.block_from([]).lines("a"),
+        lambda b: b.spans_from([]).spans("a"),
+    ],
+)
+def test_empty_writes_with_sink_should_match_document(build):
+    sink = io.StringIO()
+    build(MarkdownBuilder(sink=sink))
+
+    assert sink.getvalue() == build(MarkdownBuilder()).document == "a"
+
+
+def test_write_toc_twice_should_raise_value_error():
+    builder = MarkdownBuilder().toc()
+
+    with pytest.raises(ValueError):
+        builder.toc()
+
+
+def test_finalize_should_write_references():
+    builder = MarkdownBuilder()
+    builder.lines(builder.references.link("https://a.com", "a")).finalize()
+
+    assert builder.document == "[a][1]\n\n[1]: https://a.com"
+
+
+def test_builder_with_sink_should_stream_content():
+    sink = io.StringIO()
+    builder = MarkdownBuilder("# Title", sink=sink)
+    builder.lines("a", "b").spans("c").br().lines("d")
+
+    assert builder.document == ""
+    assert sink.getvalue() == "# Title\n\na\n\nbc\n\n\n\nd"
+
+
+def test_builder_with_sink_should_hold_content_after_toc_until_finalize():
+    sink = io.StringIO()
+    builder = MarkdownBuilder(sink=sink)
+    builder.lines(t.h1("Title")).toc().lines(t.h2("Usage"))
+
+    assert sink.getvalue() == "# Title"
+
+    builder.finalize()
+
+    assert sink.getvalue() == (
+        "# Title\n\n- [Title](#title)\n  - [Usage](#usage)\n\n## Usage"
+    )
+
+
+@pytest.mark.parametrize(
+    ("existing", "expected"),
+    [
+        ("", "new"),
+        ("# Log", "# Log\n\nnew"),
+        ("# Log\n", "# Log\n\nnew"),
+        ("# Log\n\n", "# Log\n\nnew"),
+        ("# Log\r\n\r\n", "# Log\r\n\r\nnew"),
+        ("# Log\r\n", "# Log\r\n\r\nnew"),
+        ("# Log\r\n\r\nfirst", "# Log\r\n\r\nfirst\r\n\r\nnew"),
+        ("a\nb\r\n", "a\nb\r\n\r\nnew"),
+        ("a\rb", "a\rb\n\nnew"),
+    ],
+)
+def test_append_to_should_pick_separator_from_file_tail(tmp_path, existing, expected):
+    path = tmp_path / "log.md"
+    path.write_bytes(existing.encode("utf-8"))
+
+    with MarkdownBuilder.append_to(path) as builder:
+        builder.lines("new")
+
+    assert path.read_bytes().decode("utf-8") == expected
+
+
+def test_append_to_should_keep_crlf_line_breaks(tmp_path):
+    path = tmp_path / "log.md"
+    path.write_bytes(b"# Log\r\n")
+
+    with MarkdownBuilder.append_to(path) as builder:
+        builder.lines("a", t.table(["x"], ["1"]))
+
+    assert path.read_bytes() == b"# Log\r\n\r\na\r\n\r\nx\r\n---\r\n1"
+
+
+def test_append_to_should_create_missing_file(tmp_path):
+    path = tmp_path / "log.md"
+
+    with MarkdownBuilder.append_to(path) as builder:
+        builder.lines("a", "b")
+
+    assert path.read_text() == "a\n\nb"
+
+
+def test_append_to_should_append_spans_without_separator(tmp_path):
+    path = tmp_path / "log.md"
+    path.write_text("# Log")
+
+    with MarkdownBuilder.append_to(path) as builder:
+        builder.spans(" continued").lines("new")
+
+    assert path.read_text() == "# Log continued\n\nnew"
+
+
+def test_fork_should_share_content_written_before_forking():
+    parent = MarkdownBuilder().lines("# Title", "legal")
+    a = parent.fork().lines("a")
+    b = parent.fork().spans(" b")
+    parent.lines("parent")
+
+    assert a.document == "\n\na"
+    assert str(a) == "# Title\n\nlegal\n\na"
+    assert str(b) == "# Title\n\nlegal b"
+    assert str(parent) == "# Title\n\nlegal\n\nparent"
+
+
+def test_fork_of_fork_should_share_both_prefixes():
+    root = MarkdownBuilder().lines("root")
+    child = root.fork().lines("child")
+    grandchild = child.fork().lines("grandchild")
+
+    assert str(grandchild) == "root\n\nchild\n\ngrandchild"
+
+
+def test_fork_of_empty_builder_should_not_prepend_separator():
+    assert str(MarkdownBuilder().fork().lines("a")) == "a"
+
+
+def test_fork_should_copy_indexes():
+    parent = MarkdownBuilder().lines(t.h1("Title"))
+    parent.references.link("https://a.com")
+    fork = parent.fork().lines(t.h2("Title"))
+    fork.references.link("https://b.com")
+
+    assert len(parent.headings) == 1
+    assert len(fork.headings) == 2
+    assert fork.headings.entries[1].anchor == "title-1"
+    assert parent.references.definitions() == "[1]: https://a.com"
+    assert fork.references.definitions() == "[1]: https://a.com\n[2]: https://b.com"
+
+
+def test_materialize_should_copy_prefix_into_document():
+    fork = MarkdownBuilder("a").fork().lines("b").materialize()
+
+    assert fork.document == "a\n\nb"
+    assert str(fork) == "a\n\nb"
+
+
+def test_write_to_should_write_whole_content():
+    sink = io.StringIO()
+    MarkdownBuilder("a").fork().lines("b").write_to(sink)
+
+    assert sink.getvalue() == "a\n\nb"
+
+
+def test_fork_should_not_copy_indexes_until_written():
+    parent = MarkdownBuilder().lines(*(t.h2(f"Section {i}") for i in range(10_000)))
+    parent.lines(*(parent.references.link(f"https://{i}.com") for i in range(10_000)))
+    fork = parent.fork().lines("no headings or links")
+
+    assert fork.headings.entries is parent.headings.entries
+    assert fork.references._labels is parent.references._labels
+
+    fork.lines(t.h2("Section 0"), fork.references.link("https://new.com"))
+
+    assert fork.headings.entries is not parent.headings.entries
+    assert fork.references._labels is not parent.references._labels
+    assert (len(parent.headings), len(fork.headings)) == (10_000, 10_001)
+    assert (len(parent.references), len(fork.references)) == (10_000, 10_001)
+
+
+def test_fork_with_sink_or_pending_toc_should_raise_value_error():
+    with pytest.raises(ValueError):
+        MarkdownBuilder(sink=io.StringIO()).fork()
+
+    with pytest.raises(ValueError):
+        MarkdownBuilder().toc().fork()
+
+
+def test_fork_finalize_should_fill_in_toc_written_after_forking():
+    fork = MarkdownBuilder().lines(t.h1("Title")).fork()
+    fork.toc().lines(t.h2("Usage")).finalize()
+
+    assert str(fork) == "# Title\n\n- [Title](#title)\n  - [Usage](#usage)\n\n## Usage"
+
+
+def test_write_wrapped_should_append_wrapped_line():
+    builder = MarkdownBuilder("# Title").wrapped("hello big world", 11, "> ")
+
+    assert builder.document == "# Title\n\n> hello big\n> world"
+
+
+def test_write_wrapped_with_sink_should_stream_each_line():
+    sink = io.StringIO()
+    MarkdownBuilder("# Title", sink=sink).wrapped("aaa bbb ccc", 3).lines("x")
+
+    assert sink.getvalue() == "# Title\n\naaa\nbbb\nccc\n\nx"
+
+
+class RecordingSink:
+    def __init__(self) -> None:
+        self.writes = []
+
+    def write(self, text: str) -> None:
+        self.writes.append(text)
+
+
+@pytest.mark.parametrize("with_sink", [False, True])
+def test_write_from_should_match_unpacked_writes(with_sink):
+    def build(builder):
+        return builder.lines_from(iter(["a", "b"])).spans_from(iter(["c", "d"]))
+
+    sink = RecordingSink() if with_sink else None
+    builder = build(MarkdownBuilder("x", sink=sink))
+    expected = MarkdownBuilder("x").lines("a", "b").spans("c", "d").document
+
+    assert ("".join(sink.writes) if with_sink else builder.document) == expected
+
+
+def test_write_from_with_empty_iterables_should_match_unpacked_writes():
+    builder = MarkdownBuilder("x").lines_from(iter(())).spans_from(iter(()))
+
+    assert builder.document == MarkdownBuilder("x").lines().spans().document
+
+
+def test_write_lines_from_with_sink_should_write_while_iterating():
+    sink = RecordingSink()
+    builder = MarkdownBuilder(sink=sink)
+
+    def lines():
+        for line in ("a", "b", "c"):
+            yield line
+            assert "".join(sink.writes).endswith(line)
+
+    builder.lines_from(lines())
+
+    assert sink.writes == ["a", "\n\nb", "\n\nc"]
+
+
+def test_write_lines_from_should_index_headings():
+    builder = MarkdownBuilder().lines_from(t.h(f"Part {i}", 2) for i in range(2))
+
+    assert [entry.anchor for entry in builder.headings.entries] == ["part-0", "part-1"]
+
+
+def test_write_block_from_with_sink_should_stream_table_chunks():
+    sink = RecordingSink()
+    rows = [["n"], *([str(i)] for i in range(2500))]
+    MarkdownBuilder("# Title", sink=sink).block_from(t.iter_table(iter(rows)))
+
+    assert "".join(sink.writes) == "# Title\n\n" + t.table(*rows)
+    # title, separator, header and divider, then 3 blocks of rows
+    assert len(sink.writes) == 6
+
+
+def test_reset_should_leave_builder_as_new():
+    builder = MarkdownBuilder("a").toc().lines(t.h1("Title"))
+    builder.references.link("https://example.com")
+    references, headings = builder.references, builder.headings
+
+    assert builder.reset() == MarkdownBuilder()
+    assert builder.references is references and len(references) == 0
+    assert builder.headings is headings and len(headings) == 0
+    assert builder.lines("b").finalize().document == "b"
+
+
+def test_reset_with_sink_should_stream_initial_document():
+    sink = io.StringIO()
+    builder = MarkdownBuilder("a").clear("# New", sink=sink).lines("text")
+
+    assert sink.getvalue() == "# New\n\ntext"
+    assert builder.document == ""
@@ -0,0 +1,167 @@
+import os
+
+import pytest
+from pymarkdown_builder.builder import MarkdownBuilder
+from pymarkdown_builder.cache import FragmentCache
+from pymarkdown_builder.html_tokens import HtmlTokens
+from pymarkdown_builder.tokens import Tokens as t
+
+
+ROWS = (["name", "age"], ["John", "20"])
+
+
+def test_fetch_should_render_on_miss_and_reuse_on_hit(tmp_path):
+    cache = FragmentCache(tmp_path)
+    calls = []
+
+    def render(*rows):
+        calls.append(rows)
+        return t.table(*rows)
+
+    first = cache.fetch(render, *ROWS, key="rows")
+    second = cache.fetch(render, *ROWS, key="rows")
+
+    assert first == second == t.table(*ROWS)
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_fetch_should_persist_across_instances(tmp_path):
+    FragmentCache(tmp_path).fetch(t.table, *ROWS)
+
+    cache = FragmentCache(tmp_path)
+    builder = MarkdownBuilder().lines(cache.fetch(t.table, *ROWS))
+
+    assert builder.document == t.table(*ROWS)
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_fetch_should_render_same_document_on_cold_and_warm_runs(tmp_path):
+    def build(cache):
+        markdown = MarkdownBuilder().toc()
+        markdown.lines(cache.fetch(t.h1, "Title"), cache.fetch(t.table, *ROWS))
+        html = MarkdownBuilder(tokens=HtmlTokens).toc()
+        html.lines(cache.fetch(HtmlTokens.h1, HtmlTokens.code("a < b")))
+        html.lines(HtmlTokens.quote(cache.fetch(HtmlTokens.table, *ROWS)))
+
+        return markdown.finalize().document, html.finalize().document
+
+    cold = build(FragmentCache(tmp_path))
+    warm_cache = FragmentCache(tmp_path)
+    warm = build(warm_cache)
+
+    assert warm == cold
+    assert (warm_cache.hits, warm_cache.misses) == (4, 0)
+    assert warm[0].startswith("- [Title](#title)")
+    assert warm[1].startswith("<ul>") and "&amp;lt;" not in warm[1]
+
+
+def test_put_should_reject_fragments_not_recreated_by_their_type(tmp_path):
+    with pytest.raises(TypeError):
+        FragmentCache(tmp_path).put("a", t.bold | "a")
+
+
+def test_key_should_depend_on_inputs_and_version(tmp_path):
+    cache = FragmentCache(tmp_path, version="1.0")
+    other_version = FragmentCache(tmp_path, version="2.0")
+
+    assert cache.key("a", {"x": 1, "y": 2}) == cache.key("a", {"y": 2, "x": 1})
+    assert cache.key("a") != cache.key("b")
+    assert cache.key("a") != other_version.key("a")
+
+
+def test_fetch_should_not_collide_between_render_functions(tmp_path):
+    cache = FragmentCache(tmp_path)
+
+    assert cache.fetch(t.bold, "text") == "**text**"
+    assert cache.fetch(t.italic, "text") == "*text*"
+
+
+def table_of(rows):
+    def render():
+        return t.table(*rows)
+
+    return render
+
+
+@pytest.mark.parametrize(
+    "render",
+    [lambda: t.table(*ROWS), table_of(ROWS), "a".upper],
+)
+def test_fetch_without_key_should_reject_render_functions_not_keyed_by_name(
+    tmp_path, render
+):
+    with pytest.raises(TypeError):
+        FragmentCache(tmp_path).fetch(render)
+
+
+def test_fetch_without_key_should_reject_iterators(tmp_path):
+    cache = FragmentCache(tmp_path)
+
+    with pytest.raises(TypeError):
+        cache.fetch(t.table_from, (row for row in ROWS))
+
+
+def test_fetch_with_key_should_not_collide_between_lambdas(tmp_path):
+    cache = FragmentCache(tmp_path)
+    other_rows = (["name"], ["Ann"])
+
+    first = cache.fetch(lambda: t.table(*ROWS), key="deps")
+    second = cache.fetch(lambda: t.table(*other_rows), key="licenses")
+
+    assert (first, second) == (t.table(*ROWS), t.table(*other_rows))
+
+
+def test_put_should_evict_least_recently_used_fragments(tmp_path):
+    cache = FragmentCache(tmp_path, max_bytes=12)
+    cache.put("a", "aaaa")
+    cache.put("b", "bbbb")
+    os.utime(tmp_path / "a.md", (1, 1))
+    os.utime(tmp_path / "b.md", (2, 2))
+
+    cache.get("a")
+    cache.put("c", "cccc")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "aaaa"
+    assert cache.get("c") == "cccc"
+    assert cache.evictions == 1
+
+
+def test_put_should_evict_in_batches(tmp_path, monkeypatch):
+    cache = FragmentCache(tmp_path, max_bytes=1000)
+    scans = []
+    entries = cache._entries
+    monkeypatch.setattr(cache, "_entries", lambda: scans.append(1) or entries())
+
+    for index in range(100):
+        cache.put(str(index), "x" * 49)
+
+    assert sum(entry[2] for entry in entries()) <= 1000
+    assert cache.evictions == 100 - len(os.listdir(tmp_path))
+    assert len(scans) <= 30
+
+
+def test_put_should_keep_fragment_larger_than_max_bytes(tmp_path):
+    cache = FragmentCache(tmp_path, max_bytes=2)
+    cache.put("a", "aaaa")
+
+    assert cache.get("a") == "aaaa"
+
+
+def test_put_should_not_leave_temporary_files(tmp_path):
+    cache = FragmentCache(tmp_path)
+    cache.put("a", "aaaa")
+    cache.put("a", "bbbb")
+
+    assert os.listdir(tmp_path) == ["a.md"]
+    assert cache.get("a") == "bbbb"
+
+
+def test_clear_should_remove_every_fragment(tmp_path):
+    cache = FragmentCache(tmp_path)
+    cache.put("a", "aaaa")
+    cache.clear()
+
+    assert cache.get("a") is None
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,144 @@
+import io
+import json
+
+import pytest
+from pymarkdown_builder.cli import _iter_json, main
+
+
+def run(*argv, stdin=""):
+    stdout = io.StringIO()
+
+    assert main(list(argv), io.StringIO(stdin), stdout) == 0
+
+    return stdout.getvalue()
+
+
+NDJSON = '{"name": "John", "age": 20}\n\n{"name": "Mary", "age": 30}\n'
+
+
+def test_cli_should_render_ndjson_as_table():
+    assert run(stdin=NDJSON) == ("name | age\n--- | ---\nJohn | 20\nMary | 30\n")
+
+
+def test_cli_should_render_same_table_with_any_chunk_size():
+    assert run("--chunk-size", "1", stdin=NDJSON) == run(stdin=NDJSON)
+
+
+def test_cli_should_select_columns():
+    assert run("--columns", "age", stdin=NDJSON) == "age\n---\n20\n30\n"
+
+
+def test_cli_should_escape_table_cells():
+    stdin = json.dumps({"a": "x | y\nz"})
+
+    assert run(stdin=stdin) == "a\n---\nx \\| y<br>z\n"
+    assert run("--no-escape", stdin=stdin) == "a\n---\nx | y\nz\n"
+
+
+def test_cli_should_write_title():
+    assert run("--title", "People", "-c", "name", stdin=NDJSON) == (
+        "# People\n\nname\n---\nJohn\nMary\n"
+    )
+
+
+def test_cli_should_render_lists():
+    assert run("-o", "list", "-c", "name", stdin=NDJSON) == "- John\n- Mary\n"
+    assert run("-o", "ordered-list", "-t", "{name} ({age})", stdin=NDJSON) == (
+        "1. John (20)\n1. Mary (30)\n"
+    )
+
+
+def test_cli_should_continue_lists_across_chunks():
+    assert run("-o", "list", "-c", "name", "--chunk-size", "1", stdin=NDJSON) == (
+        "- John\n- Mary\n"
+    )
+
+
+def test_cli_should_render_template():
+    stdin = '{"name": "*John*"}\n{"name": "Mary"}\n'
+
+    assert run("-o", "template", "-t", "## {name}", stdin=stdin) == (
+        "## \\*John\\*\n\n## Mary\n"
+    )
+
+
+def test_cli_template_output_requires_template():
+    with pytest.raises(SystemExit):
+        main(["-o", "template"], io.StringIO(NDJSON), io.StringIO())
+
+
+def test_cli_should_read_files_by_extension(tmp_path):
+    csv_path = tmp_path / "people.csv"
+    csv_path.write_text("name,age\nJohn,20\n")
+    json_path = tmp_path / "people.json"
+    json_path.write_text('[{"name": "Mary", "age": 30}]')
+
+    assert run(str(csv_path), str(json_path)) == (
+        "name | age\n--- | ---\nJohn | 20\nMary | 30\n"
+    )
+
+
+def test_cli_should_use_first_array_as_header():
+    assert run("-i", "json", stdin='[["a", "b"], [1, null], [true, [2]]]') == (
+        "a | b\n--- | ---\n1 | \ntrue | [2]\n"
+    )
+
+
+def test_cli_with_no_records_should_write_nothing():
+    assert run(stdin="") == ""
+    assert run("--title", "", stdin="") == ""
+
+
+@pytest.mark.parametrize(
+    ("argv", "stdin", "message"),
+    [
+        (["-i", "json"], "[1, 2, 3]", "objects or arrays, not int"),
+        (["-i", "json"], '[["a"], 1]', "objects or arrays, not int"),
+        (["missing.json"], "", "No such file or directory"),
+        (["-i", "json"], '[{"a": ', "Expecting value"),
+        (["-i", "csv"], "a\n" + "x" * 200_000, "field larger than field limit"),
+        (["-o", "template", "-t", "{a.x}"], '{"a": 1}', "no attribute 'x'"),
+        (["-o", "template", "-t", "{0[5]}"], '{"a": 1}', "positional fields"),
+        (["-o", "template", "-t", "{a[5]}"], '{"a": "x"}', "out of range"),
+    ],
+)
+def test_cli_should_report_invalid_input(capsys, argv, stdin, message):
+    with pytest.raises(SystemExit) as error:
+        main(argv, io.StringIO(stdin), io.StringIO())
+
+    assert error.value.code == 1
+    assert message in capsys.readouterr().err
+
+
+def test_iter_json_should_read_items_across_chunks():
+    items = [{"a": index, "b": "x" * index} for index in range(50)] + [12345]
+    text = json.dumps(items)
+
+    assert list(_iter_json(io.StringIO(text), chunk_size=7)) == items
+    assert list(_iter_json(io.StringIO(" 42 "))) == [42]
+    assert list(_iter_json(io.StringIO("[]"))) == []
+
+
+def test_iter_json_should_read_numbers_split_across_chunks():
+    text = "[1.5, -12, 1e5, 2.5E-3, true, null]"
+
+    for chunk_size in range(1, len(text) + 1):
+        assert list(_iter_json(io.StringIO(text), chunk_size)) == json.loads(text)
+
+
+def test_iter_json_should_raise_on_invalid_json():
+    with pytest.raises(ValueError):
+        list(_iter_json(io.StringIO('[{"a": ')))
+
+
+def test_iter_json_should_raise_with_position_in_file_without_reading_on():
+    text = "[\n" + '{"a": 1},\n' * 100 + '  {"a": x}' + " " * 1_000_000 + "]"
+    file = io.StringIO(text)
+
+    with pytest.raises(json.JSONDecodeError) as error:
+        list(_iter_json(file, chunk_size=16))
+
+    assert (error.value.lineno, error.value.colno) == (102, 9)
+    assert error.value.pos == text.index("x")
+    assert "line 102 column 9" in str(error.value)
+    assert file.tell() < 10_000
@@ -0,0 +1,119 @@
+import io
+import os
+import random
+
+import pytest
+from pymarkdown_builder import grouping
+from pymarkdown_builder.builder import MarkdownBuilder
+from pymarkdown_builder.grouping import iter_sorted_groups, write_grouped_tables
+from pymarkdown_builder.tokens import Tokens as t
+
+
+RECORDS = [
+    {"service": f"service-{random.Random(i).randrange(7)}", "id": str(i)}
+    for i in range(2000)
+]
+
+
+def expected_groups(records, key):
+    groups = {}
+
+    for record in records:
+        groups.setdefault(key(record), []).append(record)
+
+    return sorted(groups.items())
+
+
+@pytest.mark.parametrize("run_size", [1, 3, 100, 2000, 10_000])
+def test_iter_sorted_groups_should_match_in_memory_grouping(run_size):
+    key = lambda record: record["service"]  # noqa: E731
+    groups = [
+        (group_key, list(group))
+        for group_key, group in iter_sorted_groups(RECORDS, key, run_size)
+    ]
+
+    assert groups == expected_groups(RECORDS, key)
+
+
+def test_iter_sorted_groups_should_merge_in_several_passes(monkeypatch):
+    monkeypatch.setattr(grouping, "_MAX_OPEN_RUNS", 3)
+    monkeypatch.setattr(grouping, "_BATCH_SIZE", 2)
+    key = lambda record: record["service"]  # noqa: E731
+    groups = [
+        (group_key, list(group))
+        for group_key, group in iter_sorted_groups(RECORDS, key, run_size=50)
+    ]
+
+    assert groups == expected_groups(RECORDS, key)
+
+
+def test_iter_sorted_groups_should_spill_to_directory(tmp_path):
+    groups = iter_sorted_groups(range(10), lambda n: n % 2, 3, str(tmp_path))
+    first_key, first_group = next(groups)
+
+    assert (first_key, list(first_group)) == (0, [0, 2, 4, 6, 8])
+
+    groups.close()
+
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc/self/fd"), reason="needs /proc")
+def test_iter_sorted_groups_should_bound_open_files(monkeypatch):
+    monkeypatch.setattr(grouping, "_MAX_OPEN_RUNS", 8)
+    open_files = []
+
+    def records():
+        for i in range(3000):
+            open_files.append(len(os.listdir("/proc/self/fd")))
+            yield i
+
+    baseline = len(os.listdir("/proc/self/fd"))
+    groups = iter_sorted_groups(records(), lambda n: n % 10, run_size=10)
+
+    assert [len(list(group)) for _, group in groups] == [300] * 10
+    assert max(open_files) - baseline <= 8
+
+
+def test_iter_sorted_groups_with_no_records_should_yield_nothing():
+    assert list(iter_sorted_groups([], key=str)) == []
+
+
+@pytest.mark.parametrize("run_size", [0, -1])
+def test_iter_sorted_groups_with_empty_runs_should_raise(run_size):
+    with pytest.raises(ValueError):
+        next(iter_sorted_groups(["a"], key=str, run_size=run_size))
+
+
+def test_write_grouped_tables_should_write_heading_and_table_per_group():
+    records = [("b", "1"), ("a", "2"), ("b", "3")]
+    builder = write_grouped_tables(
+        MarkdownBuilder("# Report"),
+        iter(records),
+        key=lambda record: record[0],
+        header=["n"],
+        row=lambda record: [record[1]],
+        level=3,
+        title=str.upper,
+        run_size=1,
+    )
+
+    assert builder.document == (
+        "# Report\n\n### A\n\nn\n---\n2\n\n### B\n\nn\n---\n1\n3"
+    )
+    assert [entry.text for entry in builder.headings.entries] == ["A", "B"]
+
+
+def test_write_grouped_tables_with_sink_should_match_document():
+    key = lambda record: record["service"]  # noqa: E731
+    sink = io.StringIO()
+    write_grouped_tables(
+        MarkdownBuilder(sink=sink), RECORDS, key, ["id", "service"], run_size=300
+    )
+    expected = MarkdownBuilder()
+
+    for group_key, group in expected_groups(RECORDS, key):
+        rows = ([record["id"], record["service"]] for record in group)
+        expected.lines(t.h2(group_key), t.table(["id", "service"], *rows))
+
+    assert sink.getvalue() == expected.document
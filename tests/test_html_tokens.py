@@ -0,0 +1,158 @@
+import pickle
+
+import pytest
+from pymarkdown_builder.builder import MarkdownBuilder
+from pymarkdown_builder.html_tokens import HtmlContent, HtmlPartialTokenContent, escape
+from pymarkdown_builder.html_tokens import HtmlTokens as t
+
+
+def test_escape_should_escape_quotes():
+    assert escape("\"'") == "&quot;&#x27;"
+
+
+def test_escape_should_not_escape_html_content_twice():
+    content = HtmlContent("<b>")
+
+    assert escape(content) is content
+
+
+def test_heading_levels():
+    assert t.heading("hello") == '<h1 id="hello">hello</h1>'
+    assert t.h1("hello") == '<h1 id="hello">hello</h1>'
+    assert t.h2("hello") == '<h2 id="hello">hello</h2>'
+    assert t.h3("hello") == '<h3 id="hello">hello</h3>'
+    assert t.h4("hello") == '<h4 id="hello">hello</h4>'
+    assert t.h5("hello") == '<h5 id="hello">hello</h5>'
+    assert t.h6("hello") == '<h6 id="hello">hello</h6>'
+
+
+def test_heading_level_out_of_range_should_raise_value_error():
+    with pytest.raises(ValueError):
+        t.heading("hello", 0)
+
+    with pytest.raises(ValueError):
+        t.heading("hello", 7)
+
+
+def test_paragraph_should_escape_strings_but_not_tokens():
+    result = t.p("a < b ", t.link("https://a.com?x=1&y=2", "<link>"))
+
+    assert result == (
+        '<p>a &lt; b <a href="https://a.com?x=1&amp;y=2">&lt;link&gt;</a></p>'
+    )
+
+
+def test_image_without_alt_and_mouseover():
+    assert t.img("a.png") == '<img src="a.png" alt="">'
+
+
+def test_code_block_without_lang():
+    assert t.code_block("<b>") == "<pre><code>&lt;b&gt;</code></pre>"
+
+
+def test_lists_with_no_items_should_return_empty_string():
+    assert t.ul() == ""
+    assert t.ol() == ""
+
+
+def test_list_items_should_be_escaped():
+    assert t.ul("<a>", t.bold("b")) == (
+        "<ul>\n<li>&lt;a&gt;</li>\n<li><strong>b</strong></li>\n</ul>"
+    )
+
+
+def test_table_with_no_body_should_return_empty_string():
+    assert t.table() == ""
+    assert t.table(["name"]) == ""
+
+
+def test_table_from_dicts_should_use_keys_as_header():
+    result = t.table_from_dicts({"a": "1"}, {"a": "<2>"})
+
+    assert result == (
+        "<table>\n<thead>\n<tr><th>a</th></tr>\n</thead>\n"
+        "<tbody>\n<tr><td>1</td></tr>\n<tr><td>&lt;2&gt;</td></tr>\n</tbody>\n</table>"
+    )
+    assert t.table_from_dicts() == ""
+
+
+def test_partial_tokens_should_escape_text():
+    assert t.bold("<b>") == "<strong>&lt;b&gt;</strong>"
+    assert t.strike("x") == "<del>x</del>"
+    assert t.code("x") == "<code>x</code>"
+
+
+def test_partial_token_pipes_should_nest_asymmetric_tags():
+    result = t.bold | "a & " | t.italic | "b" | t.italic | t.bold
+
+    assert result == "<strong>a &amp; <em>b</em></strong>"
+    assert isinstance(result, HtmlPartialTokenContent)
+    assert isinstance(result, HtmlContent)
+
+
+def test_composed_html_partial_tokens_should_escape_text():
+    assert (t.bold & t.italic)("<x>") == "<strong><em>&lt;x&gt;</em></strong>"
+
+
+def test_builder_should_write_html_tokens():
+    builder = MarkdownBuilder().lines(t.h1("Title"), t.hr())
+
+    assert builder.document == '<h1 id="title">Title</h1>\n\n<hr>'
+
+
+def test_builder_should_give_repeated_html_headings_unique_ids():
+    builder = MarkdownBuilder().lines(t.h2("Example"), t.h2("Example"))
+
+    assert builder.document == (
+        '<h2 id="example">Example</h2>\n\n<h2 id="example-1">Example</h2>'
+    )
+
+
+def test_builder_should_render_toc_of_html_headings_as_html():
+    builder = MarkdownBuilder(tokens=t).toc()
+    builder.lines(t.h1("A & B"), t.h2("Usage"), t.h3("Deep"), t.h2("API"), t.h1("End"))
+
+    assert builder.finalize().document == (
+        "<ul>\n"
+        '<li><a href="#a--b">A &amp; B</a>\n'
+        "<ul>\n"
+        '<li><a href="#usage">Usage</a>\n'
+        "<ul>\n"
+        '<li><a href="#deep">Deep</a></li>\n'
+        "</ul>\n"
+        "</li>\n"
+        '<li><a href="#api">API</a></li>\n'
+        "</ul>\n"
+        "</li>\n"
+        '<li><a href="#end">End</a></li>\n'
+        "</ul>\n\n"
+        '<h1 id="a--b">A &amp; B</h1>\n\n<h2 id="usage">Usage</h2>\n\n'
+        '<h3 id="deep">Deep</h3>\n\n<h2 id="api">API</h2>\n\n<h1 id="end">End</h1>'
+    )
+
+
+def test_builder_with_html_tokens_should_reject_references():
+    builder = MarkdownBuilder(tokens=t)
+    builder.lines(builder.references.link("https://a.com"))
+
+    with pytest.raises(ValueError):
+        builder.finalize()
+
+
+def test_builder_should_use_its_tokens_regardless_of_the_headings_written():
+    builder = MarkdownBuilder().toc().lines(t.h1("Title"))
+    builder.lines(builder.references.link("https://a.com"))
+
+    assert builder.finalize().document == (
+        '- [Title](#title)\n\n<h1 id="title">Title</h1>\n\n[https://a.com][1]'
+        "\n\n[1]: https://a.com"
+    )
+    assert MarkdownBuilder(tokens=t).toc().finalize().document == ""
+    assert MarkdownBuilder(tokens=t).reset().fork().tokens is t
+
+
+def test_html_heading_should_be_pickled():
+    heading = pickle.loads(pickle.dumps(t.h2("Example")))
+
+    assert heading == '<h2 id="example">Example</h2>'
+    assert heading.with_anchor("other") == '<h2 id="other">Example</h2>'
@@ -0,0 +1,156 @@
+"""Peak and retained memory budgets, in bytes of memory per byte of output.
+
+Inputs are built before tracing starts, so only the memory allocated while rendering
+is measured. A budget of 2 means rendering may hold at most one extra copy of the
+output at a time; an extra full-document copy pushes the measurement past it.
+"""
+
+import gc
+import tracemalloc
+from typing import Callable, NamedTuple
+
+import pytest
+from pymarkdown_builder.builder import MarkdownBuilder
+from pymarkdown_builder.table_builder import TableBuilder
+from pymarkdown_builder.tokens import Tokens as t
+
+
+LEAK_BUDGET = 64 * 1024
+"""Memory that may remain allocated after the output is released, in bytes."""
+
+
+class Measurement(NamedTuple):
+    output_bytes: int
+    peak: int
+    retained: int
+    leaked: int
+
+    @property
+    def peak_ratio(self) -> float:
+        return self.peak / self.output_bytes
+
+    @property
+    def retained_ratio(self) -> float:
+        return self.retained / self.output_bytes
+
+
+def measure(render: Callable[[], object]) -> Measurement:
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        output = render()
+        retained, peak = tracemalloc.get_traced_memory()
+        output_bytes = len(str(output))
+
+        del output
+        gc.collect()
+        leaked, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return Measurement(output_bytes, peak, retained, leaked)
+
+
+def assert_within(measurement: Measurement, peak: float, retained: float = 1.1):
+    assert measurement.peak_ratio <= peak, measurement
+    assert measurement.retained_ratio <= retained, measurement
+    assert measurement.leaked <= LEAK_BUDGET, measurement
+
+
+PARAGRAPH = t.p("lorem ipsum " * 20)
+ROWS = [
+    ["name", "age", "city"],
+    *([f"name {i}", str(i), "somewhere"] for i in range(20_000)),
+]
+DICTS = [
+    {"name": f"name {i}", "age": str(i), "city": "somewhere"} for i in range(20_000)
+]
+
+
+def test_builder_lines_growth_should_hold_at_most_one_extra_copy():
+    def render():
+        builder = MarkdownBuilder()
+
+        for _ in range(4_000):
+            builder.lines(PARAGRAPH)
+
+        return builder
+
+    assert_within(measure(render), peak=2.5)
+
+
+def test_builder_spans_growth_should_hold_at_most_one_extra_copy():
+    def render():
+        builder = MarkdownBuilder()
+
+        for _ in range(40_000):
+            builder.spans("word ")
+
+        return builder
+
+    assert_within(measure(render), peak=2.5)
+
+
+class CountingSink:
+    def __init__(self) -> None:
+        self.count = 0
+
+    def write(self, text: str) -> None:
+        self.count += len(text)
+
+
+def test_builder_with_sink_should_not_grow_with_the_document():
+    sink = CountingSink()
+
+    def render():
+        builder = MarkdownBuilder(sink=sink)
+
+        for _ in range(4_000):
+            builder.lines(PARAGRAPH)
+
+        builder.finalize()
+
+    measurement = measure(render)
+
+    assert sink.count > 800_000
+    assert measurement.peak <= 256 * 1024, measurement
+    assert measurement.retained <= LEAK_BUDGET, measurement
+
+
+def test_table_should_stay_within_budget():
+    assert_within(measure(lambda: t.table(*ROWS)), peak=3.0)
+
+
+def test_table_from_dicts_should_stay_within_budget():
+    assert_within(measure(lambda: t.table_from_dicts(*DICTS)), peak=3.25)
+
+
+@pytest.mark.parametrize("token", [t.bold, t.italic, t.bold & t.code])
+def test_pipe_chain_should_stay_within_budget(token):
+    def render():
+        content = t.strike | "start"
+
+        for _ in range(1_000):
+            content = content | token | "word " * 10 | token
+
+        return content | t.strike
+
+    assert_within(measure(render), peak=4.5, retained=1.2)
+
+
+def test_table_builder_should_store_rows_compactly():
+    statuses = ("passed", "failed", "skipped")
+    events = [(f"test_{i}", statuses[i % 3]) for i in range(20_000)]
+
+    def as_lists():
+        return [list(event) for event in events]
+
+    def as_table():
+        return TableBuilder("name", "status").add_rows(events)
+
+    _, lists_peak, lists_retained, _ = measure(as_lists)
+    table = measure(as_table)
+
+    assert table.retained * 2 <= lists_retained, table
+    assert table.peak * 2 <= lists_peak, table
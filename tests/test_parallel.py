@@ -0,0 +1,75 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pymarkdown_builder import parallel
+from pymarkdown_builder.parallel import (
+    default_executor,
+    iter_parallel_table,
+    parallel_table,
+)
+from pymarkdown_builder.tokens import Tokens as t
+
+
+ROWS = [["name", "age"], *([f"name {i}", str(i)] for i in range(25))]
+
+
+@pytest.fixture(scope="module")
+def executor():
+    with ThreadPoolExecutor(2) as executor:
+        yield executor
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 25, 100])
+def test_parallel_table_should_match_table(executor, chunk_size):
+    result = parallel_table(ROWS, chunk_size=chunk_size, executor=executor)
+
+    assert result == t.table(*ROWS)
+
+
+def test_parallel_table_with_no_rows_should_return_empty_string(executor):
+    assert parallel_table([], executor=executor) == ""
+
+
+def test_parallel_table_with_only_header_should_return_empty_string(executor):
+    assert parallel_table([["name", "age"]], executor=executor) == ""
+
+
+def test_parallel_table_should_accept_generators(executor):
+    rows = (iter(row) for row in ROWS)
+
+    assert parallel_table(rows, chunk_size=3, executor=executor) == t.table(*ROWS)
+
+
+def test_iter_parallel_table_should_yield_chunks_in_order(executor):
+    chunks = list(iter_parallel_table(ROWS, chunk_size=10, executor=executor))
+
+    assert len(chunks) == 4
+    assert chunks[0] == "name | age\n--- | ---"
+    assert chunks[1].startswith("\nname 0 | 0\n")
+    assert chunks[3].endswith("\nname 24 | 24")
+
+
+def test_iter_parallel_table_with_invalid_chunk_size_should_raise_value_error():
+    with pytest.raises(ValueError):
+        list(iter_parallel_table(ROWS, chunk_size=0))
+
+
+def test_parallel_table_should_render_serially_by_default_with_the_gil(
+    monkeypatch, executor
+):
+    monkeypatch.setattr(parallel, "_is_free_threaded", lambda: False)
+
+    assert default_executor() is None
+    assert parallel_table(ROWS, chunk_size=7, workers=2) == t.table(*ROWS)
+    assert list(iter_parallel_table(ROWS, chunk_size=10)) == list(
+        iter_parallel_table(ROWS, chunk_size=10, executor=executor)
+    )
+
+
+def test_parallel_table_should_create_thread_pool_when_free_threaded(monkeypatch):
+    monkeypatch.setattr(parallel, "_is_free_threaded", lambda: True)
+
+    with default_executor(2) as executor:
+        assert isinstance(executor, ThreadPoolExecutor)
+
+    assert parallel_table(ROWS, chunk_size=7, workers=2) == t.table(*ROWS)
@@ -129,3 +129,54 @@ def test_create_partial_token_should_return_partial_token_content_with_correct_t
     python_inline = pt.create_partial_token("`#!python", "`")
     assert python_inline.open_tag == "`#!python"
     assert python_inline.close_tag == "`"
+
+
+def test_compose_partial_tokens_should_nest_tags():
+    bold = pt.PartialToken("**")
+    italic = pt.PartialToken("_")
+    code = pt.PartialToken("<code>", "</code>")
+
+    composed = pt.compose_partial_tokens(bold, italic, code)
+
+    assert composed.open_tag == "**_<code>"
+    assert composed.close_tag == "</code>_**"
+    assert composed("hello") == bold(italic(code("hello")))
+
+
+def test_compose_partial_tokens_should_intern_identical_compositions():
+    bold = pt.PartialToken("**")
+    italic = pt.PartialToken("_")
+
+    assert pt.compose_partial_tokens(bold, italic) is pt.compose_partial_tokens(
+        pt.PartialToken("**"), pt.PartialToken("_")
+    )
+
+
+def test_partial_token_and_op_should_compose_tokens():
+    bold = pt.PartialToken("**")
+    italic = pt.PartialToken("_")
+    strike = pt.PartialToken("~~")
+
+    assert (bold & italic)("hello") == "**_hello_**"
+    assert (bold & italic) & strike is bold & (italic & strike)
+
+
+def test_partial_token_and_op_with_string_should_raise_type_error():
+    bold = pt.PartialToken("**")
+
+    with pytest.raises(TypeError):
+        bold & "string"  # type: ignore
+
+
+def test_partial_token_repr_should_include_tags():
+    assert repr(pt.PartialToken("<b>", "</b>")) == "PartialToken('<b>', '</b>')"
+
+
+def test_partial_token_content_or_op_should_close_innermost_open_token():
+    strong = pt.PartialToken("<b>", "</b>")
+    em = pt.PartialToken("<i>", "</i>")
+
+    result = strong | "a" | em | "b" | em | strong
+
+    assert result == "<b>a<i>b</i></b>"
+    assert result.open_tokens == ()
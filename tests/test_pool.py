@@ -0,0 +1,80 @@
+import io
+import threading
+
+from pymarkdown_builder.builder import MarkdownBuilder
+from pymarkdown_builder.pool import BuilderPool
+from pymarkdown_builder.tokens import Tokens as t
+
+
+def test_pool_should_reuse_released_builders():
+    pool = BuilderPool()
+    builder = pool.acquire()
+    builder.lines(t.h1("Title"), builder.references.link("https://example.com"))
+    pool.release(builder)
+
+    reused = pool.acquire()
+
+    assert reused is builder
+    assert reused == MarkdownBuilder()
+    assert len(reused.references) == 0
+    assert len(reused.headings) == 0
+
+
+def test_pool_should_pass_document_and_sink_to_reused_builders():
+    pool = BuilderPool()
+    pool.release(pool.acquire())
+    sink = io.StringIO()
+
+    with pool.builder("# Title", sink=sink) as builder:
+        builder.lines("text")
+
+    assert sink.getvalue() == "# Title\n\ntext"
+
+
+def test_pool_should_keep_at_most_max_size_builders():
+    pool = BuilderPool(max_size=1)
+    first, second = pool.acquire(), pool.acquire()
+    pool.release(first)
+    pool.release(second)
+
+    assert pool.acquire() is first
+    assert pool.acquire() is not second
+
+
+def test_pool_should_keep_builders_per_thread():
+    pool = BuilderPool()
+
+    with pool.builder() as builder:
+        pass
+
+    reused = []
+    thread = threading.Thread(target=lambda: reused.append(pool.acquire()))
+    thread.start()
+    thread.join()
+
+    assert reused[0] is not builder
+    assert pool.acquire() is builder
+
+
+def test_pool_context_should_release_builder_on_exception():
+    pool = BuilderPool()
+
+    try:
+        with pool.builder() as builder:
+            builder.lines("partial")
+            raise RuntimeError()
+    except RuntimeError:
+        pass
+
+    assert pool.acquire() is builder
+    assert builder.document == ""
+
+
+def test_pool_should_ignore_builders_released_twice():
+    pool = BuilderPool()
+    builder = pool.acquire()
+    pool.release(builder)
+    pool.release(builder)
+
+    assert pool.acquire() is builder
+    assert pool.acquire() is not builder
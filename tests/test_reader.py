@@ -0,0 +1,125 @@
+import pytest
+from pymarkdown_builder.reader import MarkdownFile, SectionNotFoundError, iter_blocks
+
+
+DOCUMENT = """# Changelog
+
+## 1.1
+
+- New feature
+
+```python
+# not a heading
+
+print("hello")
+```
+
+### Fixes
+
+- A fix
+
+## 1.0
+
+- Initial release
+"""
+
+
+@pytest.fixture
+def changelog(tmp_path):
+    path = tmp_path / "CHANGELOG.md"
+    path.write_bytes(DOCUMENT.encode("utf-8"))
+
+    return MarkdownFile(path)
+
+
+def test_iter_blocks_should_keep_fenced_code_blocks_whole():
+    blocks = list(iter_blocks(DOCUMENT.encode("utf-8").splitlines(keepends=True)))
+
+    assert [block.text for block in blocks] == [
+        "# Changelog",
+        "## 1.1",
+        "- New feature",
+        '```python\n# not a heading\n\nprint("hello")\n```',
+        "### Fixes",
+        "- A fix",
+        "## 1.0",
+        "- Initial release",
+    ]
+
+
+def test_iter_blocks_should_parse_headings():
+    (block,) = iter_blocks([b"##  Title ##\n"])
+
+    assert block.level == 2
+    assert block.title == "Title"
+
+
+def test_iter_blocks_should_split_heading_followed_by_text():
+    blocks = list(iter_blocks([b"# Title\n", b"text\n"]))
+
+    assert [block.text for block in blocks] == ["# Title", "text"]
+
+
+def test_iter_blocks_offsets_should_match_source_bytes():
+    data = "# Título\n\nçontent\n".encode("utf-8")
+
+    for block in iter_blocks(data.splitlines(keepends=True)):
+        assert data[block.start : block.end].decode("utf-8") == block.text
+
+
+def test_find_section_should_include_subsections(changelog):
+    section = changelog.find_section("1.1")
+    data = DOCUMENT.encode("utf-8")
+
+    assert data[section.start : section.end].decode("utf-8").endswith("- A fix")
+    assert section.level == 2
+
+
+def test_find_section_with_unknown_title_should_raise_section_not_found_error(
+    changelog,
+):
+    with pytest.raises(SectionNotFoundError):
+        changelog.find_section("2.0")
+
+    with pytest.raises(SectionNotFoundError):
+        changelog.find_section("1.1", level=3)
+
+
+def test_replace_section_should_only_change_section(changelog):
+    changelog.replace_section("1.1", "## 1.1\n\n- Replaced")
+
+    assert changelog.path.read_text() == (
+        "# Changelog\n\n## 1.1\n\n- Replaced\n\n## 1.0\n\n- Initial release\n"
+    )
+
+
+def test_replace_section_with_same_length_should_rewrite_in_place(changelog):
+    changelog.replace_section("1.0", "## 1.0\n\n- Initial RELEASE")
+
+    assert changelog.path.read_text().endswith("## 1.0\n\n- Initial RELEASE\n")
+
+
+def test_insert_before_should_add_lines_before_section(changelog):
+    changelog.insert_before("1.1", "## 1.2\n\n- Newest")
+
+    assert changelog.path.read_text().startswith(
+        "# Changelog\n\n## 1.2\n\n- Newest\n\n## 1.1\n\n"
+    )
+
+
+def test_insert_after_should_add_lines_at_end_of_section(changelog):
+    changelog.insert_after("1.0", "- Another")
+
+    assert changelog.path.read_text().endswith("- Initial release\n\n- Another\n")
+
+
+def test_to_builder_should_index_headings(changelog):
+    builder = changelog.to_builder()
+
+    assert builder.document.startswith("# Changelog\n\n## 1.1\n\n- New feature")
+    assert [entry.anchor for entry in builder.headings.entries] == [
+        "changelog",
+        "11",
+        "fixes",
+        "10",
+    ]
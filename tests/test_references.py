@@ -0,0 +1,45 @@
+from pymarkdown_builder.references import LinkReferences
+
+
+def test_link_should_reuse_label_for_same_href():
+    refs = LinkReferences()
+
+    assert refs.link("https://a.com", "a") == "[a][1]"
+    assert refs.link("https://b.com", "b") == "[b][2]"
+    assert refs.link("https://a.com", "again") == "[again][1]"
+    assert len(refs) == 2
+
+
+def test_link_without_text_should_use_href_as_text():
+    refs = LinkReferences()
+
+    assert refs.link("https://a.com") == "[https://a.com][1]"
+
+
+def test_image_with_different_mouseover_should_get_different_label():
+    refs = LinkReferences()
+
+    assert refs.image("a.png") == "![][1]"
+    assert refs.image("a.png", "alt", "title") == "![alt][2]"
+    assert refs.image("a.png", "other alt") == "![other alt][1]"
+
+
+def test_definitions_should_include_title():
+    refs = LinkReferences()
+    refs.image("a.png", mouseover="title")
+
+    assert refs.definitions() == '[1]: a.png "title"'
+
+
+def test_definitions_should_be_emitted_once():
+    refs = LinkReferences()
+    refs.link("https://a.com")
+    assert refs.has_pending
+
+    assert refs.definitions() == "[1]: https://a.com"
+    assert not refs.has_pending
+    assert refs.definitions() == ""
+
+    refs.link("https://a.com")
+    refs.link("https://b.com")
+    assert refs.definitions() == "[2]: https://b.com"
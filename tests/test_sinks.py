@@ -0,0 +1,79 @@
+import os
+
+import pytest
+from pymarkdown_builder.builder import MarkdownBuilder
+from pymarkdown_builder.sinks import ChangeAwareFileSink, ChangeAwareWriter
+
+
+def test_change_aware_file_sink_should_create_missing_file(tmp_path):
+    path = tmp_path / "page.md"
+
+    with ChangeAwareFileSink(path) as sink:
+        sink.write("# Page")
+
+    assert sink.changed
+    assert path.read_text() == "# Page"
+
+
+def test_change_aware_file_sink_should_not_touch_unchanged_file(tmp_path):
+    path = tmp_path / "page.md"
+    path.write_text("# Page\n\ncontent")
+    os.utime(path, (0, 0))
+
+    with ChangeAwareFileSink(path) as sink:
+        MarkdownBuilder(sink=sink).lines("# Page", "content")
+
+    assert sink.changed is False
+    assert os.stat(path).st_mtime == 0
+    assert os.listdir(tmp_path) == ["page.md"]
+
+
+@pytest.mark.parametrize(
+    "content",
+    ["# Page\n\nother", "# Page\n\ncontent and more", "# Page", ""],
+)
+def test_change_aware_file_sink_should_replace_changed_file(tmp_path, content):
+    path = tmp_path / "page.md"
+    path.write_text("# Page\n\ncontent")
+
+    with ChangeAwareFileSink(path) as sink:
+        sink.write(content)
+
+    assert sink.changed
+    assert path.read_text() == content
+    assert os.listdir(tmp_path) == ["page.md"]
+
+
+def test_change_aware_file_sink_should_keep_file_mode(tmp_path):
+    path = tmp_path / "page.md"
+    path.write_text("old")
+    os.chmod(path, 0o640)
+
+    with ChangeAwareFileSink(path) as sink:
+        sink.write("new")
+
+    assert os.stat(path).st_mode & 0o777 == 0o640
+
+
+def test_change_aware_file_sink_should_discard_content_on_error(tmp_path):
+    path = tmp_path / "page.md"
+    path.write_text("old")
+
+    with pytest.raises(RuntimeError):
+        with ChangeAwareFileSink(path) as sink:
+            sink.write("new")
+            raise RuntimeError()
+
+    assert path.read_text() == "old"
+    assert os.listdir(tmp_path) == ["page.md"]
+
+
+def test_change_aware_writer_should_count_written_and_skipped_files(tmp_path):
+    writer = ChangeAwareWriter()
+
+    assert writer.write(tmp_path / "a.md", "a")
+    assert writer.write(tmp_path / "b.md", "b")
+    assert not writer.write(tmp_path / "a.md", "a")
+    assert writer.write(tmp_path / "b.md", "B")
+
+    assert (writer.written, writer.skipped) == (3, 1)
@@ -0,0 +1,93 @@
+import pytest
+from pymarkdown_builder.table_builder import TableBuilder
+from pymarkdown_builder.tokens import Tokens as t
+
+
+HEADER = ["name", "status", "duration"]
+ROWS = [
+    [f"test_{i}", ("passed", "failed", "skipped")[i % 3], str(i)] for i in range(3000)
+]
+
+
+def test_table_builder_should_render_same_as_table():
+    table = TableBuilder(*HEADER).add_rows(ROWS)
+
+    assert table.render() == t.table(HEADER, *ROWS)
+    assert str(table) == table.render()
+
+
+@pytest.mark.parametrize("max_dictionary_size", [1, 2, 300, 1024])
+def test_table_builder_should_keep_rows_with_any_dictionary_size(max_dictionary_size):
+    table = TableBuilder(*HEADER, max_dictionary_size=max_dictionary_size)
+    table.add_rows(ROWS)
+
+    assert len(table) == len(ROWS)
+    assert list(table.rows()) == [tuple(row) for row in ROWS]
+
+
+def test_table_builder_should_widen_codes_past_256_values():
+    rows = [[str(i % 500)] for i in range(1000)]
+    table = TableBuilder("value").add_rows(rows)
+
+    assert table._columns[0].codes.typecode == "H"
+    assert table.render() == t.table(["value"], *rows)
+
+
+def test_table_builder_should_widen_codes_past_65536_values():
+    rows = [[str(i)] for i in range(70_000)]
+    table = TableBuilder("value", max_dictionary_size=100_000).add_rows(rows)
+
+    assert table._columns[0].codes.typecode == "I"
+    assert table.render() == t.table(["value"], *rows)
+
+
+def test_table_builder_should_fall_back_to_plain_cells():
+    table = TableBuilder("id", max_dictionary_size=4).add_rows(
+        [str(i)] for i in range(10)
+    )
+
+    assert table._columns[0].cells is not None
+    assert [row[0] for row in table.rows()] == [str(i) for i in range(10)]
+
+
+def test_table_builder_should_track_widths():
+    table = TableBuilder("a", "long header")
+
+    assert table.widths == [1, 11]
+
+    table.add_row("a long cell", "b")
+
+    assert table.widths == [11, 11]
+
+
+def test_table_builder_should_render_aligned():
+    table = TableBuilder("a", "b").add_row("long", "x").add_row("", "yyyy")
+
+    assert table.render(aligned=True) == (
+        "a    | b\n---- | ----\nlong | x\n     | yyyy"
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000, 5000])
+def test_table_builder_chunks_should_join_to_render(chunk_size):
+    table = TableBuilder(*HEADER).add_rows(ROWS)
+
+    for aligned in (False, True):
+        chunks = list(table.iter_render(aligned, chunk_size))
+
+        assert "".join(chunks) == table.render(aligned)
+        assert all(chunk.startswith("\n") for chunk in chunks[1:])
+
+
+def test_table_builder_without_rows_should_render_empty_string():
+    assert TableBuilder("a", "b").render() == ""
+    assert TableBuilder().add_row().render() == ""
+
+
+def test_table_builder_should_reject_rows_of_wrong_length():
+    table = TableBuilder("a", "b")
+
+    with pytest.raises(ValueError):
+        table.add_row("only one")
+
+    assert len(table) == 0
@@ -0,0 +1,42 @@
+from pymarkdown_builder.toc import HeadingIndex, slugify
+
+
+def test_slugify_should_lowercase_and_replace_spaces():
+    assert slugify("Hello World") == "hello-world"
+
+
+def test_slugify_should_remove_punctuation_but_keep_hyphens_and_underscores():
+    assert slugify("foo_bar - baz!?") == "foo_bar---baz"
+
+
+def test_add_should_resolve_anchor_collisions():
+    index = HeadingIndex()
+
+    assert index.add("Example", 2) == "example"
+    assert index.add("Example", 2) == "example-1"
+    assert index.add("Example 1", 2) == "example-1-1"
+    assert index.add("Example", 2) == "example-2"
+    assert len(index) == 4
+
+
+def test_render_with_no_headings_should_return_empty_string():
+    assert HeadingIndex().render() == ""
+
+
+def test_render_should_nest_relative_to_highest_level():
+    index = HeadingIndex()
+    index.add("Usage", 2)
+    index.add("Example", 3)
+    index.add("API", 2)
+
+    assert index.render() == (
+        "- [Usage](#usage)\n  - [Example](#example)\n- [API](#api)"
+    )
+
+
+def test_render_should_leave_out_headings_deeper_than_max_level():
+    index = HeadingIndex()
+    index.add("Usage", 1)
+    index.add("Example", 2)
+
+    assert index.render(max_level=1) == "- [Usage](#usage)"
@@ -1,4 +1,8 @@
+import copy
+import pickle
+
 import pytest
+from pymarkdown_builder.tokens import HeadingContent
 from pymarkdown_builder.tokens import Tokens as t
 
 
@@ -329,3 +333,64 @@ def test_table_from_dicts_with_header_should_override_first_dict_keys():
     header, _, *_ = result.split("\n")
 
     assert header == "NAME | AGE"
+
+
+def test_heading_should_remember_text_and_level():
+    result = t.h3("hello")
+
+    assert isinstance(result, HeadingContent)
+    assert result.text == "hello"
+    assert result.level == 3
+
+
+@pytest.mark.parametrize(
+    "copy_heading",
+    [copy.copy, copy.deepcopy, lambda h: pickle.loads(pickle.dumps(h))],
+)
+def test_heading_should_be_copied_and_pickled(copy_heading):
+    result = copy_heading(t.h2("hello"))
+
+    assert isinstance(result, HeadingContent)
+    assert (result, result.text, result.level) == ("## hello", "hello", 2)
+
+
+def test_paragraph_with_width_should_wrap():
+    assert t.paragraph("hello big world", width=9) == "hello big\nworld"
+
+
+def test_quote_with_width_should_prefix_every_line():
+    assert t.quote("hello big world", width=11) == "> hello big\n> world"
+
+
+def test_lists_with_width_should_indent_continuation_lines():
+    assert t.ul("hello world", "a", width=8) == "- hello\n  world\n- a"
+    assert t.ol("hello world", width=9) == "1. hello\n   world"
+
+
+def test_from_tokens_should_consume_iterables():
+    items = ["Hello", "World"]
+
+    assert t.ul_from(iter(items)) == t.ul(*items)
+    assert t.ol_from(iter(items), width=8) == t.ol(*items, width=8)
+    assert t.table_from(iter([["a", "b"], ["1", "2"]])) == t.table(
+        ["a", "b"], ["1", "2"]
+    )
+    assert t.table_from_dict_rows(iter([{"a": "1"}])) == t.table_from_dicts({"a": "1"})
+
+
+def test_iter_tokens_should_join_to_from_tokens():
+    items = [f"item {i}" for i in range(10)]
+    rows = [["n"], *([str(i)] for i in range(3000))]
+    dicts = [{"n": str(i)} for i in range(3000)]
+
+    assert "".join(t.iter_unordered_list(items)) == t.ul_from(items)
+    assert "".join(t.iter_ordered_list(items, width=5)) == t.ol_from(items, width=5)
+    assert "".join(t.iter_table(rows)) == t.table(*rows)
+    assert "".join(t.iter_table_from_dicts(dicts)) == t.table_from_dicts(*dicts)
+
+
+def test_iter_tokens_with_no_items_should_yield_nothing():
+    assert list(t.iter_unordered_list([])) == []
+    assert list(t.iter_table([])) == []
+    assert list(t.iter_table([["a"]])) == []
+    assert list(t.iter_table_from_dicts([])) == []
@@ -0,0 +1,70 @@
+import pytest
+from pymarkdown_builder.html_tokens import HtmlTokens
+from pymarkdown_builder.references import LinkReferences
+from pymarkdown_builder.tokens import Tokens as t
+from pymarkdown_builder.urls import encode_title, encode_url, encode_urls
+
+
+@pytest.mark.parametrize(
+    "url, encoded",
+    [
+        ("https://example.com/a?b=1&c=d#e", "https://example.com/a?b=1&c=d#e"),
+        ("a b", "a%20b"),
+        ("f(x).md", "f%28x%29.md"),
+        ('<"a">', "%3C%22a%22%3E"),
+        ("a\tb\nc", "a%09b%0Ac"),
+        ("[x]", "%5Bx%5D"),
+        ("café", "caf%C3%A9"),
+        ("🙂", "%F0%9F%99%82"),
+        ("already%20encoded", "already%20encoded"),
+        ("reports/100% done.md", "reports/100%25%20done.md"),
+        ("a%zz b", "a%25zz%20b"),
+        ("%%41%2", "%25%41%252"),
+        ("100%", "100%25"),
+    ],
+)
+def test_encode_url(url, encoded):
+    assert encode_url(url) == encoded
+
+
+@pytest.mark.parametrize(
+    "url", ["https://example.com/a file (1)/ção", "100% done", "a%zz%4 ç%C3%A7"]
+)
+def test_encode_url_should_be_idempotent(url):
+    assert encode_url(encode_url(url)) == encode_url(url)
+
+
+def test_encode_url_should_cache_urls():
+    encode_url.cache_clear()
+    encode_urls(["a b", "a b", "c d"])
+
+    assert encode_url.cache_info().hits == 1
+
+
+def test_encode_title():
+    assert encode_title('say "hi"\\\nbye') == 'say \\"hi\\"\\\\ bye'
+    assert encode_title(None) is None
+
+
+def test_link_with_encode_should_encode_href():
+    assert t.link("a (b).md", encode=True) == "[a (b).md](a%20%28b%29.md)"
+    assert t.link("a b.md", "text") == "[text](a b.md)"
+
+
+def test_image_with_encode_should_encode_src_and_title():
+    assert t.image("a b.png", "alt", 'a "b"', encode=True) == (
+        '![alt](a%20b.png "a \\"b\\"")'
+    )
+
+
+def test_references_with_encode_should_encode_definitions():
+    refs = LinkReferences()
+
+    assert refs.link("a b.md", encode=True) == "[a b.md][1]"
+    assert refs.image("c d.png", mouseover='"t"', encode=True) == "![][2]"
+    assert refs.definitions() == '[1]: a%20b.md\n[2]: c%20d.png "\\"t\\""'
+
+
+def test_html_tokens_with_encode_should_encode_urls():
+    assert HtmlTokens.link("a b.md", "x", encode=True) == '<a href="a%20b.md">x</a>'
+    assert HtmlTokens.image("a b.png", encode=True) == '<img src="a%20b.png" alt="">'
@@ -0,0 +1,79 @@
+import pytest
+from pymarkdown_builder.wrap import iter_wrap, wrap
+
+
+def test_wrap_should_break_at_width():
+    assert wrap("aaa bbb ccc ddd", 7) == "aaa bbb\nccc ddd"
+
+
+def test_wrap_should_treat_line_breaks_as_spaces():
+    assert wrap("aaa\nbbb\r\nccc", 80) == "aaa bbb ccc"
+
+
+def test_wrap_should_keep_blank_lines_between_paragraphs():
+    assert wrap("\naaa bbb\n\n\nccc\n \nddd\n\n", 80) == "aaa bbb\n\nccc\n\nddd"
+    assert wrap("aaa\n\nbbb", 80, "> ", "> ") == "> aaa\n>\n> bbb"
+    assert wrap("aaa\n\nbbb", 80, "- ", "  ") == "- aaa\n\n  bbb"
+
+
+@pytest.mark.parametrize(
+    "marker",
+    ["-", "+", "*", "#", "###", ">", ">quote", "1.", "2)", "---", "==", "***", "```"],
+)
+def test_wrap_should_not_start_lines_with_block_markers(marker):
+    result = wrap(f"aaa {marker} bbb", 3)
+
+    assert result == f"aaa {marker}\nbbb"
+
+
+def test_wrap_should_not_join_atoms_across_paragraphs():
+    assert wrap("[a\n\nb](c)", 80) == "[a\n\nb](c)"
+
+
+def test_wrap_should_place_long_words_in_their_own_line():
+    assert wrap("a bbbbbbbbbb c", 4) == "a\nbbbbbbbbbb\nc"
+
+
+def test_wrap_with_empty_text_should_return_empty_string():
+    assert wrap("", 10) == ""
+    assert list(iter_wrap("   ", 10)) == []
+
+
+@pytest.mark.parametrize(
+    "atom",
+    [
+        "[a link](https://example.com/a b)",
+        "![an image](image.png)",
+        "[a reference][1]",
+        "`inline code`",
+        "`` code with ` backtick ``",
+        "prefix[a link](x)suffix",
+    ],
+)
+def test_wrap_should_not_break_inside_atoms(atom):
+    lines = list(iter_wrap(f"before {atom} after", 3))
+
+    assert atom in lines
+
+
+def test_wrap_should_join_line_breaks_inside_atoms():
+    assert wrap("`a\nb` c", 80) == "`a b` c"
+
+
+def test_wrap_should_prepend_indents():
+    result = wrap("aaa bbb ccc", 6, "- ", "  ")
+
+    assert result == "- aaa\n  bbb\n  ccc"
+    assert all(len(line) <= 6 for line in result.split("\n"))
+
+
+def test_wrap_should_treat_unclosed_backticks_as_text():
+    assert wrap("a ` b c", 3) == "a `\nb c"
+    assert wrap("``a` b", 3) == "``a`\nb"
+
+
+@pytest.mark.parametrize("unclosed", ["a [b ", "[a](", "`` ` ", "![x]"])
+def test_wrap_should_handle_many_unclosed_openers(unclosed):
+    text = unclosed * 20_000
+
+    assert wrap(text, 80).replace("\n", " ").split() == text.split()